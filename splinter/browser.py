@@ -33,6 +33,8 @@ _DRIVERS: Dict[str, Union[None, Type[DriverAPI]]] = {
     "django": None,
     "flask": None,
     "zope.testbrowser": None,
+    "asgi": None,
+    "wsgi": None,
 }
 
 try:
@@ -77,6 +79,20 @@ try:
 except ImportError as e:
     logger.debug(f"Import Warning: {e}")
 
+try:
+    from splinter.driver.asgiclient import AsgiClient
+
+    _DRIVERS["asgi"] = AsgiClient
+except ImportError as e:
+    logger.debug(f"Import Warning: {e}")
+
+try:
+    from splinter.driver.wsgiclient import WsgiClient
+
+    _DRIVERS["wsgi"] = WsgiClient
+except ImportError as e:
+    logger.debug(f"Import Warning: {e}")
+
 
 def get_driver(driver, retry_count: int = 3, config=None, *args, **kwargs):
     """Try to instantiate the driver.
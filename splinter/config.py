@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import List
 from typing import Optional
 
+from splinter.retry import WaitPolicy
+
 
 @dataclass
 class Config:
@@ -43,6 +45,13 @@ class Config:
         incognito: Launch the browser in incognito mode.
 
         user_agent: Set a custom user_agent.
+
+        wait_policy: How the browser waits between two attempts when it
+            waits for something on the page. See splinter.retry.WaitPolicy.
+
+        observe_mutations: Wait for elements with a MutationObserver in the
+            browser, instead of searching for them again and again.
+            Only used by the Selenium drivers.
     """
 
     extensions: Optional[List[str]] = None
@@ -50,3 +59,5 @@ class Config:
     headless: Optional[bool] = False
     incognito: Optional[bool] = False
     user_agent: Optional[str] = None
+    wait_policy: Optional[WaitPolicy] = None
+    observe_mutations: Optional[bool] = False
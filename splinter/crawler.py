@@ -0,0 +1,259 @@
+import multiprocessing.util
+import threading
+import time
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+from urllib.parse import urldefrag
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+from splinter.request_handler.status_code import StatusCode
+
+
+_SCHEMES = ("http", "https")
+
+# Each worker thread, or worker process, has a browser of its own.
+_worker = threading.local()
+
+
+class PageResult(NamedTuple):
+    """What the crawler found on one page.
+
+    Attributes:
+        url (str): The url that was requested.
+        final_url (str): The url of the page, after redirects.
+        status_code (StatusCode): Status of the response, or None if the
+            request failed or the driver doesn't report it.
+        elapsed (float): Seconds spent loading the page.
+        depth (int): Number of links followed from a start url.
+        referrer (str): The first page that linked here, or None for start urls.
+        links (tuple): Absolute urls of the links on the page.
+        error (str): The exception raised while loading the page, if any.
+    """
+
+    url: str
+    final_url: str
+    status_code: Optional[StatusCode]
+    elapsed: float
+    depth: int
+    referrer: Optional[str]
+    links: Tuple[str, ...]
+    error: Optional[str] = None
+
+    @property
+    def is_broken(self) -> bool:
+        if self.error is not None:
+            return True
+        return self.status_code is not None and not self.status_code.is_success()
+
+
+class CrawlReport:
+    """Pages visited by a Crawler, in the order they were loaded.
+
+    Attributes:
+        pages (dict): PageResult for each url requested.
+        elapsed (float): Seconds the whole crawl took.
+    """
+
+    def __init__(self) -> None:
+        self.pages: Dict[str, PageResult] = {}
+        self.elapsed = 0.0
+
+    def broken_links(self) -> List[PageResult]:
+        """Get the pages that failed to load or answered with an error status."""
+        return [page for page in self.pages.values() if page.is_broken]
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self):
+        return iter(self.pages.values())
+
+
+def absolute_links(base_url: str, hrefs: Iterable[str]) -> Tuple[str, ...]:
+    """Resolve the hrefs of a page against its url, once each.
+
+    Fragments are dropped, and links that aren't http or https, like
+    ``mailto:`` or ``javascript:`` ones, are skipped.
+
+    Returns:
+        tuple: The absolute urls, without duplicates, in document order.
+    """
+    links: Dict[str, None] = {}
+    for href in hrefs:
+        url = urldefrag(urljoin(base_url, href.strip())).url
+        if urlsplit(url).scheme in _SCHEMES:
+            links[url] = None
+    return tuple(links)
+
+
+def _page_hrefs(browser) -> List[str]:
+    tree = getattr(browser, "htmltree", None)
+    if tree is not None:
+        return tree.xpath("//a/@href")
+    return [link["href"] for link in browser.find_by_tag("a") if link["href"]]
+
+
+def _init_worker(driver_factory: Callable, browsers: Optional[list]) -> None:
+    _worker.browser = driver_factory()
+    if browsers is not None:
+        browsers.append(_worker.browser)
+    else:
+        # Worker processes don't run atexit handlers, only multiprocessing's
+        # finalizers, when the pool shuts down.
+        multiprocessing.util.Finalize(None, _worker.browser.quit, exitpriority=0)
+
+
+def _status_code(browser) -> Optional[StatusCode]:
+    try:
+        return browser.status_code
+    except (AttributeError, NotImplementedError):
+        # Selenium drivers don't see the status of the responses.
+        return None
+
+
+def _fetch(url: str) -> Tuple[str, Optional[StatusCode], float, Tuple[str, ...], Optional[str]]:
+    browser = _worker.browser
+    start = time.perf_counter()
+    try:
+        browser.visit(url)
+        final_url = browser.url
+        status_code = _status_code(browser)
+        links = absolute_links(final_url, _page_hrefs(browser))
+    except Exception as e:  # NOQA: BLE001
+        # Whatever went wrong, the link is broken.
+        return url, None, time.perf_counter() - start, (), f"{e.__class__.__name__}: {e}"
+    elapsed = time.perf_counter() - start
+    return final_url, status_code, elapsed, links, None
+
+
+class _Frontier:
+    """Urls waiting to be fetched, each scheduled at most once."""
+
+    def __init__(self, crawler: "Crawler", executor: Executor, domains: Set[str]) -> None:
+        self.crawler = crawler
+        self.executor = executor
+        self.domains = domains
+        self.seen: Set[str] = set()
+        self.scheduled = 0
+        self.pending: Dict = {}
+
+    def add(self, url: str, depth: int, referrer: Optional[str]) -> None:
+        crawler = self.crawler
+        if url in self.seen or urlsplit(url).hostname not in self.domains:
+            return
+        if crawler.max_depth is not None and depth > crawler.max_depth:
+            return
+        if crawler.max_pages is not None and self.scheduled >= crawler.max_pages:
+            return
+        self.seen.add(url)
+        self.scheduled += 1
+        self.pending[self.executor.submit(_fetch, url)] = (url, depth, referrer)
+
+
+class Crawler:
+    """Visit every page of a site, following links concurrently.
+
+    Each worker of the pool gets a browser of its own from driver_factory.
+    Every url is requested once, however many pages link to it. Links to
+    other domains are recorded on the page that has them, but not followed.
+
+    Example:
+
+        >>> crawler = Crawler(lambda: Browser('flask', app=app), max_workers=8)
+        >>> report = crawler.crawl('http://localhost/')
+        >>> [page.url for page in report.broken_links()]
+        ['http://localhost/missing']
+
+    Arguments:
+        driver_factory: Function returning a new browser. With a process
+            pool, it must be picklable.
+        max_depth (int): Number of links to follow from the start urls, or
+            None for no limit.
+        allowed_domains (list): Hosts whose pages are visited. Defaults to
+            the hosts of the start urls.
+        max_pages (int): Maximum number of pages to visit, or None for no limit.
+        max_workers (int): Number of workers in the pool.
+        executor_class: ThreadPoolExecutor or ProcessPoolExecutor.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable,
+        max_depth: Optional[int] = None,
+        allowed_domains: Optional[Iterable[str]] = None,
+        max_pages: Optional[int] = None,
+        max_workers: int = 4,
+        executor_class: Type[Executor] = ThreadPoolExecutor,
+    ) -> None:
+        self.driver_factory = driver_factory
+        self.max_depth = max_depth
+        self.allowed_domains = set(allowed_domains) if allowed_domains is not None else None
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.executor_class = executor_class
+
+    def crawl(self, *start_urls: str) -> CrawlReport:
+        """Visit the start urls and every page they lead to.
+
+        Arguments:
+            start_urls (str): Absolute urls to start from.
+
+        Returns:
+            CrawlReport
+        """
+        start = time.perf_counter()
+        report = CrawlReport()
+        start_urls = tuple(urldefrag(url).url for url in start_urls)
+        domains = self.allowed_domains
+        if domains is None:
+            domains = {urlsplit(url).hostname for url in start_urls}
+
+        # Threads share the list, so their browsers can be quit at the end.
+        browsers: Optional[list] = [] if issubclass(self.executor_class, ThreadPoolExecutor) else None
+
+        with self.executor_class(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.driver_factory, browsers),
+        ) as executor:
+            frontier = _Frontier(self, executor, domains)
+            for url in start_urls:
+                frontier.add(url, 0, None)
+
+            while frontier.pending:
+                done, _ = wait(frontier.pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth, referrer = frontier.pending.pop(future)
+                    final_url, status_code, elapsed, links, error = future.result()
+                    report.pages[url] = PageResult(
+                        url,
+                        final_url,
+                        status_code,
+                        elapsed,
+                        depth,
+                        referrer,
+                        links,
+                        error,
+                    )
+                    # Pages reached through a redirect aren't requested again.
+                    frontier.seen.add(final_url)
+                    for link in links:
+                        frontier.add(link, depth + 1, url)
+
+        for browser in browsers or ():
+            browser.quit()
+
+        report.elapsed = time.perf_counter() - start
+        return report
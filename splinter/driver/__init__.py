@@ -6,6 +6,8 @@ This module contains the basic API for splinter drivers and elements.
 """
 
 from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Type
 
@@ -278,12 +280,22 @@ class DriverAPI:
         """
         raise NotImplementedError(f"{self.driver_name} doesn't support find()")
 
-    def is_text_present(self, text: str, wait_time: Optional[int] = None) -> bool:
+    def is_text_present(
+        self,
+        text: str,
+        wait_time: Optional[int] = None,
+        wait_policy=None,
+        text_content: bool = False,
+    ) -> bool:
         """Check if a piece of text is on the page.
 
         Arguments:
             text (str): text to use in the search query.
             wait_time (int): Number of seconds to search for the text.
+            wait_policy (WaitPolicy): How to wait between two searches.
+            text_content (bool): Search the text content of the page, hidden
+                text included, instead of its rendered text. Drivers without
+                javascript always search the text content.
 
         Returns:
             bool: True if finds a match for the ``text`` and False if not.
@@ -422,12 +434,14 @@ class DriverAPI:
         self,
         css_selector: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             css_selector (str): css selector for the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -440,12 +454,14 @@ class DriverAPI:
         self,
         css_selector: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             css_selector (str): css selector for the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -458,12 +474,14 @@ class DriverAPI:
         self,
         xpath: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             xpath (str): xpath of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -476,12 +494,14 @@ class DriverAPI:
         self,
         xpath: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             xpath (str): xpath of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -494,12 +514,14 @@ class DriverAPI:
         self,
         tag: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             tag (str): tag of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -512,12 +534,14 @@ class DriverAPI:
         self,
         tag: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             tag (str): tag of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -530,12 +554,14 @@ class DriverAPI:
         self,
         name: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             name (str): name of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -548,12 +574,14 @@ class DriverAPI:
         self,
         name: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             name (str): name of the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -566,12 +594,14 @@ class DriverAPI:
         self,
         value: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             value (str): value in the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -584,12 +614,14 @@ class DriverAPI:
         self,
         value: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             value (str): value in the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -602,12 +634,14 @@ class DriverAPI:
         self,
         text: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             text (str): text in the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -620,12 +654,14 @@ class DriverAPI:
         self,
         text: str,
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             text (str): text in the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -638,12 +674,14 @@ class DriverAPI:
         self,
         id: str,  # NOQA: A002
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is present in the current page.
 
         Arguments:
             id (str): id for the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is present and False if is not present.
@@ -656,12 +694,14 @@ class DriverAPI:
         self,
         id: str,  # NOQA: A002
         wait_time: Optional[int] = None,
+        wait_policy=None,
     ) -> bool:
         """Verify if an element is not present in the current page.
 
         Arguments:
             id (str): id for the element.
             wait_time (int): Number of seconds to search.
+            wait_policy (WaitPolicy): How to wait between two searches.
 
         Returns:
             bool: True if the element is not present and False if is present.
@@ -808,6 +848,29 @@ class ElementAPI:
         """
         raise NotImplementedError
 
+    @property
+    def rect(self) -> Dict[str, float]:
+        """Get the position and size of the element, relative to the document.
+
+        Returns:
+            dict: With x, y, width and height keys.
+        """
+        raise NotImplementedError
+
+    def _read_all(self, elements: List["ElementAPI"], prop: str, name: Optional[str] = None) -> list:
+        """Read the same property of many elements, for ElementList.
+
+        Drivers that can read every element at once override this.
+
+        Arguments:
+            elements: Elements of the same page, this one included.
+            prop: "text", "value", "visible", "rect", or "attr" to read the
+                attribute called name.
+        """
+        if prop == "attr":
+            return [element[name] for element in elements]
+        return [getattr(element, prop) for element in elements]
+
     def is_visible(self, wait_time: Optional[int] = None) -> bool:
         """Check if an element is visible within the given wait time.
 
@@ -0,0 +1,155 @@
+import http.cookiejar
+from typing import Optional
+from urllib.parse import urlencode
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+
+from splinter.config import Config
+from splinter.driver.cookie_jar import cookie_header
+from splinter.driver.cookie_jar import CookieJarManager
+from splinter.driver.cookie_jar import copy_cookie_jar
+from splinter.driver.cookie_jar import extract_cookies
+from splinter.driver.html_source import content_type_charset
+from splinter.driver.lxmldriver import LxmlDriver
+from splinter.driver.request_body import RequestBody
+from splinter.driver.response_archive import ResponseArchive
+
+
+MAX_REDIRECTS = 20
+
+# Redirects that turn the request into a GET, the way browsers do.
+_REDIRECT_TO_GET = (301, 302, 303)
+_REDIRECT = (*_REDIRECT_TO_GET, 307, 308)
+
+
+class AppClient(LxmlDriver):
+    """Base class of the drivers that call an application in process.
+
+    Cookies, redirects and the history are handled here, the way a browser
+    does. A driver only calls the application: it implements _call_app(),
+    or runs the generator returned by _requests() itself.
+
+    Arguments:
+        app: The application.
+        custom_headers (dict): Headers sent with every request.
+    """
+
+    #: Class of the responses returned by the application.
+    response_class = None
+
+    def __init__(
+        self,
+        app,
+        user_agent=None,
+        wait_time=2,
+        custom_headers=None,
+        config: Optional[Config] = None,
+        incremental_parsing: bool = False,
+        page_cache_size: int = 10,
+        http_cache: bool = False,
+        response_archive: Optional[ResponseArchive] = None,
+    ):
+        self.app = app
+        self.cookie_jar = http.cookiejar.CookieJar()
+        self._cookie_manager = CookieJarManager(self)
+        self._custom_headers = custom_headers if custom_headers else {}
+        super().__init__(
+            user_agent=user_agent,
+            wait_time=wait_time,
+            config=config,
+            incremental_parsing=incremental_parsing,
+            page_cache_size=page_cache_size,
+            http_cache=http_cache,
+            response_archive=response_archive,
+        )
+
+    def clone(self):
+        clone = super().clone()
+        clone.cookie_jar = copy_cookie_jar(self.cookie_jar)
+        clone._cookie_manager = CookieJarManager(clone)
+        clone._custom_headers = dict(self._custom_headers)
+        return clone
+
+    def _request_headers(self, url):
+        headers = list(self._custom_headers.items())
+        if self.config.user_agent:
+            headers.append(("user-agent", self.config.user_agent))
+        cookies = cookie_header(self.cookie_jar, url)
+        if cookies:
+            headers.append(("cookie", cookies))
+        return headers
+
+    def _requests(self, method, url, data=None):
+        """Follow a request through its redirects, then load the last response.
+
+        Yields the method, url, headers and body of every request to make,
+        and must be sent the application's response to it. Returns the urls
+        requested, like _do_method().
+        """
+        url = urljoin(self._url or "http://localhost/", url)
+        method = method.lower()
+        urls = []
+
+        for _ in range(MAX_REDIRECTS + 1):
+            urls.append(url)
+
+            body = None
+            if method == "get":
+                if data:
+                    url += ("&" if urlsplit(url).query else "?") + urlencode(data, doseq=True)
+                    data = None
+            else:
+                body = RequestBody.from_form(data)
+
+            headers = self._request_headers(url)
+            cache = self.http_cache if method == "get" else None
+            cached, validators = cache.lookup(url, headers) if cache is not None else (None, {})
+            if cached is not None:
+                response = cached
+            else:
+                response = yield method, url, [*headers, *validators.items()], body
+                extract_cookies(self.cookie_jar, url, response.headers.items())
+                if cache is not None:
+                    response = cache.update(url, response, headers)
+
+            if response.status_code not in _REDIRECT:
+                break
+
+            if response.status_code in _REDIRECT_TO_GET:
+                method = "get"
+                data = None
+            url = urljoin(url, response.headers["Location"])
+
+        self._load(response, url)
+        return urls
+
+    def _call_app(self, method, url, headers, body):
+        """Make a request to the application and return its response."""
+        raise NotImplementedError(
+            "%s doesn't support calling the application." % self.driver_name,
+        )
+
+    def _do_method(self, method, url, data=None):
+        requests = self._requests(method, url, data=data)
+        try:
+            request = next(requests)
+            while True:
+                request = requests.send(self._call_app(*request))
+        except StopIteration as done:
+            return done.value
+
+    def submit_data(self, form, submitter=None):
+        return super().submit(form, submitter=submitter).content
+
+    def _response_body(self, response):
+        return response.content
+
+    def _response_from_archive(self, response):
+        return self.response_class.from_archive(response)
+
+    def _response_charset(self, response):
+        return content_type_charset(response.headers.get("Content-Type"))
+
+    @property
+    def html(self):
+        return self._response_text()
@@ -0,0 +1,206 @@
+import asyncio
+import contextlib
+from typing import Optional
+from urllib.parse import unquote
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from wsgiref.headers import Headers
+
+from splinter.config import Config
+from splinter.driver.app_client import AppClient
+from splinter.driver.request_body import RequestBody
+from splinter.driver.response_archive import body_hash
+from splinter.driver.response_archive import ResponseArchive
+
+
+class AsgiResponse:
+    """Response returned by an ASGI application.
+
+    Attributes:
+        status_code (int): Status code of the response.
+        headers (wsgiref.headers.Headers): Headers of the response.
+        content (bytes): Body of the response.
+    """
+
+    def __init__(self, status_code: int, headers: Headers, content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @classmethod
+    def from_archive(cls, response) -> "AsgiResponse":
+        """Build a response from an ArchivedResponse."""
+        return cls(response.status_code, Headers(list(response.headers)), response.body)
+
+
+def _request_messages(body: Optional[RequestBody]):
+    if body is not None:
+        for chunk in body.chunks():
+            yield {"type": "http.request", "body": chunk, "more_body": True}
+    yield {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def call_asgi_app(app, method: str, url: str, headers, body: Optional[RequestBody] = None) -> AsgiResponse:
+    """Make an HTTP request to an ASGI application, in process.
+
+    Arguments:
+        app: The ASGI application.
+        method (str): HTTP method of the request.
+        url (str): Absolute url of the request.
+        headers (list): Request headers, as (name, value) tuples.
+        body (RequestBody): Body of the request.
+
+    Returns:
+        AsgiResponse
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme or "http"
+    port = parts.port or (443 if scheme == "https" else 80)
+    headers = [("host", parts.netloc), *headers]
+    if body is not None:
+        headers += [("content-type", body.content_type), ("content-length", str(len(body)))]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method.upper(),
+        "scheme": scheme,
+        "path": unquote(parts.path) or "/",
+        "raw_path": (parts.path or "/").encode("latin-1"),
+        "query_string": parts.query.encode("latin-1"),
+        "root_path": "",
+        "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+        "client": ("127.0.0.1", 0),
+        "server": (parts.hostname or "localhost", port),
+    }
+
+    messages = _request_messages(body)
+    response_complete = asyncio.Event()
+
+    async def receive():
+        message = next(messages, None)
+        if message is not None:
+            return message
+        # The whole body was sent, the client stays until the response ends.
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    status_code = 500
+    response_headers = []
+    content = []
+
+    async def send(message):
+        nonlocal status_code, response_headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            response_headers = [
+                (name.decode("latin-1"), value.decode("latin-1")) for name, value in message.get("headers", [])
+            ]
+        elif message["type"] == "http.response.body":
+            content.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    response_complete.set()
+
+    return AsgiResponse(status_code, Headers(response_headers), b"".join(content))
+
+
+class AsgiClient(AppClient):
+    """Driver for ASGI applications, like Starlette or FastAPI apps.
+
+    Requests are made by calling the application in process, without any
+    server. Every method that makes a request has an async variant, so many
+    browsers can share a single event loop:
+
+        >>> browsers = [Browser('asgi', app=app) for _ in range(100)]
+        >>> await asyncio.gather(*(browser.avisit('/') for browser in browsers))
+
+    The sync methods run the application on an event loop owned by the
+    browser, and can't be called while another event loop is running in
+    the same thread. The application's lifespan events aren't sent.
+
+    Arguments:
+        app: The ASGI application.
+        custom_headers (dict): Headers sent with every request.
+    """
+
+    driver_name = "asgi"
+    response_class = AsgiResponse
+
+    def __init__(
+        self,
+        app,
+        user_agent=None,
+        wait_time=2,
+        custom_headers=None,
+        config: Optional[Config] = None,
+        incremental_parsing: bool = False,
+        page_cache_size: int = 10,
+        http_cache: bool = False,
+        response_archive: Optional[ResponseArchive] = None,
+    ):
+        self._loop = asyncio.new_event_loop()
+        super().__init__(
+            app,
+            user_agent=user_agent,
+            wait_time=wait_time,
+            custom_headers=custom_headers,
+            config=config,
+            incremental_parsing=incremental_parsing,
+            page_cache_size=page_cache_size,
+            http_cache=http_cache,
+            response_archive=response_archive,
+        )
+
+    def quit(self):  # NOQA: A003
+        self._loop.close()
+
+    def clone(self):
+        clone = super().clone()
+        clone._loop = asyncio.new_event_loop()
+        return clone
+
+    def _call_app(self, method, url, headers, body):
+        return self._loop.run_until_complete(call_asgi_app(self.app, method, url, headers, body))
+
+    async def _ado_method(self, method, url, data=None):
+        requests = self._requests(method, url, data=data)
+        try:
+            request = next(requests)
+            while True:
+                request = requests.send(await call_asgi_app(self.app, *request))
+        except StopIteration as done:
+            return done.value
+
+    async def _arequest(self, method, url, data=None):
+        """Async version of _request()."""
+        archive = self.response_archive
+        if archive is not None:
+            archive_url = urljoin(self._url, url)
+            data_hash = body_hash(data)
+            if not archive.recording and self._replay(method, archive_url, data_hash, url):
+                return
+
+        urls = await self._ado_method(method, url, data=data)
+        self._add_to_history(urls)
+        if archive is not None and archive.recording:
+            self._record(method, archive_url, data_hash, urls)
+
+    async def avisit(self, url):
+        """Async version of visit()."""
+        self._leave_page()
+        await self._arequest("get", url)
+
+    async def asubmit(self, form, submitter=None):
+        """Async version of submit()."""
+        method, url = self._form_request(form)
+
+        with contextlib.ExitStack() as files:
+            data = self.serialize(form, submitter=submitter, files=files)
+
+            self._leave_page()
+            await self._arequest(method, url, data=data)
+        return self._response
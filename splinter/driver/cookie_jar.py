@@ -0,0 +1,113 @@
+import copy
+import email.message
+import http.cookiejar
+import urllib.request
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlparse
+
+from splinter.abc import CookieManagerAPI
+
+
+class _JarResponse:
+    """The part of a urllib response that http.cookiejar reads."""
+
+    def __init__(self, headers: Iterable[Tuple[str, str]]) -> None:
+        self._info = email.message.Message()
+        for name, value in headers:
+            self._info[name] = value
+
+    def info(self) -> email.message.Message:
+        return self._info
+
+
+def cookie_header(jar: http.cookiejar.CookieJar, url: str) -> Optional[str]:
+    """Get the Cookie header to send with a request to a url."""
+    # Requests are only built for the jar to read, nothing is opened.
+    request = urllib.request.Request(url)  # NOQA: S310
+    jar.add_cookie_header(request)
+    return request.get_header("Cookie")
+
+
+def extract_cookies(
+    jar: http.cookiejar.CookieJar,
+    url: str,
+    headers: Iterable[Tuple[str, str]],
+) -> None:
+    """Store the cookies set by the headers of a response to a url."""
+    jar.extract_cookies(_JarResponse(headers), urllib.request.Request(url))  # NOQA: S310
+
+
+def copy_cookie_jar(jar: http.cookiejar.CookieJar) -> http.cookiejar.CookieJar:
+    """Get a new jar with copies of the cookies in a jar."""
+    new_jar = http.cookiejar.CookieJar()
+    for cookie in jar:
+        new_jar.set_cookie(copy.copy(cookie))
+    return new_jar
+
+
+class CookieJarManager(CookieManagerAPI):
+    """CookieManagerAPI for drivers that keep cookies in a http.cookiejar.CookieJar.
+
+    Cookies added through the manager are set for the host of the page the
+    driver is on, or localhost before anything has been visited.
+
+    Arguments:
+        driver: The splinter driver. Its cookies must be in ``driver.cookie_jar``.
+    """
+
+    def _domain(self) -> str:
+        return urlparse(self.driver.url).hostname or "localhost"
+
+    def add(self, cookie, **kwargs):
+        for key, value in cookie.items():
+            self.driver.cookie_jar.set_cookie(
+                http.cookiejar.Cookie(
+                    version=0,
+                    name=key,
+                    value=value,
+                    port=None,
+                    port_specified=False,
+                    domain=kwargs.get("domain", self._domain()),
+                    domain_specified="domain" in kwargs,
+                    domain_initial_dot=False,
+                    path=kwargs.get("path", "/"),
+                    path_specified="path" in kwargs,
+                    secure=kwargs.get("secure", False),
+                    expires=kwargs.get("expires"),
+                    discard=kwargs.get("expires") is None,
+                    comment=kwargs.get("comment"),
+                    comment_url=None,
+                    rest={"HttpOnly": None} if kwargs.get("httponly") else {},
+                ),
+            )
+
+    def delete(self, *cookies):
+        jar = self.driver.cookie_jar
+        for cookie in list(jar):
+            if cookie.name in cookies:
+                jar.clear(cookie.domain, cookie.path, cookie.name)
+
+    def delete_all(self):
+        self.driver.cookie_jar.clear()
+
+    def all(self, verbose=False):  # NOQA: A003
+        cookies = {}
+        for cookie in self.driver.cookie_jar:
+            cookies[cookie.name] = cookie.value
+        return cookies
+
+    def __getitem__(self, item):
+        for cookie in self.driver.cookie_jar:
+            if cookie.name == item:
+                return cookie.value
+        raise KeyError(item)
+
+    def __contains__(self, key):
+        return any(cookie.name == key for cookie in self.driver.cookie_jar)
+
+    def __eq__(self, other_object):
+        if isinstance(other_object, dict):
+            return self.all() == other_object
+        return False
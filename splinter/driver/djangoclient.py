@@ -1,13 +1,14 @@
 # Copyright 2012 splinter authors. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
+import copy
 from typing import Optional
 from urllib import parse
 
 from .lxmldriver import LxmlDriver
 from splinter.abc import CookieManagerAPI
 from splinter.config import Config
-from splinter.request_handler.status_code import StatusCode
+from splinter.driver.response_archive import ResponseArchive
 
 
 class CookieManager(CookieManagerAPI):
@@ -55,18 +56,22 @@ class DjangoClient(LxmlDriver):
         user_agent=None,
         wait_time=2,
         config: Optional[Config] = None,
+        incremental_parsing: bool = False,
+        page_cache_size: int = 10,
+        http_cache: bool = False,
+        response_archive: Optional[ResponseArchive] = None,
         **kwargs,
     ):
         from django.test.client import Client
 
         self._custom_headers = kwargs.pop("custom_headers", {})
 
-        client_kwargs = {}
+        self._client_kwargs = {}
         for key, value in kwargs.items():
             if key.startswith("client_"):
-                client_kwargs[key.replace("client_", "")] = value
+                self._client_kwargs[key.replace("client_", "")] = value
 
-        self._browser = Client(**client_kwargs)
+        self._browser = Client(**self._client_kwargs)
 
         self._cookie_manager = CookieManager(self._browser)
 
@@ -74,6 +79,10 @@ class DjangoClient(LxmlDriver):
             wait_time=wait_time,
             user_agent=user_agent,
             config=config,
+            incremental_parsing=incremental_parsing,
+            page_cache_size=page_cache_size,
+            http_cache=http_cache,
+            response_archive=response_archive,
         )
 
     def __enter__(self):
@@ -82,19 +91,21 @@ class DjangoClient(LxmlDriver):
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
-    def _post_load(self):
-        self._forms = {}
-        try:
-            del self._html
-        except AttributeError:
-            pass
-        self.status_code = StatusCode(self._response.status_code, "")
+    def clone(self):
+        from django.test.client import Client
+
+        # Sessions stored on the server are shared, only the cookie is copied.
+        clone = super().clone()
+        clone._browser = Client(**self._client_kwargs)
+        clone._browser.cookies = copy.deepcopy(self._browser.cookies)
+        clone._cookie_manager = CookieManager(clone._browser)
+        clone._custom_headers = dict(self._custom_headers)
+        return clone
 
-    def _handle_redirect_chain(self):
-        if self._response.redirect_chain:
-            for redirect_url, redirect_code in self._response.redirect_chain:
-                self._last_urls.append(redirect_url)
-            self._url = self._last_urls[-1]
+    def _add_to_history(self, urls, record_url=True):
+        super()._add_to_history(urls[:1], record_url)
+        # The redirects Django followed are appended without being entries of their own.
+        self._last_urls.extend(urls[1:])
 
     def _set_extra_params(self, url):
         extra = {}
@@ -109,24 +120,59 @@ class DjangoClient(LxmlDriver):
             extra.update(self._custom_headers)
         return extra
 
-    def _do_method(self, method, url, data=None, record_url=True):
-        self._url = url
+    def _request_headers(self):
+        headers = list(self._custom_headers.items())
+        if self.config.user_agent:
+            headers.append(("User-Agent", self.config.user_agent))
+        cookies = "; ".join(f"{name}={morsel.value}" for name, morsel in self._browser.cookies.items())
+        if cookies:
+            headers.append(("Cookie", cookies))
+        return headers
+
+    def _do_method(self, method, url, data=None):
         extra = self._set_extra_params(url)
         func_method = getattr(self._browser, method.lower())
-        self._response = func_method(url, data=data, follow=True, **extra)
 
-        if record_url:
-            self._last_url_index += 1
-            # Going to a new URL always crops the url history
-            self._last_urls = self._last_urls[: self._last_url_index]
-            self._last_urls.append(url)
+        if method.lower() == "get":
+
+            def send(headers):
+                # Django takes request headers as WSGI environ keys.
+                for name, value in headers.items():
+                    extra["HTTP_" + name.upper().replace("-", "_")] = value
+                return func_method(url, data=data, follow=True, **extra)
+
+            cache_key = url
+            if data:
+                cache_key += ("&" if "?" in url else "?") + parse.urlencode(data, doseq=True)
+            response = self._send_get(cache_key, send, self._request_headers())
+        else:
+            response = func_method(url, data=data, follow=True, **extra)
+
+        urls = [url, *(redirect_url for redirect_url, redirect_code in response.redirect_chain)]
+        self._load(response, urls[-1])
+        return urls
+
+    def submit_data(self, form, submitter=None):
+        return super().submit(form, submitter=submitter).content
+
+    def _response_body(self, response):
+        return response.content
+
+    def _response_headers(self, response):
+        return list(response.items())
+
+    def _response_from_archive(self, response):
+        from django.http import HttpResponse
 
-        self._handle_redirect_chain()
-        self._post_load()
+        django_response = HttpResponse(response.body, status=response.status_code)
+        # HttpResponse only takes headers as an argument since Django 3.2.
+        for name, value in response.headers:
+            django_response[name] = value
+        return django_response
 
-    def submit_data(self, form):
-        return super().submit(form).content
+    def _response_charset(self, response):
+        return response.charset
 
     @property
     def html(self):
-        return self._response.content.decode(self._response._charset or "utf-8")
+        return self._response_text()
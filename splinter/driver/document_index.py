@@ -0,0 +1,146 @@
+import re
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+# normalize-space() only treats XML whitespace as whitespace.
+_XML_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
+
+class DocumentIndex:
+    """Lookup tables for the elements of a parsed lxml document.
+
+    Every table is filled by a single walk over the document, so finding
+    elements by id, name, tag or class becomes a dictionary lookup instead of
+    an XPath scan of the whole tree. Elements are kept in document order.
+
+    The index is only valid for the tree it was built from. Drivers must
+    throw it away whenever a new page is loaded.
+
+    Arguments:
+        tree: Any element of a parsed lxml.html document.
+    """
+
+    def __init__(self, tree) -> None:
+        document = tree.getroottree()
+        self.root = document.getroot()
+
+        self.ids: Dict[str, List] = {}
+        self.names: Dict[str, List] = {}
+        self.tags: Dict[str, List] = {}
+        self.classes: Dict[str, List] = {}
+
+        for element in document.iter():
+            tag = element.tag
+            # Comments and processing instructions aren't tags.
+            if not isinstance(tag, str):
+                continue
+
+            self.tags.setdefault(tag, []).append(element)
+
+            attrib = element.attrib
+
+            id_value = attrib.get("id")
+            if id_value is not None:
+                self.ids.setdefault(id_value, []).append(element)
+
+            name = attrib.get("name")
+            if name is not None:
+                self.names.setdefault(name, []).append(element)
+
+            for class_name in attrib.get("class", "").split():
+                self.classes.setdefault(class_name, []).append(element)
+
+    def covers(self, element) -> bool:
+        """Check if an element belongs to the indexed document."""
+        return element.getroottree().getroot() is self.root
+
+    def has_class_within(self, element, class_name: str) -> bool:
+        """Check if an element, or any of its descendants, has a class.
+
+        Arguments:
+            element: An element of the indexed document.
+            class_name (str): The class to look for.
+        """
+        for candidate in self.classes.get(class_name, ()):
+            if candidate is element:
+                return True
+            for ancestor in candidate.iterancestors():
+                if ancestor is element:
+                    return True
+        return False
+
+
+def _normalize_space(text: str) -> str:
+    """Collapse whitespace the same way XPath's normalize-space() does."""
+    return " ".join(_XML_WHITESPACE.split(text)).strip(" ")
+
+
+def body_text(tree) -> str:
+    """Get the text of a document's body.
+
+    Pages that don't have a body, like plain text or HTML fragments, are
+    shown inside one by browsers, so their whole text is used instead.
+
+    Arguments:
+        tree: Any element of a parsed lxml.html document.
+    """
+    body = tree.getroottree().getroot().find("body")
+    if body is None:
+        body = tree
+    return body.text_content()
+
+
+class TextIndex:
+    """Lookup tables for the text of a parsed lxml document.
+
+    ``nodes`` maps the value of every text node to the elements that
+    directly contain it, which is what ``//*[text()="..."]`` matches.
+    ``links`` holds the normalized text of every link, in document order,
+    for substring searches.
+
+    Like DocumentIndex, a TextIndex is only valid for the tree it was built
+    from.
+
+    Arguments:
+        tree: Any element of a parsed lxml.html document.
+    """
+
+    def __init__(self, tree) -> None:
+        document = tree.getroottree()
+        self.root = document.getroot()
+
+        self.nodes: Dict[str, List] = {}
+        self.links: List[Tuple[str, Any]] = []
+
+        for element in document.iter():
+            if not isinstance(element.tag, str):
+                continue
+
+            texts = [element.text]
+            texts.extend(child.tail for child in element)
+
+            for text in texts:
+                if not text:
+                    continue
+                matches = self.nodes.setdefault(text, [])
+                # An element with the same text twice is only a single match.
+                if not matches or matches[-1] is not element:
+                    matches.append(element)
+
+            if element.tag == "a":
+                self.links.append((_normalize_space(element.text_content()), element))
+
+    def find_text(self, text: str) -> List:
+        """Get the elements that have a text node equal to text."""
+        return self.nodes.get(text, [])
+
+    def find_links_by_text(self, text: str) -> List:
+        """Get the links that have a text node equal to text."""
+        return [element for element in self.find_text(text) if element.tag == "a"]
+
+    def find_links_by_partial_text(self, partial_text: str) -> List:
+        """Get the links whose normalized text contains partial_text."""
+        return [element for text, element in self.links if partial_text in text]
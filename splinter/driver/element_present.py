@@ -1,44 +1,56 @@
 class ElementPresentMixIn:
-    """Support is_element_present_by_* methods for non-javascript drivers."""
+    """Support is_element_present_by_* methods for non-javascript drivers.
 
-    def is_element_present_by_css(self, css_selector, wait_time=None):
+    Without javascript, a page can't change until the next navigation. Every
+    check is answered once, against the current page, and wait_time and
+    wait_policy are ignored. Drivers must implement _body_text().
+    """
+
+    def is_text_present(self, text, wait_time=None, wait_policy=None, text_content=False):
+        # Without rendering, the text of the page is its text content.
+        return text in self._body_text()
+
+    def is_text_not_present(self, text, wait_time=None, wait_policy=None, text_content=False):
+        return not self.is_text_present(text, wait_time)
+
+    def is_element_present_by_css(self, css_selector, wait_time=None, wait_policy=None):
         return bool(self.find_by_css(css_selector))
 
-    def is_element_not_present_by_css(self, css_selector, wait_time=None):
-        return not self.is_element_present_by_css(css_selector, wait_time)
+    def is_element_not_present_by_css(self, css_selector, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_css(css_selector, wait_time, wait_policy)
 
-    def is_element_present_by_xpath(self, xpath, wait_time=None):
+    def is_element_present_by_xpath(self, xpath, wait_time=None, wait_policy=None):
         return bool(self.find_by_xpath(xpath))
 
-    def is_element_not_present_by_xpath(self, xpath, wait_time=None):
-        return not self.is_element_present_by_xpath(xpath, wait_time)
+    def is_element_not_present_by_xpath(self, xpath, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_xpath(xpath, wait_time, wait_policy)
 
-    def is_element_present_by_tag(self, tag, wait_time=None):
+    def is_element_present_by_tag(self, tag, wait_time=None, wait_policy=None):
         return bool(self.find_by_tag(tag))
 
-    def is_element_not_present_by_tag(self, tag, wait_time=None):
-        return not self.is_element_present_by_tag(tag, wait_time)
+    def is_element_not_present_by_tag(self, tag, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_tag(tag, wait_time, wait_policy)
 
-    def is_element_present_by_name(self, name, wait_time=None):
+    def is_element_present_by_name(self, name, wait_time=None, wait_policy=None):
         return bool(self.find_by_name(name))
 
-    def is_element_not_present_by_name(self, name, wait_time=None):
-        return not self.is_element_present_by_name(name, wait_time)
+    def is_element_not_present_by_name(self, name, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_name(name, wait_time, wait_policy)
 
-    def is_element_present_by_value(self, value, wait_time=None):
+    def is_element_present_by_value(self, value, wait_time=None, wait_policy=None):
         return bool(self.find_by_value(value))
 
-    def is_element_not_present_by_value(self, value, wait_time=None):
-        return not self.is_element_present_by_value(value, wait_time)
+    def is_element_not_present_by_value(self, value, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_value(value, wait_time, wait_policy)
 
-    def is_element_present_by_text(self, text, wait_time=None):
+    def is_element_present_by_text(self, text, wait_time=None, wait_policy=None):
         return bool(self.find_by_text(text))
 
-    def is_element_not_present_by_text(self, text, wait_time=None):
-        return not self.is_element_present_by_text(text, wait_time)
+    def is_element_not_present_by_text(self, text, wait_time=None, wait_policy=None):
+        return not self.is_element_present_by_text(text, wait_time, wait_policy)
 
-    def is_element_present_by_id(self, id, wait_time=None):  # NOQA: A002
+    def is_element_present_by_id(self, id, wait_time=None, wait_policy=None):  # NOQA: A002
         return bool(self.find_by_id(id))
 
-    def is_element_not_present_by_id(self, id, wait_time=None):  # NOQA: A002
-        return not self.is_element_present_by_id(id, wait_time)
+    def is_element_not_present_by_id(self, id, wait_time=None, wait_policy=None):  # NOQA: A002
+        return not self.is_element_present_by_id(id, wait_time, wait_policy)
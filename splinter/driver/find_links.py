@@ -10,6 +10,9 @@ class FindLinks:
 
         browser.links.find_by_href('foobar')
 
+    Parents that keep a text index can implement
+    ``_find_links_by_text(text)`` and ``_find_links_by_partial_text(text)``.
+    Those are used instead of searching the page with XPath.
     """
 
     def __init__(self, parent) -> None:
@@ -30,6 +33,10 @@ class FindLinks:
         )
 
     def find_by_partial_text(self, partial_text: str) -> ElementList:
+        finder = getattr(self.parent, "_find_links_by_partial_text", None)
+        if finder is not None:
+            return finder(partial_text)
+
         return self.parent.find_by_xpath(
             f'//a[contains(normalize-space(.), "{partial_text}")]',
             original_find="link by partial text",
@@ -37,6 +44,10 @@ class FindLinks:
         )
 
     def find_by_text(self, text: str) -> ElementList:
+        finder = getattr(self.parent, "_find_links_by_text", None)
+        if finder is not None:
+            return finder(text)
+
         return self.parent.find_by_xpath(
             f'//a[text()="{text}"]',
             original_find="link by text",
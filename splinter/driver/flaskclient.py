@@ -10,7 +10,7 @@ from urllib.parse import urlunparse
 from .lxmldriver import LxmlDriver
 from splinter.abc import CookieManagerAPI
 from splinter.config import Config
-from splinter.request_handler.status_code import StatusCode
+from splinter.driver.response_archive import ResponseArchive
 
 
 class CookieManager(CookieManagerAPI):
@@ -66,12 +66,22 @@ class FlaskClient(LxmlDriver):
         wait_time=2,
         custom_headers=None,
         config: Optional[Config] = None,
+        incremental_parsing: bool = False,
+        page_cache_size: int = 10,
+        http_cache: bool = False,
+        response_archive: Optional[ResponseArchive] = None,
     ):
         app.config["TESTING"] = True
         self._browser = app.test_client()
         self._cookie_manager = CookieManager(self._browser)
         self._custom_headers = custom_headers if custom_headers else {}
-        super().__init__(wait_time=wait_time)
+        super().__init__(
+            wait_time=wait_time,
+            incremental_parsing=incremental_parsing,
+            page_cache_size=page_cache_size,
+            http_cache=http_cache,
+            response_archive=response_archive,
+        )
 
     def __enter__(self):
         return self
@@ -79,26 +89,30 @@ class FlaskClient(LxmlDriver):
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
-    def _post_load(self):
-        self._forms = {}
-        try:
-            del self._html
-        except AttributeError:
-            pass
-        self.status_code = StatusCode(self._response.status_code, "")
-
-    def _do_method(self, method, url, data=None, record_url=True):
-        # Set the initial URL and client/HTTP method
-        self._url = url
+    def clone(self):
+        clone = super().clone()
+        clone._browser = self._browser.application.test_client()
+        clone._browser._cookies.update(self._browser._cookies)
+        clone._cookie_manager = CookieManager(clone._browser)
+        clone._custom_headers = dict(self._custom_headers)
+        return clone
+
+    def _request_headers(self):
+        headers = list(self._custom_headers.items())
+        cookies = "; ".join(f"{cookie.key}={cookie.value}" for cookie in self._browser._cookies.values())
+        if cookies:
+            headers.append(("Cookie", cookies))
+        return headers
+
+    def _do_method(self, method, url, data=None):
+        # Set the client/HTTP method
         func_method = getattr(self._browser, method.lower())
+        is_get = method.lower() == "get"
+        urls = []
 
         # Continue to make requests until a non 30X response is received
         while True:
-            if record_url:
-                self._last_url_index += 1
-                # Going to a new URL always crops the url history
-                self._last_urls = self._last_urls[: self._last_url_index]
-                self._last_urls.append(url)
+            urls.append(url)
 
             # If we're making a GET request set the data against the URL as a
             # query.
@@ -119,32 +133,56 @@ class FlaskClient(LxmlDriver):
                 # `flask.request.form` on `GET` requests.
                 data = None
 
-            # Call the flask client
-            self._response = func_method(
-                url,
-                headers=self._custom_headers,
-                data=data,
-                follow_redirects=False,
-            )
+            def send(headers, url=url, data=data, func_method=func_method):
+                # Call the flask client
+                response = func_method(
+                    url,
+                    headers={**self._custom_headers, **headers},
+                    data=data,
+                    follow_redirects=False,
+                )
+                # A streamed body can't be read by two threads at the same
+                # time, so it's read now, before the HTTP cache can share it.
+                response.get_data()
+                return response
+
+            if is_get:
+                response = self._send_get(url, send, self._request_headers())
+            else:
+                response = send({})
 
             # Implement more standard `302`/`303` behaviour
-            if self._response.status_code in (302, 303):
+            if response.status_code in (302, 303):
                 data = None
                 func_method = getattr(self._browser, "get")
+                is_get = True
 
             # If the response was not in the `30X` range we're done
-            if self._response.status_code not in (301, 302, 303, 305, 307):
+            if response.status_code not in (301, 302, 303, 305, 307):
                 break
 
             # If the response was in the `30X` range get next URL to request
-            url = self._response.headers["Location"]
+            url = response.headers["Location"]
+
+        self._load(response, url)
+        return urls
+
+    def submit_data(self, form, submitter=None):
+        return super().submit(form, submitter=submitter).data
+
+    def _response_body(self, response):
+        return response.get_data()
 
-        self._url = url
-        self._post_load()
+    def _response_from_archive(self, response):
+        return self._browser.application.response_class(
+            response.body,
+            status=response.status_code,
+            headers=response.headers,
+        )
 
-    def submit_data(self, form):
-        return super().submit(form).data
+    def _response_charset(self, response):
+        return response.mimetype_params.get("charset")
 
     @property
     def html(self):
-        return self._response.get_data(as_text=True)
+        return self._response_text()
@@ -0,0 +1,94 @@
+import codecs
+import email.message
+import re
+from typing import Dict
+from typing import Optional
+
+import lxml.html
+
+
+DEFAULT_CHARSET = "utf-8"
+
+# Browsers only look for a <meta> charset in the first 1024 bytes.
+_SNIFF_LENGTH = 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([-\w.:]+)""", re.IGNORECASE)
+
+_parsers: Dict[str, Optional[lxml.html.HTMLParser]] = {}
+
+
+def normalize_charset(charset: Optional[str]) -> Optional[str]:
+    """Get Python's name for a charset, or None if Python doesn't know it."""
+    if not charset:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return None
+
+
+def content_type_charset(content_type: Optional[str]) -> Optional[str]:
+    """Get the charset parameter of a Content-Type header, if it has one."""
+    if not content_type:
+        return None
+    message = email.message.Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+
+def sniff_charset(body: bytes, default: str = DEFAULT_CHARSET) -> str:
+    """Guess the charset of an HTML document that doesn't declare one.
+
+    A byte order mark wins, then a <meta> charset near the top of the
+    document, then default.
+
+    Arguments:
+        body (bytes): The HTML document.
+        default (str): Charset to use if nothing is found.
+    """
+    for bom, charset in _BOMS:
+        if body.startswith(bom):
+            return charset
+
+    match = _META_CHARSET.search(body[:_SNIFF_LENGTH])
+    if match:
+        charset = normalize_charset(match.group(1).decode("ascii"))
+        if charset:
+            return charset
+
+    return default
+
+
+def parse_html(body: bytes, encoding: Optional[str]):
+    """Parse an HTML document straight from bytes.
+
+    lxml is told the encoding instead of guessing it, so the document
+    doesn't have to be decoded to a str first. Encodings lxml doesn't
+    support are decoded by Python instead.
+
+    Arguments:
+        body (bytes): The HTML document.
+        encoding (str): Encoding of body.
+
+    Returns:
+        The same tree lxml.html.fromstring() returns.
+    """
+    encoding = normalize_charset(encoding) or sniff_charset(body)
+    try:
+        parser = _parsers[encoding]
+    except KeyError:
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            parser = None
+        _parsers[encoding] = parser
+
+    if parser is None:
+        return lxml.html.fromstring(body.decode(encoding))
+    return lxml.html.fromstring(body, parser=parser)
@@ -0,0 +1,286 @@
+import copy
+import threading
+import time
+from collections import namedtuple
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+
+HttpCacheInfo = namedtuple(
+    "HttpCacheInfo",
+    ["hits", "revalidations", "misses", "maxsize", "currsize"],
+)
+
+
+def _cache_control(headers) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _expires_at(headers, now: float) -> float:
+    """Get the time until which a response is fresh, from its headers."""
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return now
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return now + int(max_age)
+        except ValueError:
+            return now
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return now
+
+    return now
+
+
+def _vary(headers) -> Tuple[str, ...]:
+    """Get the names of the request headers a response varies on, lowercased."""
+    names = (name.strip().lower() for name in headers.get("Vary", "").split(","))
+    return tuple(sorted(name for name in names if name))
+
+
+def _header_values(request_headers, names: Iterable[str]) -> Tuple[Optional[str], ...]:
+    """Get the values of some request headers, None for the missing ones."""
+    values: Dict[str, str] = {}
+    for name, value in request_headers:
+        key = name.lower()
+        values[key] = values[key] + ", " + value if key in values else value
+    return tuple(values.get(name) for name in names)
+
+
+class CacheEntry:
+    """A cached response, with what's needed to revalidate it.
+
+    Arguments:
+        response: The test client's response.
+        now (float): When the response was received.
+        request_headers: The headers the request was sent with, as
+            (name, value) tuples.
+    """
+
+    def __init__(self, response, now: float, request_headers=()) -> None:
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.expires_at = _expires_at(response.headers, now)
+        self.vary = _vary(response.headers)
+        self.varied = _header_values(request_headers, self.vary)
+        self._tree = None
+
+    def matches(self, request_headers) -> bool:
+        """Check if the response can answer a request, given its Vary header."""
+        return _header_values(request_headers, self.vary) == self.varied
+
+    def is_fresh(self, now: float) -> bool:
+        """Check if the response can be used without asking the app."""
+        return now < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Get the headers that make a request conditional on this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def refresh(self, not_modified_response, now: float) -> None:
+        """Update the freshness of the entry from a 304 response."""
+        headers = not_modified_response.headers
+        self.etag = headers.get("ETag") or self.etag
+        self.expires_at = _expires_at(headers, now)
+
+    def tree(self, parse: Callable):
+        """Get a copy of the parsed response, parsing it only once.
+
+        Each caller gets its own copy, since filling forms changes the tree.
+
+        Arguments:
+            parse: Function that parses the response into a tree.
+        """
+        if self._tree is None:
+            tree = parse()
+            # Fragments are parsed into a document that a copy wouldn't keep.
+            if tree.getparent() is not None:
+                return tree
+            self._tree = tree
+        return copy.deepcopy(self._tree)
+
+
+class HttpCache:
+    """Cache of GET responses that follows HTTP caching headers.
+
+    Responses with an ETag or Last-Modified header, or with a freshness
+    lifetime from Cache-Control max-age or Expires, are kept. A fresh
+    response is reused without calling the app. A stale one is revalidated
+    with If-None-Match/If-Modified-Since, and reused if the app answers
+    304 Not Modified. Responses marked no-store, or with Vary: *, are never
+    kept.
+
+    It can be shared by browsers in several threads. Like a browser's
+    cache, it belongs to a single user. A response is
+    reused for a request with other cookies or headers unless its Vary
+    header names them, so pages that depend on the session should be sent
+    with Vary: Cookie, or without caching headers.
+
+    Example:
+
+        >>> browser = Browser('flask', app=app, http_cache=True)
+        >>> browser.visit('/catalog')
+        >>> browser.visit('/catalog')
+        >>> browser.http_cache.info()
+        HttpCacheInfo(hits=0, revalidations=1, misses=1, maxsize=256, currsize=1)
+
+    Arguments:
+        maxsize (int): Maximum number of responses to keep.
+        clock: Function returning the current time, in seconds.
+    """
+
+    def __init__(self, maxsize: int = 256, clock: Callable[[], float] = time.time) -> None:
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        # The entries by the id of their response. An entry keeps its
+        # response alive, so the id isn't reused while it's cached.
+        self._by_response: Dict[int, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def request(self, url: str, send: Callable, request_headers=()):
+        """Get a response for a GET request, from the cache if possible.
+
+        Arguments:
+            url (str): The url requested.
+            send: Function that makes the request. It's called with a dict
+                of extra request headers and must return the response.
+            request_headers: The headers the request is sent with, as
+                (name, value) tuples, for responses with a Vary header.
+
+        Returns:
+            The response to use.
+        """
+        response, validators = self.lookup(url, request_headers)
+        if response is not None:
+            return response
+        return self.update(url, send(validators), request_headers)
+
+    def lookup(self, url: str, request_headers=()) -> Tuple[Any, Dict[str, str]]:
+        """Find what the cache holds for a GET request, before it's sent.
+
+        For drivers that can't make the request from a callback, request()
+        is lookup(), then sending the request, then update().
+
+        Arguments:
+            url (str): The url requested.
+            request_headers: The headers the request is sent with, as
+                (name, value) tuples.
+
+        Returns:
+            tuple: A fresh response to use without making the request, or
+            None and the extra headers to send the request with.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or not entry.matches(request_headers):
+                return None, {}
+
+            self._entries.move_to_end(url)
+            if entry.is_fresh(self.clock()):
+                self.hits += 1
+                return entry.response, {}
+            return None, entry.validators()
+
+    def update(self, url: str, response, request_headers=()):
+        """Store the response to a GET request sent after lookup().
+
+        Arguments:
+            url (str): The url requested.
+            response: The response received.
+            request_headers: The headers given to lookup().
+
+        Returns:
+            The response to use, the cached one if the app answered 304.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and response.status_code == 304 and entry.matches(request_headers):
+                self.revalidations += 1
+                entry.refresh(response, self.clock())
+                return entry.response
+
+            self.misses += 1
+            self._store(url, response, request_headers)
+            return response
+
+    def entry_for(self, response) -> Optional[CacheEntry]:
+        """Get the entry a response is cached in, if it's cached."""
+        with self._lock:
+            return self._by_response.get(id(response))
+
+    def _remove(self, entry: Optional[CacheEntry]) -> None:
+        if entry is not None:
+            self._by_response.pop(id(entry.response), None)
+
+    def _store(self, url: str, response, request_headers) -> None:
+        self._remove(self._entries.pop(url, None))
+
+        if response.status_code != 200 or "no-store" in _cache_control(response.headers):
+            return
+
+        now = self.clock()
+        entry = CacheEntry(response, now, request_headers)
+        if "*" in entry.vary:
+            return
+        if not (entry.etag or entry.last_modified or entry.is_fresh(now)):
+            return
+
+        self._entries[url] = entry
+        self._by_response[id(response)] = entry
+        if len(self._entries) > self.maxsize:
+            self._remove(self._entries.popitem(last=False)[1])
+
+    def clear(self) -> None:
+        """Remove every response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._by_response.clear()
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+
+    def info(self) -> HttpCacheInfo:
+        """Report how effective the cache has been.
+
+        Returns:
+            HttpCacheInfo: hits, revalidations, misses, maxsize and currsize.
+        """
+        with self._lock:
+            return HttpCacheInfo(
+                self.hits,
+                self.revalidations,
+                self.misses,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,146 @@
+import re
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import lxml.etree
+import lxml.html
+
+
+# The same check lxml.html.fromstring() uses to tell documents from fragments.
+_FULL_HTML = re.compile(rb"^\s*<(?:html|!doctype)", re.IGNORECASE)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _split(chunks: Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    for chunk in chunks:
+        for start in range(0, len(chunk), chunk_size):
+            yield chunk[start : start + chunk_size]
+
+
+class IncrementalParser:
+    """Parse an HTML document only as far as the queries made against it need.
+
+    The body is fed to lxml's pull parser one chunk at a time. Lookups by id,
+    name and tag stop feeding as soon as a matching element has been
+    completely parsed. Everything else calls finish(), which parses the rest
+    of the document and returns the same tree lxml.html.fromstring() would.
+
+    Only full documents can be parsed incrementally. Check is_full_html before
+    using the parser, fragments must go through lxml.html.fromstring().
+
+    Arguments:
+        chunks: The response body, as an iterable of bytes.
+        encoding (str): Encoding of the body.
+        chunk_size (int): Maximum number of bytes to parse at a time.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        encoding: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self._chunks = _split(chunks, chunk_size)
+
+        self._parser = lxml.etree.HTMLPullParser(events=("end",), encoding=encoding)
+        self._parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+
+        # Elements that have been completely parsed.
+        self._ids: Dict[str, List] = {}
+        self._names: Dict[str, List] = {}
+        self._tags: Dict[str, List] = {}
+
+        self.root = None
+        self.complete = False
+
+        self._next_chunk = next(self._chunks, b"")
+        self.is_full_html = bool(_FULL_HTML.match(self._next_chunk))
+
+    def _feed(self) -> None:
+        """Feed the next chunk to the parser, or close it if there are none left."""
+        if self._next_chunk:
+            self._parser.feed(self._next_chunk)
+            self._next_chunk = next(self._chunks, b"")
+        else:
+            self.root = self._parser.close()
+            self.complete = True
+
+        for _event, element in self._parser.read_events():
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+
+            self._tags.setdefault(tag, []).append(element)
+
+            id_value = element.get("id")
+            if id_value is not None:
+                self._ids.setdefault(id_value, []).append(element)
+
+            name = element.get("name")
+            if name is not None:
+                self._names.setdefault(name, []).append(element)
+
+    def _first_complete(self, table: Dict[str, List], key: str, attr: str):
+        """Find the first element in document order, once it's complete.
+
+        Elements are completed in post-order, so an element that was
+        completed first can still have an open ancestor that matches too.
+        """
+        elements = table.get(key)
+        if not elements:
+            return None
+
+        first = elements[0]
+        for ancestor in first.iterancestors():
+            if ancestor.get(attr) == key:
+                first = ancestor
+
+        if any(element is first for element in elements):
+            return first
+        return None
+
+    def _feed_until(self, search):
+        while True:
+            result = search()
+            if result is not None or self.complete:
+                return result
+            self._feed()
+
+    def find_by_id(self, id_value: str):
+        """Get the first element with an id, parsing only as far as needed.
+
+        Returns:
+            The element, or None if the document has no such id.
+        """
+        return self._feed_until(lambda: self._first_complete(self._ids, id_value, "id"))
+
+    def has_name(self, name: str) -> bool:
+        """Check if any element has a name, parsing only as far as needed."""
+        return self._feed_until(lambda: self._names.get(name) or None) is not None
+
+    def has_tag(self, tag: str) -> bool:
+        """Check if any element has a tag, parsing only as far as needed."""
+        return self._feed_until(lambda: self._tags.get(tag) or None) is not None
+
+    def find_title(self):
+        """Get the first title element, parsing only as far as needed.
+
+        Returns:
+            The element, or None if the document has no title.
+        """
+        titles = self._feed_until(lambda: self._tags.get("title") or None)
+        return titles[0] if titles else None
+
+    def finish(self):
+        """Parse the rest of the document.
+
+        Returns:
+            The root element of the document.
+        """
+        while not self.complete:
+            self._feed()
+        return self.root
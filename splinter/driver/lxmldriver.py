@@ -1,41 +1,139 @@
 # Copyright 2014 splinter authors. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
+import contextlib
+import copy
+import io
 import re
-import time
+import threading
 import warnings
+from functools import partial
+from functools import wraps
 from typing import Optional
 from urllib import parse
 
 import lxml.etree
 import lxml.html
-from lxml.cssselect import CSSSelector
 
 from splinter.config import Config
 from splinter.driver import DriverAPI
 from splinter.driver import ElementAPI
+from splinter.driver.document_index import DocumentIndex
+from splinter.driver.document_index import TextIndex
+from splinter.driver.document_index import body_text
 from splinter.driver.element_present import ElementPresentMixIn
 from splinter.driver.find_links import FindLinks
+from splinter.driver.html_source import normalize_charset
+from splinter.driver.html_source import parse_html
+from splinter.driver.html_source import sniff_charset
+from splinter.driver.http_cache import HttpCache
+from splinter.driver.incremental_parser import IncrementalParser
+from splinter.driver.page_cache import PageCache
+from splinter.driver.page_state import DerivedValues
+from splinter.driver.page_state import PageState
+from splinter.driver.query_cache import query_cache
+from splinter.driver.response_archive import ArchivedResponse
+from splinter.driver.response_archive import body_hash
+from splinter.driver.response_archive import ResponseArchive
+from splinter.driver.streaming import stream_elements
 from splinter.driver.xpath_utils import _concat_xpath_from_str
 from splinter.element_list import ElementList
 from splinter.exceptions import ElementDoesNotExist
+from splinter.request_handler.status_code import StatusCode
+
+
+# Derived values that don't point into the parsed tree, which clones share.
+_SHARED_DERIVED = ("content", "text", "charset", "body")
+
+# Inputs that are only sent when they submit the form.
+_BUTTON_TYPES = ("submit", "image", "reset", "button")
+
+# Tags that can be looked up in the document index instead of with XPath.
+_PLAIN_TAG = re.compile(r"^[A-Za-z][A-Za-z0-9-]*$")
+
+
+def _with_page_lock(method):
+    """Hold the page lock while a method loads or copies the current page."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._page_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _fill_controls(controls, value):
+    """Set the value of every control sharing a name, the way fill_form() does.
+
+    Arguments:
+        controls (list): The controls with the name, in document order.
+        value: Value to set. Checkboxes take a boolean, or a list of the
+            values to check. Multiple selects take a value or a list.
+    """
+    first = controls[0]
+    control_type = first.get("type")
+
+    if control_type == "checkbox":
+        if isinstance(value, (list, tuple, set)):
+            for control in controls:
+                control.checked = control.get("value", "on") in value
+        else:
+            for control in controls:
+                control.checked = bool(value)
+    elif control_type == "radio":
+        for control in controls:
+            control.checked = control.get("value") == value
+    elif first.tag == "select" and first.multiple:
+        first.value = [value] if isinstance(value, str) else value
+    else:
+        # text, textarea, password, tel, single select
+        first.value = value
 
 
 class LxmlDriver(ElementPresentMixIn, DriverAPI):
-    _response = ""
-    _url = ""
+    """Base class of the drivers that parse pages with lxml.
+
+    A browser can be shared between threads. Loading a page, going back or
+    forward and cloning hold a lock, so they happen one at a time. The page
+    shown is a :class:`PageState <splinter.driver.page_state.PageState>`,
+    built whole before it's swapped in, and each query reads it once, so it
+    never mixes two pages. Each page is parsed once: the first query builds
+    the tree, then every query reads it without locking. Read-only queries
+    on one page can run in a thread pool:
+
+        >>> browser.visit('/report')
+        >>> with ThreadPoolExecutor() as pool:
+        ...     rows = list(pool.map(browser.find_by_css, selectors))
+
+    Filling forms changes the tree, and incremental parsing builds it while
+    it's queried, so neither should be used from several threads at once.
+    """
+
+    #: Compiled XPath/CSS queries, shared by every lxml based driver.
+    query_cache = query_cache
 
     def __init__(
         self,
         user_agent=None,
         wait_time=2,
         config: Optional[Config] = None,
+        incremental_parsing: bool = False,
+        page_cache_size: int = 10,
+        http_cache: bool = False,
+        response_archive: Optional[ResponseArchive] = None,
     ):
         self.wait_time = wait_time
+        self.incremental_parsing = incremental_parsing
+        self.page_cache = PageCache(maxsize=page_cache_size)
+        self.http_cache = HttpCache() if http_cache else None
+        self.response_archive = response_archive
+        # Guards navigation and building the attributes derived from a page.
+        self._page_lock = threading.RLock()
         self._history = []
         self._last_urls = []
         self._last_url_index = -1  # Empty
-        self._forms = {}
+        self._page = PageState.load(None, "")
 
         self.links = FindLinks(self)
 
@@ -56,42 +154,258 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         pass
 
     def _do_method(self, action, url, data=None):
+        """Make a request, follow its redirects and load the last response.
+
+        Returns:
+            list: The urls the request went through, starting with url.
+        """
         raise NotImplementedError(
             "%s doesn't support doing http methods." % self.driver_name,
         )
 
+    def _add_to_history(self, urls, record_url=True):
+        """Add the urls a request went through to the history.
+
+        Arguments:
+            urls (list): The urls, as returned by _do_method().
+            record_url (bool): False when going back or forward, the
+                history stays as it is.
+        """
+        if not record_url:
+            return
+
+        for url in urls:
+            self._last_url_index += 1
+            # Going to a new URL always crops the url history
+            self._last_urls = self._last_urls[: self._last_url_index]
+            self._last_urls.append(url)
+
+    def _request(self, method, url, data=None, record_url=True):
+        """Make a request, through the response archive if there is one."""
+        archive = self.response_archive
+        if archive is not None:
+            # Relative urls are matched by the page they were requested from.
+            archive_url = parse.urljoin(self._url, url)
+            # Hashed first, since making the request can close the files it uploads.
+            data_hash = body_hash(data)
+            if not archive.recording and self._replay(method, archive_url, data_hash, url, record_url):
+                return
+
+        urls = self._do_method(method, url, data=data)
+        self._add_to_history(urls, record_url)
+        if archive is not None and archive.recording:
+            self._record(method, archive_url, data_hash, urls)
+
+    def _record(self, method, archive_url, data_hash, urls):
+        """Add the page that was just loaded to the response archive."""
+        page = self._page
+        self.response_archive.record(
+            method,
+            archive_url,
+            None,
+            ArchivedResponse(
+                page.url,
+                page.response.status_code,
+                self._response_headers(page.response),
+                self._page_body(page),
+                tuple(urls),
+            ),
+            data_hash=data_hash,
+        )
+
+    def _replay(self, method, archive_url, data_hash, url, record_url=True):
+        """Load the archived response to a request.
+
+        Returns:
+            bool: False if the request isn't in the archive, and it isn't strict.
+        """
+        response = self.response_archive.replay(method, archive_url, None, data_hash=data_hash)
+        if response is None:
+            return False
+
+        # Redirects are added to the history the same way they were live.
+        self._load(self._response_from_archive(response), response.url)
+        self._add_to_history(response.history or [url], record_url)
+        return True
+
+    def _response_from_archive(self, response):
+        """Build the client's own kind of response from an ArchivedResponse."""
+        raise NotImplementedError(
+            "%s doesn't support replaying responses." % self.driver_name,
+        )
+
+    @property
+    def _response(self):
+        return self._page.response
+
+    @property
+    def _url(self):
+        return self._page.url
+
+    @property
+    def status_code(self):
+        return self._page.status_code
+
+    @property
+    def _forms(self):
+        return self._page.forms
+
+    def _status_code(self, response):
+        """Status of a response, as a StatusCode."""
+        return StatusCode(response.status_code, "")
+
+    def _load(self, response, url):
+        """Show the page of a response, in place of the current one.
+
+        Arguments:
+            response: The client's response.
+            url (str): Url of the page, after any redirect.
+        """
+        page = PageState.load(response, url, self._status_code(response))
+        with self._page_lock:
+            self._page = page
+
+    def _save_page(self):
+        """Put the current page in the back/forward cache."""
+        # Nothing has been loaded yet.
+        page = self._page
+        if self._last_url_index < 0 or page.response is None:
+            return
+
+        self.page_cache.put(
+            self._last_url_index,
+            self._last_urls[self._last_url_index],
+            page,
+            len(self._page_body(page)),
+        )
+
+    def _leave_page(self):
+        """Save the current page before navigating to a new one."""
+        self._save_page()
+        # The new page replaces any forward history.
+        self.page_cache.discard_after(self._last_url_index)
+
+    def _go_to_history_entry(self, revalidate):
+        """Show the page at _last_url_index, from the cache if possible."""
+        url = self._last_urls[self._last_url_index]
+        page = None if revalidate else self.page_cache.get(self._last_url_index, url)
+
+        if page is None:
+            self._request("get", url, record_url=False)
+            return
+
+        self._page = page
+
+    @_with_page_lock
+    def clone(self):
+        """Get an independent browser, on the same page and with the same cookies.
+
+        Nothing is requested again. The clone shares the current response,
+        and gets its own copy of the history and of the parsed page, so
+        filling a form in one browser doesn't change the other.
+
+        Example:
+
+            >>> browser.visit('/login')
+            >>> browser.find_by_name('submit').click()
+            >>> sessions = [browser.clone() for _ in range(10)]
+
+        Returns:
+            A browser of the same class.
+        """
+        clone = copy.copy(self)
+        clone._page_lock = threading.RLock()
+        clone._history = list(self._history)
+        clone._last_urls = list(self._last_urls)
+        clone.page_cache = PageCache(maxsize=self.page_cache.maxsize, maxbytes=self.page_cache.maxbytes)
+        clone.http_cache = HttpCache(maxsize=self.http_cache.maxsize) if self.http_cache is not None else None
+        clone.links = FindLinks(clone)
+        clone._finder_methods = {
+            "name": clone.find_by_name,
+            "xpath": clone.find_by_xpath,
+            "css": clone.find_by_css,
+        }
+
+        page = self._page
+        derived = {name: page.derived.peek(name) for name in _SHARED_DERIVED if name in page.derived}
+        tree = page.derived.peek("html")
+        # Fragments are parsed into a document that a copy wouldn't keep.
+        if tree is not None and tree.getparent() is None:
+            # Copying the tree is much cheaper than parsing the page again.
+            derived["html"] = copy.deepcopy(tree)
+        clone._page = page._replace(forms={}, derived=DerivedValues(derived))
+        return clone
+
+    def _send_get(self, url, send, request_headers=()):
+        """Make a GET request, through the HTTP cache if it's enabled.
+
+        Arguments:
+            url (str): The url requested, including its query.
+            send: Function that makes the request. It's called with a dict
+                of extra request headers and must return the response.
+            request_headers: The headers the request is sent with, cookies
+                included, as (name, value) tuples.
+
+        Returns:
+            The response, which can be a cached one.
+        """
+        if self.http_cache is None:
+            return send({})
+        return self.http_cache.request(url, send, request_headers)
+
+    @_with_page_lock
     def visit(self, url):
-        self._do_method("get", url)
+        self._leave_page()
+        self._request("get", url)
+
+    def serialize(self, form, submitter=None, files=None):
+        """Get the data a form would send.
+
+        The form itself is left untouched. Buttons are left out, except
+        for the submitter. File inputs are opened for reading.
 
-    def serialize(self, form):
+        Arguments:
+            form: The lxml form element.
+            submitter (tuple): Name and value of the button that submitted
+                the form.
+            files (contextlib.ExitStack): Closes the opened files when it's
+                closed. Without it, closing them is up to the caller.
+
+        Returns:
+            dict
+        """
         data = {}
 
         for key in form.inputs.keys():
             form_input = form.inputs[key]
-            if getattr(form_input, "type", "") == "submit":
-                try:
-                    form.remove(form_input)
-                # Issue 595: throws ValueError: Element not child of this node
-                except ValueError:
-                    pass
-
-        for k, v in form.fields.items():
-            if v is None:
+            input_type = getattr(form_input, "type", "")
+            if input_type in _BUTTON_TYPES:
+                continue
+
+            value = form_input.value
+            if value is None:
                 continue
 
-            if isinstance(v, lxml.html.MultipleSelectOptions):
-                data[k] = list(v)
+            if isinstance(value, (lxml.html.MultipleSelectOptions, lxml.html.CheckboxValues)):
+                data[key] = list(value)
+            elif input_type == "file":
+                # The test clients read the file themselves, so it's never
+                # loaded into memory here.
+                upload = open(value, "rb")
+                if files is not None:
+                    files.enter_context(upload)
+                data[key] = upload
             else:
-                data[k] = v
+                data[key] = value
 
-        for key in form.inputs.keys():
-            form_input = form.inputs[key]
-            if getattr(form_input, "type", "") == "file" and key in data:
-                data[key] = open(data[key], "rb")
+        if submitter is not None:
+            name, value = submitter
+            data[name] = value
 
         return data
 
-    def submit(self, form):
+    def _form_request(self, form):
+        """Get the method and url a form is submitted with."""
         method = form.attrib.get("method", "get").lower()
         action = form.attrib.get("action", "")
 
@@ -99,34 +413,54 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
             url = parse.urljoin(self._url, action)
         else:
             url = self._url
-        self._url = url
-        data = self.serialize(form)
+        return method, url
+
+    @_with_page_lock
+    def submit(self, form, submitter=None):
+        method, url = self._form_request(form)
 
-        self._do_method(method, url, data=data)
+        # Uploaded files are closed as soon as the request is done.
+        with contextlib.ExitStack() as files:
+            data = self.serialize(form, submitter=submitter, files=files)
+
+            self._leave_page()
+            self._request(method, url, data=data)
         return self._response
 
-    def submit_data(self, form):
+    def submit_data(self, form, submitter=None):
         raise NotImplementedError(
             "%s doesn't support submitting then getting the data." % self.driver_name,
         )
 
-    def back(self):
+    @_with_page_lock
+    def back(self, revalidate: bool = False):
+        """Go back one page in the history.
+
+        Recently visited pages are kept in page_cache and restored without
+        making a request.
+
+        Arguments:
+            revalidate (bool): Request the page again, even if it's cached.
+        """
         if self._last_url_index >= 1:
+            self._save_page()
             self._last_url_index -= 1
-            self._do_method(
-                "get",
-                self._last_urls[self._last_url_index],
-                record_url=False,
-            )
+            self._go_to_history_entry(revalidate)
+
+    @_with_page_lock
+    def forward(self, revalidate: bool = False):
+        """Go forward one page in the history.
+
+        Recently visited pages are kept in page_cache and restored without
+        making a request.
 
-    def forward(self):
+        Arguments:
+            revalidate (bool): Request the page again, even if it's cached.
+        """
         if (self._last_url_index >= 0) and (self._last_url_index < len(self._last_urls) - 1):
+            self._save_page()
             self._last_url_index += 1
-            self._do_method(
-                "get",
-                self._last_urls[self._last_url_index],
-                record_url=False,
-            )
+            self._go_to_history_entry(revalidate)
 
     def reload(self):
         self.visit(self._url)
@@ -134,18 +468,118 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
     def quit(self):  # NOQA: A003
         pass
 
+    def _response_body(self, response):
+        """Body of a response, as bytes."""
+        return self.html.encode("utf-8")
+
+    def _response_chunks(self, response):
+        """Body of a response, as an iterable of bytes."""
+        return [self._response_body(response)]
+
+    def _response_headers(self, response):
+        """Headers of a response, as (name, value) tuples."""
+        return list(response.headers.items())
+
+    def _response_charset(self, response):
+        """Charset a response declares for its body, if any."""
+        return "utf-8"
+
+    def _page_body(self, page):
+        """Body of a page, read from its response only once.
+
+        Reading the body of a streamed response can't be done by two
+        threads at the same time, so every reader goes through the page.
+        """
+        return page.derived.get("content", lambda: self._response_body(page.response))
+
+    def _document_charset(self, page=None):
+        """Encoding of the body of a page, the current one by default.
+
+        Uses the charset the response declares, or sniffs the body if it
+        doesn't declare one.
+        """
+        page = page or self._page
+        return page.derived.get(
+            "charset",
+            lambda: normalize_charset(self._response_charset(page.response)) or sniff_charset(self._page_body(page)),
+        )
+
+    def _response_text(self, page=None):
+        """Body of a page, the current one by default, decoded only once."""
+        page = page or self._page
+        return page.derived.get(
+            "text",
+            lambda: self._page_body(page).decode(self._document_charset(page)),
+        )
+
+    def _incremental_parser(self, page=None):
+        """Get the incremental parser for a page, the current one by default.
+
+        Returns:
+            IncrementalParser, or None if incremental parsing is disabled,
+            not possible for this page, or its tree is already available.
+        """
+        page = page or self._page
+        if not self.incremental_parsing or "html" in page.derived:
+            return None
+
+        parser = page.derived.get(
+            "parser",
+            lambda: IncrementalParser(self._response_chunks(page.response), encoding=self._document_charset(page)),
+        )
+
+        if not parser.is_full_html:
+            return None
+        return parser
+
+    def _parse_response(self, page):
+        return parse_html(self._page_body(page), self._document_charset(page))
+
+    def _build_tree(self, page):
+        entry = None
+        if self.http_cache is not None:
+            entry = self.http_cache.entry_for(page.response)
+
+        if entry is not None:
+            # Cached responses are only parsed once, however often they're used.
+            return entry.tree(lambda: self._parse_response(page))
+
+        parser = self._incremental_parser(page)
+        if parser is not None:
+            return parser.finish()
+        return self._parse_response(page)
+
+    def _tree_of(self, page):
+        return page.derived.get("html", lambda: self._build_tree(page))
+
+    def _index_of(self, page):
+        return page.derived.get("index", lambda: DocumentIndex(self._tree_of(page)))
+
+    def _texts_of(self, page):
+        return page.derived.get("texts", lambda: TextIndex(self._tree_of(page)))
+
     @property
     def htmltree(self):
-        try:
-            return self._html
-        except AttributeError:
-            self._html = lxml.html.fromstring(self.html)
-            return self._html
+        return self._tree_of(self._page)
+
+    @property
+    def _document_index(self):
+        return self._index_of(self._page)
+
+    @property
+    def _text_index(self):
+        return self._texts_of(self._page)
 
     @property
     def title(self):
-        html = self.htmltree
-        return html.xpath("//title")[0].text_content().strip()
+        page = self._page
+        parser = self._incremental_parser(page)
+        if parser is not None:
+            title = parser.find_title()
+            if title is not None:
+                return title.text_content().strip()
+
+        return self._index_of(page).tags.get("title", [])[0].text_content().strip()
 
     @property
     def html(self):
@@ -157,9 +591,12 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
     def url(self):
         return self._url
 
+    def _evaluate(self, query, find_by="xpath"):
+        """Run a query against the current document using a compiled query."""
+        return self.query_cache.get(query, find_by)(self.htmltree)
+
     def find_option_by_value(self, value):
-        html = self.htmltree
-        element = html.xpath('//option[@value="%s"]' % value)[0]
+        element = self._evaluate('//option[@value="%s"]' % value)[0]
         control = LxmlControlElement(element.getparent(), self)
         return ElementList(
             [LxmlOptionElement(element, control)],
@@ -168,8 +605,7 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         )
 
     def find_option_by_text(self, text):
-        html = self.htmltree
-        element = html.xpath('//option[normalize-space(text())="%s"]' % text)[0]
+        element = self._evaluate('//option[normalize-space(text())="%s"]' % text)[0]
         control = LxmlControlElement(element.getparent(), self)
         return ElementList(
             [LxmlOptionElement(element, control)],
@@ -178,33 +614,96 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         )
 
     def find_by_css(self, css_selector):
-        xpath = CSSSelector(css_selector).path
-        return self.find_by_xpath(xpath, original_find="css", original_query=css_selector)
+        return self._find_by_query(
+            css_selector,
+            "css",
+            original_find="css",
+            original_query=css_selector,
+        )
 
     def find_by_xpath(self, xpath, original_find=None, original_query=None):
-        html = self.htmltree
+        return self._find_by_query(xpath, "xpath", original_find, original_query)
 
-        elements = []
-
-        for xpath_element in html.xpath(xpath):
-            if self._element_is_link(xpath_element):
-                return self._find_links_by_xpath(xpath)
-            elif self._element_is_control(xpath_element):
-                elements.append((LxmlControlElement, xpath_element))
-            else:
-                elements.append((LxmlElement, xpath_element))
+    def _find_by_query(self, query, query_type, original_find=None, original_query=None):
+        elements = self._evaluate(query, query_type)
 
         find_by = original_find or "xpath"
-        query = original_query or xpath
+        query = original_query or query
 
-        return ElementList(
-            [element_class(element, self) for element_class, element in elements],
-            find_by=find_by,
-            query=query,
-        )
+        return self._element_list(elements, find_by, query)
+
+    def _wrap(self, element):
+        """Wrap a raw lxml element in the matching splinter element."""
+        if self._element_is_link(element):
+            return LxmlLinkElement(element, self)
+        elif self._element_is_control(element):
+            return LxmlControlElement(element, self)
+        return LxmlElement(element, self)
+
+    def _element_list(self, elements, find_by, query):
+        """Lazily wrap raw lxml elements in an ElementList.
+
+        If any of the elements is a link, every element is treated as a link.
+        """
+        if any(self._element_is_link(element) for element in elements):
+            wrapper = partial(LxmlLinkElement, parent=self)
+        else:
+            wrapper = self._wrap
+
+        return ElementList(elements, find_by=find_by, query=query, wrapper=wrapper)
+
+    def iter_by_css(self, css_selector):
+        """Yield the elements matching a CSS selector, one at a time.
+
+        Unlike find_by_css(), no ElementList is built. Each element is
+        wrapped only when the generator reaches it.
+
+        Arguments:
+            css_selector (str): The CSS selector to search for.
+        """
+        for element in self._evaluate(css_selector, "css"):
+            yield self._wrap(element)
+
+    def iter_by_xpath(self, xpath):
+        """Yield the elements matching an XPath, one at a time.
+
+        Unlike find_by_xpath(), no ElementList is built. Each element is
+        wrapped only when the generator reaches it.
+
+        Arguments:
+            xpath (str): The XPath to search for.
+        """
+        for element in self._evaluate(xpath):
+            yield self._wrap(element)
+
+    def stream_by_tag(self, tag):
+        """Yield a detached copy of every element with a tag.
+
+        The response is parsed as it is read and each element is thrown away
+        once it has been copied, so memory use stays flat no matter how big
+        the page is. The page's htmltree is neither used nor built.
+
+        Example:
+
+            >>> for row in browser.stream_by_tag('tr'):
+            ...     cells = [cell.text for cell in row.children]
+
+        Arguments:
+            tag (str): Tag of the elements to yield.
+
+        Returns:
+            Iterator of :class:`StreamedElement <splinter.driver.streaming.StreamedElement>`
+        """
+        page = self._page
+        source = io.BytesIO(self._page_body(page))
+        return stream_elements(source, tag, encoding=self._document_charset(page))
 
     def find_by_tag(self, tag):
-        return self.find_by_xpath("//%s" % tag, original_find="tag", original_query=tag)
+        if not _PLAIN_TAG.match(tag):
+            return self.find_by_xpath("//%s" % tag, original_find="tag", original_query=tag)
+
+        elements = self._document_index.tags.get(tag, [])
+        return self._element_list(elements, "tag", tag)
 
     def find_by_value(self, value):
         elem = self.find_by_xpath(
@@ -217,36 +716,32 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         return self.find_by_xpath('//*[.="%s"]' % value)
 
     def find_by_text(self, text):
-        xpath_str = _concat_xpath_from_str(text)
-        return self.find_by_xpath(
-            xpath_str,
-            original_find="text",
-            original_query=text,
-        )
+        elements = self._text_index.find_text(text)
+        return self._element_list(elements, "text", text)
 
     def find_by_id(self, id_value):
-        return self.find_by_xpath(
-            '//*[@id="%s"][1]' % id_value,
-            original_find="id",
-            original_query=id_value,
-        )
+        page = self._page
+        parser = self._incremental_parser(page)
+        if parser is not None:
+            element = parser.find_by_id(id_value)
+            elements = [] if element is None else [element]
+            return self._element_list(elements, "id", id_value)
 
-    def find_by_name(self, name):
-        html = self.htmltree
+        elements = self._index_of(page).ids.get(id_value, [])
+        return self._element_list(elements[:1], "id", id_value)
 
+    def find_by_name(self, name):
         xpath = '//*[@name="%s"]' % name
-        elements = []
-
-        for xpath_element in html.xpath(xpath):
-            elements.append(xpath_element)
+        elements = self._document_index.names.get(name, [])
 
         find_by = "name"
         query = xpath
 
         return ElementList(
-            [LxmlControlElement(element, self) for element in elements],
+            elements,
             find_by=find_by,
             query=query,
+            wrapper=partial(LxmlControlElement, parent=self),
         )
 
     def set_find_strategy(self, strategy):
@@ -269,41 +764,35 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         )
         self.find(name).fill(value)
 
-    def fill_form(self, field_values, form_id=None, name=None, ignore_missing=False):  # NOQA C901
-        form = None
-
+    def fill_form(self, field_values, form_id=None, name=None, ignore_missing=False):
+        scope = None
         if name is not None:
-            form = self.find_by_name(name)
+            # find_by_name() finds controls, which wrap their element in _control.
+            forms = self.find_by_name(name)
+            scope = forms.first._control if forms else None
         if form_id is not None:
-            form = self.find_by_id(form_id)
-
-        for name, value in field_values.items():
-            try:
-                if form:
-                    element = form.find_by_name(name)
-                    control = element.first._element
-                else:
-                    element = self.find_by_name(name)
-                    control = element.first._control
-                control_type = control.get("type")
-                if control_type == "checkbox":
-                    if value:
-                        control.value = value  # control.options
-                    else:
-                        control.value = []
-                elif control_type == "radio":
-                    control.value = value  # [option for option in control.options if option == value]
-                elif control_type == "select":
-                    if isinstance(value, list):
-                        control.value = value
-                    else:
-                        control.value = [value]
-                else:
-                    # text, textarea, password, tel
-                    control.value = value
-            except ElementDoesNotExist as e:
-                if not ignore_missing:
-                    raise ElementDoesNotExist(e)  # NOQA: TRY200
+            forms = self.find_by_id(form_id)
+            scope = forms.first._element if forms else None
+
+        if scope is None:
+            scope = self.htmltree
+
+        # Find every control once, instead of searching for each field.
+        controls = {}
+        for control in scope.iter("input", "select", "textarea"):
+            control_name = control.get("name")
+            if control_name is not None:
+                controls.setdefault(control_name, []).append(control)
+
+        missing = [field for field in field_values if field not in controls]
+        if missing and not ignore_missing:
+            raise ElementDoesNotExist(
+                "No elements were found with name {}".format(", ".join(f'"{field}"' for field in missing)),
+            )
+
+        for field, value in field_values.items():
+            if field in controls:
+                _fill_controls(controls[field], value)
 
     def choose(self, name, value):
         self.find_by_name(name).first._control.value = value
@@ -327,44 +816,50 @@ class LxmlDriver(ElementPresentMixIn, DriverAPI):
         control.value = file_path
 
     def _find_links_by_xpath(self, xpath):
-        html = self.htmltree
-        links = html.xpath(xpath)
+        links = self._evaluate(xpath)
         return ElementList(
-            [LxmlLinkElement(link, self) for link in links],
+            links,
             find_by="xpath",
             query=xpath,
+            wrapper=partial(LxmlLinkElement, parent=self),
         )
 
-    def select(self, name, value):
-        self.find_by_name(name).first._control.value = value
+    def _find_links_by_text(self, text):
+        links = self._text_index.find_links_by_text(text)
+        return ElementList(
+            links,
+            find_by="link by text",
+            query=text,
+            wrapper=partial(LxmlLinkElement, parent=self),
+        )
 
-    def is_text_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
+    def _find_links_by_partial_text(self, partial_text):
+        links = self._text_index.find_links_by_partial_text(partial_text)
+        return ElementList(
+            links,
+            find_by="link by partial text",
+            query=partial_text,
+            wrapper=partial(LxmlLinkElement, parent=self),
+        )
 
-        while time.time() < end_time:
-            if self._is_text_present(text):
-                return True
-        return False
+    def select(self, name, value):
+        self.find_by_name(name).first._control.value = value
 
-    def _is_text_present(self, text):
-        try:
-            body = self.find_by_tag("body").first
-            return text in body.text
-        except ElementDoesNotExist:
-            # This exception will be thrown if the body tag isn't present
-            # This has occasionally been observed. Assume that the
-            # page isn't fully loaded yet
-            return False
+    def _body_text(self):
+        page = self._page
+        return page.derived.get("body", lambda: body_text(self._tree_of(page)))
 
-    def is_text_not_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
+    def is_element_present_by_name(self, name, wait_time=None, wait_policy=None):
+        parser = self._incremental_parser()
+        if parser is not None:
+            return parser.has_name(name)
+        return super().is_element_present_by_name(name, wait_time, wait_policy)
 
-        while time.time() < end_time:
-            if not self._is_text_present(text):
-                return True
-        return False
+    def is_element_present_by_tag(self, tag, wait_time=None, wait_policy=None):
+        parser = self._incremental_parser()
+        if parser is not None and _PLAIN_TAG.match(tag):
+            return parser.has_tag(tag)
+        return super().is_element_present_by_tag(tag, wait_time, wait_policy)
 
     def _element_is_link(self, element):
         return element.tag == "a"
@@ -385,25 +880,29 @@ class LxmlElement(ElementAPI):
     def __getitem__(self, attr):
         return self._element.attrib[attr]
 
+    def _evaluate(self, query, find_by="xpath"):
+        """Run a query inside this element using a compiled query."""
+        return query_cache.get(query, find_by)(self._element)
+
     def find_by_css(self, selector):
-        elements = self._element.cssselect(selector)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate(selector, "css_html")
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     def find_by_xpath(self, selector):
-        elements = self._element.xpath(selector)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate(selector)
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     def find_by_name(self, name):
-        elements = self._element.cssselect('[name="%s"]' % name)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate('[name="%s"]' % name, "css_html")
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     def find_by_tag(self, name):
-        elements = self._element.cssselect(name)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate(name, "css_html")
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     def find_by_value(self, value):
-        elements = self._element.cssselect('[value="%s"]' % value)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate('[value="%s"]' % value, "css_html")
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     def find_by_text(self, text):
         # Add a period to the xpath to search only inside the parent.
@@ -411,8 +910,8 @@ class LxmlElement(ElementAPI):
         return self.find_by_xpath(xpath_str)
 
     def find_by_id(self, id):  # NOQA: A002
-        elements = self._element.cssselect("#%s" % id)
-        return ElementList([self.__class__(element, self) for element in elements])
+        elements = self._evaluate("#%s" % id, "css_html")
+        return ElementList(elements, wrapper=partial(self.__class__, parent=self))
 
     @property
     def value(self):
@@ -434,7 +933,21 @@ class LxmlElement(ElementAPI):
             re.MULTILINE | re.DOTALL,
         ).group(1)
 
+    def _get_driver(self):
+        parent = self.parent
+        while isinstance(parent, LxmlElement):
+            parent = parent.parent
+        return parent
+
     def has_class(self, class_name):
+        if class_name in self._element.get("class", "").split():
+            return True
+
+        # find_class() also matches descendants, so keep that behaviour,
+        # but answer it from the document index when it's available.
+        index = self._get_driver()._document_index
+        if index.covers(self._element):
+            return index.has_class_within(self._element, class_name)
         return len(self._element.find_class(class_name)) > 0
 
 
@@ -472,16 +985,14 @@ class LxmlControlElement(LxmlElement):
     def click(self):
         parent_form = self._get_parent_form()
 
+        submitter = None
         if self._control.get("type") == "submit":
             name = self._control.get("name")
 
             if name:
-                value = self._control.get("value", "")
-                parent_form.append(
-                    lxml.html.Element("input", name=name, value=value, type="hidden"),
-                )
+                submitter = (name, self._control.get("value", ""))
 
-        return self.parent.submit_data(parent_form)
+        return self.parent.submit_data(parent_form, submitter=submitter)
 
     def fill(self, value):
         parent_form = self._get_parent_form()
@@ -491,8 +1002,11 @@ class LxmlControlElement(LxmlElement):
         self._control.value = value
 
     def _get_parent_form(self):
+        page = self.parent._page
+        # The form has to be complete before its fields can be used.
+        self.parent._tree_of(page)
         parent_form = next(self._control.iterancestors("form"))
-        return self.parent._forms.setdefault(parent_form._name(), parent_form)
+        return page.forms.setdefault(parent_form._name(), parent_form)
 
     def check(self):
         self._control.value = ["checked"]
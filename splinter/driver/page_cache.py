@@ -0,0 +1,124 @@
+from collections import namedtuple
+from collections import OrderedDict
+from typing import Optional
+
+from splinter.driver.page_state import PageState
+
+
+PageCacheInfo = namedtuple(
+    "PageCacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize", "maxbytes", "currbytes"],
+)
+
+DEFAULT_MAXBYTES = 64 * 1024 * 1024
+
+
+class PageCache:
+    """Bounded cache of recently visited pages, for back() and forward().
+
+    Each page is stored under its position in the driver's history, along
+    with its url so that an entry is never used for a different page. When
+    either limit is exceeded, the least recently used pages are evicted.
+
+    Example:
+
+        >>> browser.back()
+        >>> browser.page_cache.info()
+        PageCacheInfo(hits=1, misses=0, evictions=0, maxsize=10, ...)
+
+    Arguments:
+        maxsize (int): Maximum number of pages to keep. 0 disables the cache.
+        maxbytes (int): Maximum total size of the response bodies kept.
+    """
+
+    def __init__(self, maxsize: int = 10, maxbytes: int = DEFAULT_MAXBYTES) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.currbytes = 0
+        self._pages: OrderedDict = OrderedDict()
+
+    def put(self, index: int, url: str, page: PageState, size: int) -> None:
+        """Store a page, replacing whatever was stored for its history entry.
+
+        Arguments:
+            index (int): Position of the page in the history.
+            url (str): Url of the page.
+            page (PageState): The page to restore.
+            size (int): Size of the page's response body, in bytes.
+        """
+        self._remove(index)
+
+        if not self.maxsize or size > self.maxbytes:
+            return
+
+        self._pages[index] = (url, page, size)
+        self.currbytes += size
+
+        while len(self._pages) > self.maxsize or self.currbytes > self.maxbytes:
+            oldest = next(iter(self._pages))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def get(self, index: int, url: str) -> Optional[PageState]:
+        """Get the page stored for a history entry.
+
+        Returns:
+            The stored PageState, or None if the page isn't cached.
+        """
+        try:
+            stored_url, page, _size = self._pages[index]
+        except KeyError:
+            stored_url = page = None
+
+        if page is None or stored_url != url:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._pages.move_to_end(index)
+        return page
+
+    def discard_after(self, index: int) -> None:
+        """Remove the pages of every history entry after index.
+
+        Drivers call this when navigating to a new page, since that throws
+        away the forward history.
+        """
+        for key in [key for key in self._pages if key > index]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every page and reset the counters."""
+        self._pages.clear()
+        self.currbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> PageCacheInfo:
+        """Report how effective the cache has been.
+
+        Returns:
+            PageCacheInfo: hits, misses, evictions, maxsize, currsize,
+            maxbytes and currbytes.
+        """
+        return PageCacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._pages),
+            self.maxbytes,
+            self.currbytes,
+        )
+
+    def _remove(self, index: int) -> None:
+        stored = self._pages.pop(index, None)
+        if stored is not None:
+            self.currbytes -= stored[2]
+
+    def __len__(self) -> int:
+        return len(self._pages)
@@ -0,0 +1,75 @@
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+
+from splinter.request_handler.status_code import StatusCode
+
+
+class DerivedValues:
+    """Values derived from a response, like its parsed tree, each built once.
+
+    Building a value takes a lock, so threads asking for it at the same
+    time all get the same one. Once built, it's read without locking.
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None) -> None:
+        self._values: Dict[str, Any] = dict(values or {})
+        # Reentrant, since building a value can need another one.
+        self._lock = threading.RLock()
+
+    def get(self, name: str, build: Callable[[], Any]) -> Any:
+        """Get a value, building it the first time it's asked for.
+
+        Arguments:
+            name (str): Name of the value.
+            build: Function returning the value.
+        """
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        with self._lock:
+            try:
+                return self._values[name]
+            except KeyError:
+                value = self._values[name] = build()
+                return value
+
+    def peek(self, name: str) -> Any:
+        """Get a value if it's been built, without building it."""
+        return self._values.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._values
+
+
+class PageState(NamedTuple):
+    """Everything a driver knows about the page it shows.
+
+    Navigation builds a new PageState, then swaps it in with a single
+    assignment. A reader that takes the driver's page once sees one page
+    from start to end, never parts of two. What's derived from the
+    response is kept in derived, so it always belongs to the same page.
+
+    Attributes:
+        response: The client's response, or None before the first page.
+        url (str): Url of the page.
+        status_code (StatusCode): Status of the response.
+        forms (dict): Forms of the page that are being filled.
+        derived (DerivedValues): Values derived from the response.
+    """
+
+    response: Any
+    url: str
+    status_code: Optional[StatusCode]
+    forms: Dict[str, Any]
+    derived: DerivedValues
+
+    @classmethod
+    def load(cls, response, url: str, status_code: Optional[StatusCode] = None) -> "PageState":
+        """Build the state of a page that was just received."""
+        return cls(response, url, status_code, {}, DerivedValues())
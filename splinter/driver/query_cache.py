@@ -0,0 +1,101 @@
+import threading
+from collections import namedtuple
+from collections import OrderedDict
+from typing import Callable
+from typing import Dict
+
+import lxml.etree
+from lxml.cssselect import CSSSelector
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+_COMPILERS: Dict[str, Callable[[str], lxml.etree.XPath]] = {
+    "xpath": lxml.etree.XPath,
+    # CSSSelector is a subclass of XPath, so both compile to the same type.
+    "css": CSSSelector,
+    # lxml.html elements use the html translator for cssselect().
+    "css_html": lambda query: CSSSelector(query, translator="html"),
+}
+
+
+class QueryCache:
+    """Bounded LRU cache of compiled XPath expressions.
+
+    Compiled queries are keyed by the find strategy and the query, so the
+    same CSS selector and XPath string never get compiled twice while they
+    are in the cache. The cache can be used from several threads at once.
+
+    Example:
+
+        >>> cache = QueryCache(maxsize=128)
+        >>> find_links = cache.get('//a', 'xpath')
+        >>> find_links(browser.htmltree)
+        >>> cache.info()
+        CacheInfo(hits=0, misses=1, maxsize=128, currsize=1)
+
+    Arguments:
+        maxsize (int): Maximum number of compiled queries to keep.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._compiled: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, find_by: str = "xpath") -> lxml.etree.XPath:
+        """Get the compiled version of a query, compiling it if needed.
+
+        Arguments:
+            query (str): The XPath expression or CSS selector.
+            find_by (str): One of 'xpath', 'css' or 'css_html'.
+
+        Returns:
+            lxml.etree.XPath
+        """
+        key = (find_by, query)
+
+        with self._lock:
+            try:
+                compiled = self._compiled[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._compiled.move_to_end(key)
+                return compiled
+
+        # Compiled outside the lock, so a slow query doesn't block the others.
+        compiled = _COMPILERS[find_by](query)
+
+        with self._lock:
+            compiled = self._compiled.setdefault(key, compiled)
+            if len(self._compiled) > self.maxsize:
+                self._compiled.popitem(last=False)
+
+        return compiled
+
+    def clear(self) -> None:
+        """Remove every compiled query and reset the counters."""
+        with self._lock:
+            self._compiled.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report how effective the cache has been.
+
+        Returns:
+            CacheInfo: hits, misses, maxsize and currsize.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._compiled))
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+#: Cache shared by every lxml based driver and element.
+query_cache = QueryCache()
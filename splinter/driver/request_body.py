@@ -0,0 +1,126 @@
+import io
+import mimetypes
+import os
+import uuid
+from pathlib import PurePath
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+from urllib.parse import urlencode
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _form_items(data) -> Iterator[Tuple[str, object]]:
+    for name, value in data.items():
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                yield name, item
+        else:
+            yield name, value
+
+
+def _is_file(value) -> bool:
+    return hasattr(value, "read")
+
+
+class _ChunkReader(io.RawIOBase):
+    """Raw stream over an iterator of bytes."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b""
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class RequestBody:
+    """Encoded body of a form submission, produced a chunk at a time.
+
+    Uploaded files are read in chunks while the body is sent, so they are
+    never loaded into memory as a whole. The length of the body is known
+    up front, so it can still be sent with a Content-Length header.
+
+    Arguments:
+        content_type (str): Value of the Content-Type header.
+        parts (list): Bytes and file objects, in order.
+    """
+
+    def __init__(self, content_type: str, parts: List[Union[bytes, object]]) -> None:
+        self.content_type = content_type
+        self._parts = parts
+
+    @classmethod
+    def from_form(cls, data) -> "RequestBody":
+        """Encode the data returned by LxmlDriver.serialize().
+
+        Forms with files are encoded as multipart/form-data, others as
+        application/x-www-form-urlencoded.
+        """
+        items = list(_form_items(data or {}))
+        if not any(_is_file(value) for _name, value in items):
+            body = urlencode(items).encode("ascii")
+            return cls("application/x-www-form-urlencoded", [body])
+
+        boundary = uuid.uuid4().hex
+        parts: List[Union[bytes, object]] = []
+        for name, value in items:
+            if _is_file(value):
+                filename = PurePath(getattr(value, "name", name)).name
+                content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                parts.append(
+                    (
+                        f"--{boundary}\r\n"
+                        f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                        f"Content-Type: {content_type}\r\n\r\n"
+                    ).encode(),
+                )
+                parts.append(value)
+                parts.append(b"\r\n")
+            else:
+                parts.append(
+                    f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode(),
+                )
+        parts.append(f"--{boundary}--\r\n".encode())
+        return cls(f"multipart/form-data; boundary={boundary}", parts)
+
+    def __len__(self) -> int:
+        length = 0
+        for part in self._parts:
+            if isinstance(part, bytes):
+                length += len(part)
+            else:
+                length += os.fstat(part.fileno()).st_size
+        return length
+
+    def chunks(self) -> Iterator[bytes]:
+        """Produce the body, reading files a chunk at a time."""
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+
+            part.seek(0)
+            while True:
+                chunk = part.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def reader(self) -> io.BufferedReader:
+        """Get a file object that reads the body, like WSGI's wsgi.input."""
+        return io.BufferedReader(_ChunkReader(self.chunks()), buffer_size=CHUNK_SIZE)
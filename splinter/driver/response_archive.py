@@ -0,0 +1,202 @@
+import hashlib
+import json
+import zipfile
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from splinter.driver.request_body import _form_items
+from splinter.driver.request_body import CHUNK_SIZE
+from splinter.exceptions import ResponseArchiveMismatch
+
+
+RECORD = "record"
+REPLAY = "replay"
+
+_INDEX = "index.json"
+_VERSION = 2
+
+
+class ArchivedResponse(NamedTuple):
+    """A response saved in a ResponseArchive.
+
+    Attributes:
+        url (str): Url of the page, after redirects.
+        status_code (int): Status code of the response.
+        headers (list): Headers of the response, as (name, value) tuples.
+        body (bytes): Body of the response.
+        history (tuple): Urls the request went through, redirects included.
+            Empty for archives saved before they were recorded.
+    """
+
+    url: str
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    history: Tuple[str, ...] = ()
+
+
+def body_hash(data) -> str:
+    """Hash the data of a request, as returned by LxmlDriver.serialize().
+
+    Uploaded files are hashed by content, so the same form submitted twice
+    gets the same hash.
+    """
+    digest = hashlib.sha256()
+    if not data:
+        return digest.hexdigest()
+
+    items = sorted(_form_items(data), key=lambda item: item[0])
+    for name, value in items:
+        digest.update(name.encode() + b"\0")
+        if hasattr(value, "read"):
+            value.seek(0)
+            chunk = value.read(CHUNK_SIZE)
+            while chunk:
+                digest.update(chunk)
+                chunk = value.read(CHUNK_SIZE)
+            value.seek(0)
+        else:
+            digest.update(str(value).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseArchive:
+    """Responses recorded from an app, to be served again without it.
+
+    In record mode, the driver calls the app as usual and every response is
+    added to the archive. In replay mode, the driver never calls the app,
+    responses are served from the archive. Requests are matched by method,
+    url and a hash of their body. A request that was made several times
+    gets its responses back in the order they were recorded.
+
+    The archive is a zip file. Identical bodies are only stored once.
+
+    Example:
+
+        >>> with ResponseArchive('responses.zip', mode='record') as archive:
+        ...     browser = Browser('django', response_archive=archive)
+        ...     browser.visit('/catalog')
+        >>> browser = Browser('django', response_archive=ResponseArchive('responses.zip'))
+        >>> browser.visit('/catalog')  # Django isn't involved
+
+    Arguments:
+        path (str): Path of the archive file.
+        mode (str): "record" or "replay".
+        strict (bool): In replay mode, raise ResponseArchiveMismatch for
+            requests that aren't in the archive. Otherwise, they're sent
+            to the app and listed in mismatches.
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY, strict: bool = True) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f'mode must be "{RECORD}" or "{REPLAY}", not "{mode}"')
+
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.mismatches: List[Tuple[str, str, str]] = []
+        self._responses: Dict[Tuple[str, str, str], List[ArchivedResponse]] = {}
+        self._served: Dict[Tuple[str, str, str], int] = {}
+
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    def _load(self) -> None:
+        with zipfile.ZipFile(self.path) as archive:
+            index = json.loads(archive.read(_INDEX))
+            bodies: Dict[str, bytes] = {}
+            for entry in index["entries"]:
+                digest = entry["body"]
+                if digest not in bodies:
+                    bodies[digest] = archive.read(f"bodies/{digest}")
+                key = (entry["method"], entry["url"], entry["body_hash"])
+                self._responses.setdefault(key, []).append(
+                    ArchivedResponse(
+                        entry["final_url"],
+                        entry["status_code"],
+                        [tuple(header) for header in entry["headers"]],
+                        bodies[digest],
+                        tuple(entry.get("history", ())),
+                    ),
+                )
+
+    def record(self, method: str, url: str, data, response: ArchivedResponse, data_hash: Optional[str] = None) -> None:
+        """Add the response to a request to the archive.
+
+        Arguments:
+            data_hash (str): body_hash() of data, taken before the request
+                was made. Files uploaded by a request can't be read once
+                it's done.
+        """
+        key = (method.upper(), url, body_hash(data) if data_hash is None else data_hash)
+        self._responses.setdefault(key, []).append(response)
+
+    def replay(self, method: str, url: str, data, data_hash: Optional[str] = None) -> Optional[ArchivedResponse]:
+        """Get the recorded response to a request.
+
+        Arguments:
+            data_hash (str): body_hash() of data, if it was already taken.
+
+        Returns:
+            ArchivedResponse, or None if the request isn't in the archive
+            and the archive isn't strict.
+
+        Raises:
+            ResponseArchiveMismatch: The request isn't in a strict archive.
+        """
+        key = (method.upper(), url, body_hash(data) if data_hash is None else data_hash)
+        responses = self._responses.get(key)
+        if not responses:
+            self.mismatches.append(key)
+            if self.strict:
+                raise ResponseArchiveMismatch(f"No response was recorded for {key[0]} {url}")
+            return None
+
+        # Once every response was served, the last one is served again.
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return responses[min(served, len(responses) - 1)]
+
+    def save(self) -> None:
+        """Write the recorded responses to the archive file."""
+        entries = []
+        bodies: Dict[str, bytes] = {}
+        for (method, url, data_hash), responses in self._responses.items():
+            for response in responses:
+                digest = hashlib.sha256(response.body).hexdigest()
+                bodies[digest] = response.body
+                entries.append(
+                    {
+                        "method": method,
+                        "url": url,
+                        "body_hash": data_hash,
+                        "final_url": response.url,
+                        "status_code": response.status_code,
+                        "headers": response.headers,
+                        "body": digest,
+                        "history": response.history,
+                    },
+                )
+
+        with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(_INDEX, json.dumps({"version": _VERSION, "entries": entries}))
+            for digest, body in bodies.items():
+                archive.writestr(f"bodies/{digest}", body)
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.recording and exc_type is None:
+            self.save()
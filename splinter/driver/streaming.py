@@ -0,0 +1,81 @@
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import lxml.etree
+
+
+class StreamedElement(NamedTuple):
+    """A detached copy of an element found while streaming a document.
+
+    It holds no reference to the parsed tree, so keeping it around doesn't
+    keep the document in memory.
+
+    Attributes:
+        tag: Tag of the element.
+        attrib: Attributes of the element.
+        text: Text content of the element and its descendants.
+        children: Detached copies of the element's child elements.
+    """
+
+    tag: str
+    attrib: Dict[str, str]
+    text: str
+    children: Tuple["StreamedElement", ...]
+
+    def __getitem__(self, attr):
+        """Get an attribute, the same way elements do."""
+        if isinstance(attr, str):
+            return self.attrib[attr]
+        return tuple.__getitem__(self, attr)
+
+
+def _detach(element) -> StreamedElement:
+    return StreamedElement(
+        tag=element.tag,
+        attrib=dict(element.attrib),
+        text="".join(element.itertext()),
+        children=tuple(_detach(child) for child in element if isinstance(child.tag, str)),
+    )
+
+
+def stream_elements(
+    source: BinaryIO,
+    tag: str,
+    encoding: Optional[str] = None,
+) -> Iterator[StreamedElement]:
+    """Yield a detached copy of every element with a tag.
+
+    Elements are yielded as soon as they are closed. That is document order,
+    except that an element nested in another match comes before it.
+
+    The document is parsed with lxml.etree.iterparse(). Every matched
+    element is cleared once it has been copied, along with anything parsed
+    before it, so memory use stays flat however large the document is.
+
+    Arguments:
+        source: The HTML document, as a binary file object.
+        tag (str): Tag of the elements to yield.
+        encoding (str): Encoding of the document.
+    """
+    for _event, element in lxml.etree.iterparse(
+        source,
+        events=("end",),
+        tag=tag,
+        html=True,
+        encoding=encoding,
+    ):
+        yield _detach(element)
+
+        # A match inside another match is cleared along with the outer one.
+        if any(ancestor.tag == tag for ancestor in element.iterancestors()):
+            continue
+
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
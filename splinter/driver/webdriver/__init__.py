@@ -4,12 +4,12 @@
 import os
 import re
 import tempfile
-import time
 import warnings
 from contextlib import contextmanager
 from typing import Optional
 
 from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import JavascriptException
 from selenium.common.exceptions import MoveTargetOutOfBoundsException
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import StaleElementReferenceException
@@ -24,11 +24,16 @@ from selenium.webdriver.support.ui import WebDriverWait
 from splinter.driver import DriverAPI
 from splinter.driver import ElementAPI
 from splinter.driver.find_links import FindLinks
+from splinter.driver.webdriver import bulk_read
+from splinter.driver.webdriver import mutation_observer
 from splinter.driver.webdriver.cookie_manager import CookieManager
 from splinter.driver.xpath_utils import _concat_xpath_from_str
 from splinter.element_list import ElementList
 from splinter.exceptions import ElementDoesNotExist
 from splinter.retry import _retry
+from splinter.retry import deadline
+from splinter.retry import get_wait_policy
+from splinter.retry import remaining_time
 
 
 # Patch contextmanager onto Selenium's Alert
@@ -40,6 +45,14 @@ def alert_exit(self, type, value, traceback):  # NOQA: A002
     pass
 
 
+# Only the answer crosses the wire, not the text of the page.
+_HAS_TEXT_SCRIPT = (
+    mutation_observer.TEXT_FUNCTIONS
+    + """
+return hasPageText(arguments[1] ? 'textContent' : 'innerText', arguments[0]);
+"""
+)
+
 Alert.__enter__ = alert_enter
 Alert.__exit__ = alert_exit
 Alert.fill_with = Alert.send_keys
@@ -246,13 +259,27 @@ def find_by(
     """
     find_by = original_find or finder_kwargs["by"]
     query = original_query or finder_kwargs.get("value")
+    wait_time = self.wait_time if wait_time is None else wait_time
+
+    with deadline(wait_time):
+        if wait_time and self.observe_mutations:
+            mutation_observer.wait_for_elements(
+                self.driver,
+                finder,
+                finder_kwargs,
+                mutation_observer.PRESENT,
+                remaining_time(wait_time),
+                get_wait_policy(self.wait_policy).poll_interval,
+            )
 
-    elements = _retry(
-        _safe_find,
-        [finder],
-        {"finder_kwargs": finder_kwargs},
-        timeout=self.wait_time,
-    )
+        # Also after observing: the search decides, with whatever time is left.
+        elements = _retry(
+            _safe_find,
+            [finder],
+            {"finder_kwargs": finder_kwargs},
+            timeout=remaining_time(wait_time),
+            wait_policy=self.wait_policy,
+        )
 
     elem_list = [self.element_class(elem, self, finder_kwargs) for elem in elements]
     return ElementList(elem_list, find_by=find_by, query=query)
@@ -264,6 +291,9 @@ class BaseWebDriver(DriverAPI):
 
     def __init__(self, driver=None, wait_time=2):
         self.wait_time = wait_time
+        config = getattr(self, "config", None)
+        self.wait_policy = config.wait_policy if config is not None else None
+        self.observe_mutations = config.observe_mutations if config is not None else False
 
         self.links = FindLinks(self)
 
@@ -322,65 +352,79 @@ class BaseWebDriver(DriverAPI):
     def evaluate_script(self, script, *args):
         return self.driver.execute_script("return %s" % script, *args)
 
-    def is_element_present(self, finder, selector, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
+    def is_element_present(self, finder, selector, wait_time=None, wait_policy=None):
+        wait_time = self.wait_time if wait_time is None else wait_time
 
-        while time.time() < end_time:
-            if finder(selector, wait_time=wait_time):
-                return True
+        with deadline(wait_time):
+            for _ in get_wait_policy(wait_policy, self.wait_policy).attempts(wait_time):
+                if finder(selector, wait_time=wait_time):
+                    return True
         return False
 
-    def is_element_not_present(self, finder, selector, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
-
-        while time.time() < end_time:
-            if not finder(selector, wait_time=0):
-                return True
+    def is_element_not_present(self, finder, selector, wait_time=None, wait_policy=None):
+        wait_time = self.wait_time if wait_time is None else wait_time
+
+        policy = get_wait_policy(wait_policy, self.wait_policy)
+
+        with deadline(wait_time):
+            for _ in policy.attempts(wait_time):
+                elements = finder(selector, wait_time=0)
+                if not elements:
+                    return True
+
+                if self.observe_mutations and mutation_observer.wait_for_elements(
+                    self.driver,
+                    self.driver.find_elements,
+                    elements.first._finder_kwargs,
+                    mutation_observer.ABSENT,
+                    remaining_time(wait_time),
+                    policy.poll_interval,
+                ):
+                    if not finder(selector, wait_time=0):
+                        return True
         return False
 
-    def is_element_present_by_css(self, css_selector, wait_time=None):
-        return self.is_element_present(self.find_by_css, css_selector, wait_time)
+    def is_element_present_by_css(self, css_selector, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_css, css_selector, wait_time, wait_policy)
 
-    def is_element_not_present_by_css(self, css_selector, wait_time=None):
-        return self.is_element_not_present(self.find_by_css, css_selector, wait_time)
+    def is_element_not_present_by_css(self, css_selector, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_css, css_selector, wait_time, wait_policy)
 
-    def is_element_present_by_xpath(self, xpath, wait_time=None):
-        return self.is_element_present(self.find_by_xpath, xpath, wait_time)
+    def is_element_present_by_xpath(self, xpath, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_xpath, xpath, wait_time, wait_policy)
 
-    def is_element_not_present_by_xpath(self, xpath, wait_time=None):
-        return self.is_element_not_present(self.find_by_xpath, xpath, wait_time)
+    def is_element_not_present_by_xpath(self, xpath, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_xpath, xpath, wait_time, wait_policy)
 
-    def is_element_present_by_tag(self, tag, wait_time=None):
-        return self.is_element_present(self.find_by_tag, tag, wait_time)
+    def is_element_present_by_tag(self, tag, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_tag, tag, wait_time, wait_policy)
 
-    def is_element_not_present_by_tag(self, tag, wait_time=None):
-        return self.is_element_not_present(self.find_by_tag, tag, wait_time)
+    def is_element_not_present_by_tag(self, tag, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_tag, tag, wait_time, wait_policy)
 
-    def is_element_present_by_name(self, name, wait_time=None):
-        return self.is_element_present(self.find_by_name, name, wait_time)
+    def is_element_present_by_name(self, name, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_name, name, wait_time, wait_policy)
 
-    def is_element_not_present_by_name(self, name, wait_time=None):
-        return self.is_element_not_present(self.find_by_name, name, wait_time)
+    def is_element_not_present_by_name(self, name, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_name, name, wait_time, wait_policy)
 
-    def is_element_present_by_value(self, value, wait_time=None):
-        return self.is_element_present(self.find_by_value, value, wait_time)
+    def is_element_present_by_value(self, value, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_value, value, wait_time, wait_policy)
 
-    def is_element_not_present_by_value(self, value, wait_time=None):
-        return self.is_element_not_present(self.find_by_value, value, wait_time)
+    def is_element_not_present_by_value(self, value, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_value, value, wait_time, wait_policy)
 
-    def is_element_present_by_text(self, text, wait_time=None):
-        return self.is_element_present(self.find_by_text, text, wait_time)
+    def is_element_present_by_text(self, text, wait_time=None, wait_policy=None):
+        return self.is_element_present(self.find_by_text, text, wait_time, wait_policy)
 
-    def is_element_not_present_by_text(self, text, wait_time=None):
-        return self.is_element_not_present(self.find_by_text, text, wait_time)
+    def is_element_not_present_by_text(self, text, wait_time=None, wait_policy=None):
+        return self.is_element_not_present(self.find_by_text, text, wait_time, wait_policy)
 
-    def is_element_present_by_id(self, id, wait_time=None):  # NOQA: A002
-        return self.is_element_present(self.find_by_id, id, wait_time)
+    def is_element_present_by_id(self, id, wait_time=None, wait_policy=None):  # NOQA: A002
+        return self.is_element_present(self.find_by_id, id, wait_time, wait_policy)
 
-    def is_element_not_present_by_id(self, id, wait_time=None):  # NOQA: A002
-        return self.is_element_not_present(self.find_by_id, id, wait_time)
+    def is_element_not_present_by_id(self, id, wait_time=None, wait_policy=None):  # NOQA: A002
+        return self.is_element_not_present(self.find_by_id, id, wait_time, wait_policy)
 
     def get_alert(self, wait_time=None):
         wait_time = wait_time or self.wait_time
@@ -391,33 +435,53 @@ class BaseWebDriver(DriverAPI):
         except TimeoutException:
             return None
 
-    def _is_text_present(self, text):
+    def _is_text_present(self, text, text_content=False):
         try:
-            self.find_by_tag("body").text.index(text)
-            return True
-        except (NoSuchElementException, StaleElementReferenceException, ValueError):
-            # NoSuchElementException will be thrown if the body tag isn't present
-            # Can occur if the page isn't fully loaded yet.
-            # StaleElementReferenceException will be thrown if the page changes quickly
-            pass
-        return False
-
-    def is_text_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
+            return bool(self.driver.execute_script(_HAS_TEXT_SCRIPT, text, text_content))
+        except (JavascriptException, StaleElementReferenceException):
+            # The script can fail while the page is being replaced.
+            return False
 
-        while time.time() < end_time:
-            if self._is_text_present(text):
-                return True
+    def is_text_present(self, text, wait_time=None, wait_policy=None, text_content=False):
+        wait_time = self.wait_time if wait_time is None else wait_time
+
+        policy = get_wait_policy(wait_policy, self.wait_policy)
+
+        with deadline(wait_time):
+            if wait_time and self.observe_mutations:
+                mutation_observer.wait_for_text(
+                    self.driver,
+                    text,
+                    mutation_observer.TEXT_PRESENT,
+                    remaining_time(wait_time),
+                    text_content,
+                    policy.poll_interval,
+                )
+
+            for _ in policy.attempts(wait_time):
+                if self._is_text_present(text, text_content):
+                    return True
         return False
 
-    def is_text_not_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
-
-        while time.time() < end_time:
-            if not self._is_text_present(text):
-                return True
+    def is_text_not_present(self, text, wait_time=None, wait_policy=None, text_content=False):
+        wait_time = self.wait_time if wait_time is None else wait_time
+
+        policy = get_wait_policy(wait_policy, self.wait_policy)
+
+        with deadline(wait_time):
+            if wait_time and self.observe_mutations:
+                mutation_observer.wait_for_text(
+                    self.driver,
+                    text,
+                    mutation_observer.TEXT_ABSENT,
+                    remaining_time(wait_time),
+                    text_content,
+                    policy.poll_interval,
+                )
+
+            for _ in policy.attempts(wait_time):
+                if not self._is_text_present(text, text_content):
+                    return True
         return False
 
     @contextmanager
@@ -486,15 +550,17 @@ class BaseWebDriver(DriverAPI):
         )
 
     def find_by_value(self, value, wait_time=None):
-        elem = self.find_by_xpath(
-            f'//*[@value="{value}"]',
-            original_find="value",
-            original_query=value,
-            wait_time=wait_time,
-        )
-        if elem:
-            return elem
-        return self.find_by_xpath('//*[.="%s"]' % value)
+        # Both searches share the wait time.
+        with deadline(self.wait_time if wait_time is None else wait_time):
+            elem = self.find_by_xpath(
+                f'//*[@value="{value}"]',
+                original_find="value",
+                original_query=value,
+                wait_time=wait_time,
+            )
+            if elem:
+                return elem
+            return self.find_by_xpath('//*[.="%s"]' % value, wait_time=wait_time)
 
     def find_by_text(self, text=None, wait_time=None):
         xpath_str = _concat_xpath_from_str(text)
@@ -692,6 +758,8 @@ class ShadowRootElement(ElementAPI):
 
         self.driver = self.parent.driver
         self.wait_time = self.parent.wait_time
+        self.wait_policy = self.parent.wait_policy
+        self.observe_mutations = self.parent.observe_mutations
         self.element_class = self.parent.element_class
 
     def _find(self, by: By, selector, wait_time=None):
@@ -726,6 +794,8 @@ class WebDriverElement(ElementAPI):
 
         self.driver = self.parent.driver
         self.wait_time = self.parent.wait_time
+        self.wait_policy = self.parent.wait_policy
+        self.observe_mutations = self.parent.observe_mutations
         self.element_class = self.parent.element_class
 
         self.links = FindLinks(self)
@@ -792,16 +862,18 @@ class WebDriverElement(ElementAPI):
         self._element.send_keys(value)
         return value
 
-    def click(self):
+    def click(self, wait_policy=None):
         """Click an element.
 
         If the element is not interactive due to being covered by another
          element, the click will retry for self.parent.wait_time amount of
          time.
+
+        Arguments:
+            wait_policy (WaitPolicy): How to wait between two attempts.
         """
-        end_time = time.time() + self.parent.wait_time
         error = None
-        while time.time() < end_time:
+        for _ in get_wait_policy(wait_policy, self.wait_policy).attempts(self.parent.wait_time):
             try:
                 return self._element.click()
             except (
@@ -830,6 +902,13 @@ class WebDriverElement(ElementAPI):
     def visible(self):
         return self._element.is_displayed()
 
+    @property
+    def rect(self):
+        return self._element.rect
+
+    def _read_all(self, elements, prop, name=None):
+        return bulk_read.read_all(self.driver, [element._element for element in elements], prop, name)
+
     @property
     def html(self):
         return self["innerHTML"]
@@ -864,8 +943,8 @@ class WebDriverElement(ElementAPI):
 
         raise ElementDoesNotExist("Element was removed from DOM.")
 
-    def is_visible(self, wait_time=None):
-        wait_time = wait_time or self.wait_time
+    def is_visible(self, wait_time=None, wait_policy=None):
+        wait_time = self.wait_time if wait_time is None else wait_time
 
         def search() -> bool:
             # Element is refreshed to account for changes to the page.
@@ -886,10 +965,22 @@ class WebDriverElement(ElementAPI):
 
             return False
 
-        return _retry(search, timeout=wait_time)
+        policy = get_wait_policy(wait_policy, self.wait_policy)
 
-    def is_not_visible(self, wait_time=None):
-        wait_time = wait_time or self.wait_time
+        with deadline(wait_time):
+            if wait_time and self.observe_mutations:
+                mutation_observer.wait_for_visibility(
+                    self.driver,
+                    self._element,
+                    mutation_observer.VISIBLE,
+                    remaining_time(wait_time),
+                    policy.poll_interval,
+                )
+
+            return _retry(search, timeout=remaining_time(wait_time), wait_policy=policy)
+
+    def is_not_visible(self, wait_time=None, wait_policy=None):
+        wait_time = self.wait_time if wait_time is None else wait_time
 
         def search() -> bool:
             # Element is refreshed to account for changes to the page.
@@ -913,7 +1004,19 @@ class WebDriverElement(ElementAPI):
 
             return True
 
-        return _retry(search, timeout=wait_time)
+        policy = get_wait_policy(wait_policy, self.wait_policy)
+
+        with deadline(wait_time):
+            if wait_time and self.observe_mutations:
+                mutation_observer.wait_for_visibility(
+                    self.driver,
+                    self._element,
+                    mutation_observer.NOT_VISIBLE,
+                    remaining_time(wait_time),
+                    policy.poll_interval,
+                )
+
+            return _retry(search, timeout=remaining_time(wait_time), wait_policy=policy)
 
     def find_by_css(self, selector, wait_time=None):
         return self.find_by(
@@ -0,0 +1,66 @@
+import functools
+import pkgutil
+from typing import List
+from typing import Optional
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from splinter.driver.webdriver.mutation_observer import TEXT_FUNCTIONS
+
+
+# getAttribute and isDisplayed are the atoms WebElement.get_attribute() and
+# WebElement.is_displayed() run, so the answers are the same, element by element.
+# Texts are normalized like Selenium's visible text, by normalizeText().
+_READ_ALL_SCRIPT = """
+var getAttribute = (%s);
+var isDisplayed = (%s);
+var prop = arguments[0], name = arguments[1], elements = arguments[2];
+
+function text(element) {
+    if (!isDisplayed(element)) {
+        return '';
+    }
+    return normalizeText(element.innerText || element.textContent || '').trim();
+}
+
+return elements.map(function (element) {
+    switch (prop) {
+        case 'text': return text(element);
+        case 'attr': return getAttribute(element, name);
+        case 'value': return getAttribute(element, 'value') || text(element);
+        case 'visible': return isDisplayed(element);
+        default:
+            var rect = element.getBoundingClientRect();
+            return {
+                x: rect.left + window.scrollX,
+                y: rect.top + window.scrollY,
+                width: rect.width,
+                height: rect.height
+            };
+    }
+});
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _script() -> str:
+    atoms = (
+        pkgutil.get_data("selenium.webdriver.remote", name).decode("utf8")
+        for name in ("getAttribute.js", "isDisplayed.js")
+    )
+    return TEXT_FUNCTIONS + _READ_ALL_SCRIPT % tuple(atoms)
+
+
+def read_all(driver, elements: List[WebElement], prop: str, name: Optional[str] = None) -> list:
+    """Read the same property of many elements with one script.
+
+    Arguments:
+        driver: The Selenium WebDriver.
+        elements: Selenium elements of the current page.
+        prop: "text", "value", "visible", "rect", or "attr" to read the
+            attribute called name.
+
+    Returns:
+        list: One value for each element, in order.
+    """
+    return driver.execute_script(_script(), prop, name, elements)
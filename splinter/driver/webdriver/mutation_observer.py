@@ -0,0 +1,246 @@
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from splinter.retry import get_wait_policy
+
+
+PRESENT = "present"
+ABSENT = "absent"
+VISIBLE = "visible"
+NOT_VISIBLE = "not visible"
+TEXT_PRESENT = "text present"
+TEXT_ABSENT = "text absent"
+
+# Locators the script can evaluate, as given to find_elements().
+_LOCATORS = ("css selector", "tag name", "id", "name", "class name", "xpath")
+
+# Like Selenium's visible text, whitespace other than line breaks is
+# collapsed and non-breaking spaces are spaces, in the page and in the text
+# looked for, so "foo bar" is found in "foo&nbsp;bar".
+TEXT_FUNCTIONS = r"""
+function normalizeText(text) {
+    return text.replace(/[^\S\n\u00a0]+/g, ' ').replace(/ *\n */g, '\n').replace(/\u00a0/g, ' ');
+}
+
+function hasPageText(property, text) {
+    // property is the one of the body to read: innerText, or textContent.
+    var body = document.body;
+    return body !== null && normalizeText(body[property]).indexOf(normalizeText(text)) !== -1;
+}
+"""
+
+_WAIT_SCRIPT = (
+    TEXT_FUNCTIONS
+    + r"""
+var condition = arguments[0], by = arguments[1], value = arguments[2];
+var root = arguments[3] || document, timeout = arguments[4], interval = arguments[5];
+var done = arguments[arguments.length - 1];
+
+function count() {
+    if (by === 'xpath') {
+        var doc = root.ownerDocument || root;
+        return doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+    var selector = value;
+    if (by === 'id') {
+        selector = '#' + CSS.escape(value);
+    } else if (by === 'class name') {
+        selector = '.' + CSS.escape(value);
+    } else if (by === 'name') {
+        selector = '[name="' + value.replace(/["\\]/g, '\\$&') + '"]';
+    }
+    return root.querySelectorAll(selector).length;
+}
+
+function visible() {
+    if (!root.isConnected) {
+        return false;
+    }
+    var style = window.getComputedStyle(root);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+        return false;
+    }
+    return root.getClientRects().length > 0;
+}
+
+function hasText() {
+    return hasPageText(by, value);
+}
+
+function detached() {
+    // A removed element, like one replaced by a re-render, won't change again.
+    return root !== document && !root.isConnected;
+}
+
+function met() {
+    switch (condition) {
+        case 'present': return count() > 0;
+        case 'absent': return count() === 0;
+        case 'visible': return visible();
+        case 'not visible': return !visible();
+        case 'text present': return hasText();
+        default: return !hasText();
+    }
+}
+
+if (met()) {
+    done(true);
+    return;
+}
+if (detached()) {
+    done(false);
+    return;
+}
+
+var finished = false, timer = null, poller = null;
+var observer = new MutationObserver(check);
+
+function check() {
+    if (met()) {
+        finish(true);
+    } else if (detached()) {
+        finish(false);
+    }
+}
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(poller);
+    done(result);
+}
+
+observer.observe(document, {attributes: true, characterData: true, childList: true, subtree: true});
+// Changes that aren't DOM mutations, like CSS animations, stylesheets
+// loading or resizes, are caught by checking again every interval.
+poller = setInterval(check, interval);
+timer = setTimeout(function () { finish(false); }, timeout);
+"""
+)
+
+
+def _wait(
+    driver,
+    condition: str,
+    timeout: float,
+    poll_interval: Optional[float],
+    by=None,
+    value=None,
+    root: Optional[WebElement] = None,
+) -> bool:
+    if poll_interval is None:
+        poll_interval = get_wait_policy().poll_interval
+    try:
+        return bool(
+            driver.execute_async_script(
+                _WAIT_SCRIPT,
+                condition,
+                by,
+                value,
+                root,
+                int(timeout * 1000),
+                max(int(poll_interval * 1000), 1),
+            ),
+        )
+    except WebDriverException:
+        # The page was left, the element went stale or the script timeout
+        # was hit. The caller searches again, as it would without observing.
+        return False
+
+
+def wait_for_elements(
+    driver,
+    finder,
+    finder_kwargs: dict,
+    condition: str,
+    timeout: float,
+    poll_interval: Optional[float] = None,
+) -> bool:
+    """Wait in the browser until elements are present, or absent.
+
+    A MutationObserver checks the condition every time the DOM changes, and
+    it's checked every poll_interval too, for the changes that aren't DOM
+    mutations. The whole wait is one round trip to the browser. It ends
+    early, unmet, if the element searched in is removed from the page.
+
+    Arguments:
+        driver: The Selenium WebDriver.
+        finder: find_elements() of the WebDriver, or of the element to search in.
+        finder_kwargs: Keyword arguments for the finder.
+        condition: PRESENT or ABSENT.
+        timeout: Seconds to wait at most.
+        poll_interval: Seconds between two checks without DOM mutations.
+            Defaults to the poll_interval of the default wait policy.
+
+    Returns:
+        bool: True if the condition was met. False if the time is up, or if
+        the search can't be observed, like a search by link text or inside
+        a shadow root.
+    """
+    if finder_kwargs.get("by") not in _LOCATORS:
+        return False
+
+    root = getattr(finder, "__self__", None)
+    if root is driver:
+        root = None
+    elif not isinstance(root, WebElement):
+        return False
+
+    return _wait(driver, condition, timeout, poll_interval, finder_kwargs["by"], finder_kwargs["value"], root)
+
+
+def wait_for_visibility(
+    driver,
+    element: WebElement,
+    condition: str,
+    timeout: float,
+    poll_interval: Optional[float] = None,
+) -> bool:
+    """Wait in the browser until an element is visible, or not visible.
+
+    The check is an approximation of Selenium's is_displayed(), which should
+    be called once the wait is over. A removed element ends the wait, since
+    it can only be found again with a new search.
+
+    Arguments:
+        driver: The Selenium WebDriver.
+        element: The element to watch.
+        condition: VISIBLE or NOT_VISIBLE.
+        timeout: Seconds to wait at most.
+        poll_interval: Seconds between two checks without DOM mutations.
+
+    Returns:
+        bool: True if the condition was met. False if the time is up, or if
+        the element was removed while waiting for it to be visible.
+    """
+    return _wait(driver, condition, timeout, poll_interval, root=element)
+
+
+def wait_for_text(
+    driver,
+    text: str,
+    condition: str,
+    timeout: float,
+    text_content: bool = False,
+    poll_interval: Optional[float] = None,
+) -> bool:
+    """Wait in the browser until a text is on the page, or isn't.
+
+    Arguments:
+        driver: The Selenium WebDriver.
+        text: The text to look for.
+        condition: TEXT_PRESENT or TEXT_ABSENT.
+        timeout: Seconds to wait at most.
+        text_content: Look in the body's textContent, instead of its rendered text.
+        poll_interval: Seconds between two checks without DOM mutations.
+
+    Returns:
+        bool: True if the condition was met, False if the time is up.
+    """
+    return _wait(driver, condition, timeout, poll_interval, "textContent" if text_content else "innerText", text)
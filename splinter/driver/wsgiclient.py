@@ -0,0 +1,142 @@
+import io
+import sys
+from typing import List
+from typing import Optional
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+from wsgiref.headers import Headers
+
+from splinter.driver.app_client import AppClient
+from splinter.driver.incremental_parser import IncrementalParser
+from splinter.driver.request_body import RequestBody
+
+
+class WsgiResponse:
+    """Response returned by a WSGI application.
+
+    Attributes:
+        status_code (int): Status code of the response.
+        headers (wsgiref.headers.Headers): Headers of the response.
+        chunks (list): Body of the response, as the application produced it.
+    """
+
+    def __init__(self, status_code: int, headers: Headers, chunks: List[bytes]) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.chunks = chunks
+        self._content: Optional[bytes] = None
+
+    @classmethod
+    def from_archive(cls, response) -> "WsgiResponse":
+        """Build a response from an ArchivedResponse."""
+        return cls(response.status_code, Headers(list(response.headers)), [response.body])
+
+    @property
+    def content(self) -> bytes:
+        """Body of the response, joined only when it's asked for."""
+        if self._content is None:
+            self._content = b"".join(self.chunks)
+        return self._content
+
+
+def _environ(method: str, url: str, headers, body: Optional[RequestBody]) -> dict:
+    parts = urlsplit(url)
+    scheme = parts.scheme or "http"
+    environ = {
+        "REQUEST_METHOD": method.upper(),
+        "SCRIPT_NAME": "",
+        # PEP 3333 strings are bytes decoded as latin-1.
+        "PATH_INFO": unquote(parts.path, encoding="latin-1") or "/",
+        "QUERY_STRING": parts.query,
+        "SERVER_NAME": parts.hostname or "localhost",
+        "SERVER_PORT": str(parts.port or (443 if scheme == "https" else 80)),
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_HOST": parts.netloc,
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scheme,
+        "wsgi.input": io.BytesIO(b"") if body is None else body.reader(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if body is not None:
+        environ["CONTENT_TYPE"] = body.content_type
+        environ["CONTENT_LENGTH"] = str(len(body))
+
+    for name, value in headers:
+        key = "HTTP_" + name.upper().replace("-", "_")
+        if key in environ:
+            environ[key] += "," + value
+        else:
+            environ[key] = value
+    return environ
+
+
+def call_wsgi_app(app, method: str, url: str, headers, body: Optional[RequestBody] = None) -> WsgiResponse:
+    """Make an HTTP request to a WSGI application, in process.
+
+    Arguments:
+        app: The WSGI application.
+        method (str): HTTP method of the request.
+        url (str): Absolute url of the request.
+        headers (list): Request headers, as (name, value) tuples.
+        body (RequestBody): Body of the request.
+
+    Returns:
+        WsgiResponse
+    """
+    status = "500 Internal Server Error"
+    response_headers: List = []
+    chunks: List[bytes] = []
+
+    def start_response(status_line, headers, exc_info=None):
+        nonlocal status, response_headers
+        if exc_info is not None and chunks:
+            raise exc_info[1].with_traceback(exc_info[2])
+        status = status_line
+        response_headers = list(headers)
+        return chunks.append
+
+    result = app(_environ(method, url, headers, body), start_response)
+    try:
+        chunks.extend(chunk for chunk in result if chunk)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+    return WsgiResponse(int(status.split(None, 1)[0]), Headers(response_headers), chunks)
+
+
+class WsgiClient(AppClient):
+    """Driver for any WSGI application, like Pyramid, Falcon or Bottle apps.
+
+    Requests are made by calling the application in process, without any
+    server. The body the application returns is fed to lxml a chunk at a
+    time, as it was produced, instead of being joined first.
+
+    Arguments:
+        app: The WSGI application.
+        custom_headers (dict): Headers sent with every request.
+    """
+
+    driver_name = "wsgi"
+    response_class = WsgiResponse
+
+    def _call_app(self, method, url, headers, body):
+        return call_wsgi_app(self.app, method, url, headers, body)
+
+    def _response_chunks(self, response):
+        return response.chunks
+
+    def _parse_response(self, page):
+        try:
+            parser = IncrementalParser(self._response_chunks(page.response), encoding=self._document_charset(page))
+        except LookupError:
+            # lxml doesn't support the encoding, Python has to decode it.
+            parser = None
+
+        if parser is None or not parser.is_full_html:
+            return super()._parse_response(page)
+        return parser.finish()
@@ -3,12 +3,10 @@
 # license that can be found in the LICENSE file.
 import mimetypes
 import re
-import time
 import warnings
 from typing import Optional
 
 import lxml.html
-from lxml.cssselect import CSSSelector
 from zope.testbrowser.browser import Browser
 from zope.testbrowser.browser import ListControl
 
@@ -16,11 +14,14 @@ from splinter.abc import CookieManagerAPI
 from splinter.config import Config
 from splinter.driver import DriverAPI
 from splinter.driver import ElementAPI
+from splinter.driver.document_index import TextIndex
+from splinter.driver.document_index import body_text
 from splinter.driver.element_present import ElementPresentMixIn
 from splinter.driver.find_links import FindLinks
+from splinter.driver.html_source import parse_html
+from splinter.driver.query_cache import query_cache
 from splinter.driver.xpath_utils import _concat_xpath_from_str
 from splinter.element_list import ElementList
-from splinter.exceptions import ElementDoesNotExist
 
 
 class CookieManager(CookieManagerAPI):
@@ -65,12 +66,17 @@ class CookieManager(CookieManagerAPI):
 class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
     driver_name = "zope.testbrowser"
 
-    def __init__(self, wait_time=2, config: Optional[Config] = None):
+    #: Compiled XPath/CSS queries, shared by every lxml based driver.
+    query_cache = query_cache
+
+    def __init__(self, wait_time=2, config: Optional[Config] = None, wsgi_app=None):
         self.wait_time = wait_time
-        self._browser = Browser()
+        self._browser = Browser(wsgi_app=wsgi_app)
 
         self._cookie_manager = CookieManager(self._browser)
         self._last_urls = []
+        self._page_cache = {}
+        self._page_cache_response = None
 
         self.links = FindLinks(self)
 
@@ -107,14 +113,50 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
     def quit(self):  # NOQA: A003
         pass
 
+    def _cached(self, key, build):
+        """Get something computed from the current response, computing it once.
+
+        Every navigation, including visit(), back(), reload() and clicks on
+        links and controls, goes through a new zope.testbrowser response, so
+        the cache is thrown away whenever the response changes.
+        """
+        response = self._browser._response
+        if self._page_cache_response is not response:
+            self._page_cache = {}
+            self._page_cache_response = response
+
+        try:
+            return self._page_cache[key]
+        except KeyError:
+            value = self._page_cache[key] = build()
+            return value
+
+    def _parse_response(self):
+        response = self._browser._response
+        return parse_html(response.body, response.charset)
+
     @property
     def htmltree(self):
+        return self._cached("htmltree", self._parse_response)
+
+    @property
+    def _text_index(self):
+        return self._cached("text_index", lambda: TextIndex(self.htmltree))
+
+    def _build_control_index(self):
+        """Map every control name to its controls, in document order."""
+        controls = {}
         try:
-            html = self.html.decode("utf-8")
-        except AttributeError:
-            html = self.html
+            forms = self._browser._getAllResponseForms()
+            for control in self._browser._findAllControls(forms):
+                controls.setdefault(control.name, []).append(control)
+        except NotImplementedError:
+            pass
+        return controls
 
-        return lxml.html.fromstring(html)
+    @property
+    def _control_index(self):
+        return self._cached("control_index", self._build_control_index)
 
     @property
     def title(self):
@@ -128,9 +170,12 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
     def url(self):
         return self._browser.url
 
+    def _evaluate(self, query, find_by="xpath"):
+        """Run a query against the current document using a compiled query."""
+        return self.query_cache.get(query, find_by)(self.htmltree)
+
     def find_option_by_value(self, value):
-        html = self.htmltree
-        element = html.xpath('//option[@value="%s"]' % value)[0]
+        element = self._evaluate('//option[@value="%s"]' % value)[0]
         control = self._browser.getControl(element.text)
         return ElementList(
             [ZopeTestBrowserOptionElement(control, self)],
@@ -139,8 +184,7 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
         )
 
     def find_option_by_text(self, text):
-        html = self.htmltree
-        element = html.xpath('//option[normalize-space(text())="%s"]' % text)[0]
+        element = self._evaluate('//option[normalize-space(text())="%s"]' % text)[0]
         control = self._browser.getControl(element.text)
         return ElementList(
             [ZopeTestBrowserOptionElement(control, self)],
@@ -149,28 +193,42 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
         )
 
     def find_by_css(self, css_selector):
-        xpath = CSSSelector(css_selector).path
-        return self.find_by_xpath(xpath, original_find="css", original_query=css_selector)
+        return self._find_by_query(
+            css_selector,
+            "css",
+            original_find="css",
+            original_query=css_selector,
+        )
 
     def get_control(self, xpath_element):
         return xpath_element
 
     def find_by_xpath(self, xpath, original_find=None, original_query=None):
-        html = self.htmltree
+        return self._find_by_query(xpath, "xpath", original_find, original_query)
+
+    def _find_by_query(self, query, query_type, original_find=None, original_query=None):
+        elements = self._evaluate(query, query_type)
+
+        find_by = original_find or "xpath"
+        query = original_query or query
+
+        return self._element_list(elements, find_by, query)
 
+    def _element_list(self, xpath_elements, find_by, query):
         elements = []
 
-        for xpath_element in html.xpath(xpath):
+        for xpath_element in xpath_elements:
             if self._element_is_link(xpath_element):
-                return self._find_links_by_xpath(xpath)
+                return ElementList(
+                    [ZopeTestBrowserLinkElement(link, self) for link in xpath_elements],
+                    find_by=find_by,
+                    query=query,
+                )
             elif self._element_is_control(xpath_element) and xpath_element.name:
                 return self.find_by_name(xpath_element.name)
             else:
                 elements.append(self.get_control(xpath_element))
 
-        find_by = original_find or "xpath"
-        query = original_query or xpath
-
         return ElementList(
             [ZopeTestBrowserElement(element, self) for element in elements],
             find_by=find_by,
@@ -191,12 +249,8 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
         return self.find_by_xpath('//*[.="%s"]' % value)
 
     def find_by_text(self, text):
-        xpath_str = _concat_xpath_from_str(text)
-        return self.find_by_xpath(
-            xpath_str,
-            original_find="text",
-            original_query=text,
-        )
+        elements = self._text_index.find_text(text)
+        return self._element_list(elements, "text", text)
 
     def find_by_id(self, id_value):
         return self.find_by_xpath(
@@ -206,18 +260,7 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
         )
 
     def find_by_name(self, name):
-        elements = []
-        index = 0
-
-        while True:
-            try:
-                control = self._browser.getControl(name=name, index=index)
-                elements.append(control)
-                index += 1
-            except LookupError:
-                break
-            except NotImplementedError:
-                break
+        elements = self._control_index.get(name, [])
         return ElementList(
             [ZopeTestBrowserControlElement(element, self) for element in elements],
             find_by="name",
@@ -294,44 +337,34 @@ class ZopeTestBrowser(ElementPresentMixIn, DriverAPI):
             control.add_file(f, content_type, filename)
 
     def _find_links_by_xpath(self, xpath):
-        html = self.htmltree
-        links = html.xpath(xpath)
+        links = self._evaluate(xpath)
         return ElementList(
             [ZopeTestBrowserLinkElement(link, self) for link in links],
             find_by="xpath",
             query=xpath,
         )
 
-    def select(self, name, value):
-        self.find_by_name(name).first._control.value = [value]
+    def _find_links_by_text(self, text):
+        links = self._text_index.find_links_by_text(text)
+        return ElementList(
+            [ZopeTestBrowserLinkElement(link, self) for link in links],
+            find_by="link by text",
+            query=text,
+        )
 
-    def is_text_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
+    def _find_links_by_partial_text(self, partial_text):
+        links = self._text_index.find_links_by_partial_text(partial_text)
+        return ElementList(
+            [ZopeTestBrowserLinkElement(link, self) for link in links],
+            find_by="link by partial text",
+            query=partial_text,
+        )
 
-        while time.time() < end_time:
-            if self._is_text_present(text):
-                return True
-        return False
+    def select(self, name, value):
+        self.find_by_name(name).first._control.value = [value]
 
-    def _is_text_present(self, text):
-        try:
-            body = self.find_by_tag("body").first
-            return text in body.text
-        except ElementDoesNotExist:
-            # This exception will be thrown if the body tag isn't present
-            # This has occasionally been observed. Assume that the
-            # page isn't fully loaded yet
-            return False
-
-    def is_text_not_present(self, text, wait_time=None):
-        wait_time = wait_time or self.wait_time
-        end_time = time.time() + wait_time
-
-        while time.time() < end_time:
-            if not self._is_text_present(text):
-                return True
-        return False
+    def _body_text(self):
+        return self._cached("body_text", lambda: body_text(self.htmltree))
 
     def _element_is_link(self, element):
         return element.tag == "a"
@@ -355,24 +388,28 @@ class ZopeTestBrowserElement(ElementAPI):
     def __getitem__(self, attr):
         return self._element.attrib[attr]
 
+    def _evaluate(self, query, find_by="xpath"):
+        """Run a query inside this element using a compiled query."""
+        return query_cache.get(query, find_by)(self._element)
+
     def find_by_css(self, selector):
-        elements = self._element.cssselect(selector)
+        elements = self._evaluate(selector, "css_html")
         return ElementList([self.__class__(element, self) for element in elements])
 
     def find_by_xpath(self, selector):
-        elements = self._element.xpath(selector)
+        elements = self._evaluate(selector)
         return ElementList([self.__class__(element, self) for element in elements])
 
     def find_by_name(self, name):
-        elements = self._element.cssselect('[name="%s"]' % name)
+        elements = self._evaluate('[name="%s"]' % name, "css_html")
         return ElementList([self.__class__(element, self) for element in elements])
 
     def find_by_tag(self, name):
-        elements = self._element.cssselect(name)
+        elements = self._evaluate(name, "css_html")
         return ElementList([self.__class__(element, self) for element in elements])
 
     def find_by_value(self, value):
-        elements = self._element.cssselect('[value="%s"]' % value)
+        elements = self._evaluate('[value="%s"]' % value, "css_html")
         return ElementList([self.__class__(element, self) for element in elements])
 
     def find_by_text(self, text):
@@ -381,7 +418,7 @@ class ZopeTestBrowserElement(ElementAPI):
         return self.find_by_xpath(xpath_str)
 
     def find_by_id(self, id):  # NOQA: A002
-        elements = self._element.cssselect("#%s" % id)
+        elements = self._evaluate("#%s" % id, "css_html")
         return ElementList([self.__class__(element, self) for element in elements])
 
     @property
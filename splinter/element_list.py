@@ -1,9 +1,20 @@
 # Copyright 2012 splinter authors. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
 from splinter.exceptions import ElementDoesNotExist
 
 
+# Placeholder for members that haven't been wrapped yet.
+_UNWRAPPED = object()
+
+
 class ElementList:
     """Collection of elements.
 
@@ -20,27 +31,62 @@ class ElementList:
 
         >>> element_list = ElementList([])
         >>> element_list[0] # raises ElementDoesNotExist
+
+    When a ``wrapper`` is given, ``elements`` are treated as raw results
+    and each one is only passed through ``wrapper`` the first time it is
+    accessed. This lets drivers return large result sets without building
+    an element object for every match:
+
+        >>> element_list = ElementList(raw_results, wrapper=make_element)
+        >>> element_list.first # only the first result gets wrapped
     """
 
     def __init__(
         self,
-        elements: list,
+        elements: Iterable,
         driver=None,
         find_by=None,
         query=None,
+        wrapper: Optional[Callable[[Any], Any]] = None,
     ) -> None:
         self._container = []
         self._container.extend(elements)
 
+        self._wrapper = wrapper
+        self._raw = None
+        if wrapper is not None:
+            self._raw = self._container
+            self._container = [_UNWRAPPED] * len(self._raw)
+
         self.driver = driver
         self.find_by = find_by
         self.query = query
 
+    def _get(self, index: int):
+        element = self._container[index]
+        if element is _UNWRAPPED:
+            element = self._wrapper(self._raw[index])
+            self._container[index] = element
+        return element
+
+    def _wrap_all(self) -> None:
+        """Wrap every member that hasn't been accessed yet."""
+        if self._wrapper is None:
+            return
+
+        for index in range(len(self._container)):
+            self._get(index)
+
+        self._wrapper = None
+        self._raw = None
+
     def __getitem__(self, index):
         if not isinstance(index, int) and not isinstance(index, slice):
             return self.first[index]
         try:
-            return self._container[index]
+            if isinstance(index, slice):
+                return [self._get(i) for i in range(*index.indices(len(self._container)))]
+            return self._get(index)
         except IndexError as err:
             raise ElementDoesNotExist(
                 f'No elements were found with {self.find_by} "{self.query}"',
@@ -74,11 +120,57 @@ class ElementList:
         """
         return len(self) == 0
 
+    def _read_all(self, prop: str, name: Optional[str] = None) -> list:
+        if self.is_empty():
+            return []
+        return self.first._read_all(list(self), prop, name)
+
+    def texts(self) -> List[str]:
+        """Get the text of every element.
+
+        The Selenium drivers read every element with one script, instead of
+        one command per element.
+
+        Example:
+
+            >>> browser.find_by_css('td.price').texts()
+            ['3.50', '12.00']
+        """
+        return self._read_all("text")
+
+    def attrs(self, name: str) -> List[Optional[str]]:
+        """Get an attribute of every element.
+
+        Example:
+
+            >>> browser.find_by_tag('a').attrs('href')
+            ['https://example.com/', 'https://example.com/about']
+        """
+        return self._read_all("attr", name)
+
+    def values(self) -> List[str]:
+        """Get the value of every element."""
+        return self._read_all("value")
+
+    def visibilities(self) -> List[bool]:
+        """Get the visibility status of every element."""
+        return self._read_all("visible")
+
+    def rects(self) -> List[Dict[str, float]]:
+        """Get the position and size of every element.
+
+        Returns:
+            list: Dicts with x, y, width and height keys.
+        """
+        return self._read_all("rect")
+
     def __getattr__(self, name: str):
         try:
             return getattr(self.first, name)
         except AttributeError:
             try:
+                # List methods need real elements, not raw results.
+                self._wrap_all()
                 return getattr(self._container, name)
             except AttributeError as err:
                 raise AttributeError(
@@ -86,7 +178,8 @@ class ElementList:
                 ) from err
 
     def __iter__(self):
-        yield from self._container
+        for index in range(len(self._container)):
+            yield self._get(index)
 
     def __len__(self) -> int:
         """__len__ checks the internal container."""
@@ -94,4 +187,5 @@ class ElementList:
 
     def __repr__(self) -> str:
         """Return the repr of the internal container."""
+        self._wrap_all()
         return repr(self._container)
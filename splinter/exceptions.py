@@ -30,3 +30,17 @@ class ElementDoesNotExist(Exception):
     """
 
     pass
+
+
+class ResponseArchiveMismatch(Exception):
+    """
+    Exception raised when a request being replayed isn't in the archive.
+
+    Example:
+
+        >>> archive = ResponseArchive('responses.zip')
+        >>> browser = Browser('django', response_archive=archive)
+        >>> browser.visit('/never-recorded') # raises ResponseArchiveMismatch
+    """
+
+    pass
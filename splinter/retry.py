@@ -1,24 +1,155 @@
+import random
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 from typing import Callable
+from typing import Iterator
 from typing import Optional
 
 
+# Monotonic time by which the waits in progress must be over, if any.
+_deadline: ContextVar[Optional[float]] = ContextVar("splinter_deadline", default=None)
+
+
+def remaining_time(timeout: float) -> float:
+    """Shorten a timeout to what's left of the enclosing deadline, if any."""
+    end_time = _deadline.get()
+    if end_time is None:
+        return timeout
+    return max(0.0, min(timeout, end_time - time.monotonic()))
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    """Make every wait started inside the block end when timeout is up.
+
+    Waits nested in the block, like a find_by_css() made by
+    is_element_present(), use what's left of the time instead of starting
+    their own timer. Deadlines can be nested, the earliest one wins.
+
+    Example:
+
+        >>> with deadline(5):
+        ...     browser.is_element_present_by_css('.loaded', wait_time=10)  # 5 seconds at most
+
+    Arguments:
+        timeout: Seconds from now.
+
+    Yields:
+        float: The deadline, as a time.monotonic() value.
+    """
+    end_time = time.monotonic() + remaining_time(timeout)
+    token = _deadline.set(end_time)
+    try:
+        yield end_time
+    finally:
+        _deadline.reset(token)
+
+
+@dataclass
+class WaitPolicy:
+    """How retry loops wait between two attempts.
+
+    Every loop that waits for something to happen on the page, like
+    is_element_present() or is_text_present(), sleeps between attempts
+    according to a WaitPolicy.
+
+    Example:
+
+        >>> from splinter import Browser, Config
+        >>> from splinter.retry import WaitPolicy
+        >>>
+        >>> policy = WaitPolicy(poll_interval=0.2, backoff=2, max_interval=2, jitter=0.1)
+        >>> browser = Browser('remote', config=Config(wait_policy=policy))
+
+    A policy can also be set for every browser, or for a single call:
+
+        >>> splinter.retry.default_wait_policy = policy
+        >>> browser.is_text_present('Done', wait_policy=WaitPolicy(max_attempts=3))
+
+    Attributes:
+        poll_interval: Seconds to sleep after the first attempt.
+        backoff: Factor the interval is multiplied by after each attempt.
+        max_interval: Longest interval, in seconds, backoff can reach.
+        jitter: Fraction of the interval that is added or removed at random,
+            so many browsers polling the same grid don't stay in step.
+        max_attempts: Stop after this many attempts, even if time is left.
+    """
+
+    poll_interval: float = 0.1
+    backoff: float = 1.0
+    max_interval: float = 1.0
+    jitter: float = 0.0
+    max_attempts: Optional[int] = None
+
+    def intervals(self) -> Iterator[float]:
+        """Yield the time to sleep after each attempt."""
+        interval = self.poll_interval
+        while True:
+            if self.jitter:
+                yield max(0.0, interval * (1 + random.uniform(-self.jitter, self.jitter)))  # NOQA: S311
+            else:
+                yield interval
+            interval = min(interval * self.backoff, max(self.max_interval, self.poll_interval))
+
+    def attempts(self, timeout: float) -> Iterator[int]:
+        """Yield once per attempt, sleeping in between, until the time is up.
+
+        There's always at least one attempt. The last one is made when
+        timeout is reached, or when max_attempts is. Inside a deadline(),
+        attempts stop at the deadline if it comes first.
+
+        Arguments:
+            timeout: How long, in seconds, to keep making attempts.
+        """
+        end_time = time.monotonic() + remaining_time(timeout)
+        intervals = self.intervals()
+        attempt = 0
+        while True:
+            attempt += 1
+            yield attempt
+
+            if self.max_attempts is not None and attempt >= self.max_attempts:
+                return
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(next(intervals), remaining))
+
+
+#: Policy used when neither the call nor the browser's Config sets one.
+default_wait_policy = WaitPolicy()
+
+
+def get_wait_policy(*policies: Optional[WaitPolicy]) -> WaitPolicy:
+    """Get the first policy that is set, or default_wait_policy."""
+    for policy in policies:
+        if policy is not None:
+            return policy
+    return default_wait_policy
+
+
 def _retry(
     fn: Callable[[], Any],
     fn_args: Optional[list] = None,
     fn_kwargs: Optional[dict] = None,
     timeout: int = 0,
+    wait_policy: Optional[WaitPolicy] = None,
 ) -> Any:
     """Retry a function until it returns a non-falsey result or timeout is hit.
 
-    If timeout is set to 0, the function will only be run once.
+    If timeout is set to 0, the function will only be run once. The function
+    runs inside a deadline(), so the waits it makes itself can't outlast
+    timeout.
 
     This will not wrap Exceptions, only falsey values.
 
     Arguments:
         fn: A function to retry.
         timeout: How long, in seconds, to retry the function.
+        wait_policy: How to wait between attempts. Defaults to default_wait_policy.
 
     Returns:
         The final return value of func.
@@ -26,15 +157,13 @@ def _retry(
     fn_args = fn_args or []
     fn_kwargs = fn_kwargs or {}
 
-    result = None
-
     # Zero second wait time means only check once
     if timeout == 0:
-        result = fn(*fn_args, **fn_kwargs)
-    else:
-        end_time = time.time() + timeout
+        return fn(*fn_args, **fn_kwargs)
 
-        while time.time() < end_time:
+    result = None
+    with deadline(timeout):
+        for _ in get_wait_policy(wait_policy).attempts(timeout):
             result = fn(*fn_args, **fn_kwargs)
 
             if result:
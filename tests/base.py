@@ -170,6 +170,18 @@ class WebDriverTests(
         "should show that the text attribute strips html"
         assert self.browser.find_by_id("text_with_html").text == "another bit of text"
 
+    def test_is_text_present_ignores_hidden_text(self):
+        "should only find hidden text when searching the text content"
+        assert not self.browser.is_text_present("Only in the text content", wait_time=0)
+        assert self.browser.is_text_not_present("Only in the text content", wait_time=0)
+        assert self.browser.is_text_present("Only in the text content", wait_time=0, text_content=True)
+
+    def test_is_text_present_with_non_breaking_spaces(self):
+        "should find text with spaces where the page has non-breaking spaces"
+        assert self.browser.is_text_present("Non breaking spaces")
+        assert self.browser.is_text_present("Non breaking spaces", text_content=True)
+        assert not self.browser.is_text_not_present("Non breaking spaces", wait_time=0)
+
     def test_can_verify_if_a_element_is_visible(self):
         "should provide verify if element is visible"
         assert self.browser.find_by_id("visible").visible
@@ -29,3 +29,14 @@ class ElementTest:
         assert (
             self.browser.find_by_id("html-property").html == 'inner <div class="inner-html">inner text</div> html test'
         )
+
+    def test_element_list_reads_every_element(self):
+        links = self.browser.find_by_css('a[href="http://localhost:5000/bar"]')
+        assert links.texts() == [link.text for link in links]
+        assert links.attrs("href") == [link["href"] for link in links]
+        assert links.values() == [link.value for link in links]
+
+    def test_element_list_reads_nothing_when_empty(self):
+        elements = self.browser.find_by_css(".does-not-exist")
+        assert elements.texts() == []
+        assert elements.attrs("href") == []
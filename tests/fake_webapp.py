@@ -31,6 +31,7 @@ EXAMPLE_REDIRECT_LOCATION_HTML = read_static("redirect-location.html")
 EXAMPLE_MOUSE_HTML = read_static("mouse.html")
 EXAMPLE_CLICK_INTERCEPTED_HTML = read_static("click_intercepted.html")
 BUFFER = []
+CACHED_VIEW_CALLS = []
 
 # Functions for http basic auth.
 # Taken verbatim from http://flask.pocoo.org/snippets/8/
@@ -122,6 +123,17 @@ def request_headers():
     return str(request.headers)
 
 
+@app.route("/cached", methods=["GET"])
+def cached():
+    CACHED_VIEW_CALLS.append(request.headers.get("If-None-Match"))
+    response = Response(EXAMPLE_HTML)
+    response.set_etag("example")
+    response.headers["Cache-Control"] = request.args.get("cache_control", "no-cache")
+    if "vary" in request.args:
+        response.headers["Vary"] = request.args["vary"]
+    return response.make_conditional(request)
+
+
 @app.route("/foo")
 def foo():
     return "BAR!"
@@ -11,7 +11,7 @@ from splinter.exceptions import ElementDoesNotExist
 
 def skip_if_zope(f):
     def wrapper(self, *args, **kwargs):
-        if self.__class__.__name__ == "TestZopeTestBrowserDriver":
+        if self.browser.driver_name == "zope.testbrowser":
             return pytest.skip("skipping this test for zope testbrowser")
         else:
             f(self, *args, **kwargs)
@@ -231,6 +231,15 @@ class FormElementsTest:
         value = self.browser.find_by_name("firstname").value
         assert "John" == value
 
+    def test_can_fill_form_by_name(self):
+        "should be able to fill a form by its name"
+        self.browser.fill_form(
+            {"firstname": "Jane", "lastname": "Doe"},
+            name="login",
+        )
+        value = self.browser.find_by_name("firstname").value
+        assert "Jane" == value
+
     def test_fill_form_missing_values(self):
         """Missing values should raise an error."""
         with pytest.raises(ElementDoesNotExist) as e:
@@ -48,6 +48,16 @@ def get_browser(browser_name, config=None, **kwargs):
         _app = kwargs.pop("app", app)
         return Browser("flask", app=_app, **kwargs)
 
+    elif browser_name == "asgi":
+        from asgiref.wsgi import WsgiToAsgi
+
+        _app = kwargs.pop("app", WsgiToAsgi(app))
+        return Browser("asgi", app=_app, **kwargs)
+
+    elif browser_name == "wsgi":
+        _app = kwargs.pop("app", app)
+        return Browser("wsgi", app=_app, **kwargs)
+
     elif browser_name == "zope.testbrowser":
         return Browser("zope.testbrowser", **kwargs)
 
@@ -40,3 +40,8 @@ class IsTextPresentTest:
         "returns true if there's no body"
         self.browser.visit(EXAMPLE_APP + "no-body")
         assert self.browser.is_text_not_present("No such text")
+
+    def test_is_text_present_in_text_content(self):
+        "should find hidden text when searching the text content"
+        assert self.browser.is_text_present("Only in the text content", text_content=True)
+        assert not self.browser.is_text_not_present("Only in the text content", text_content=True)
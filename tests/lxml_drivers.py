@@ -1,8 +1,14 @@
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from .fake_webapp import EXAMPLE_APP
+from .form_elements import skip_if_zope
+from .get_browser import get_browser
+from splinter.driver.response_archive import ResponseArchive
+from splinter.exceptions import ResponseArchiveMismatch
 
 
 class LxmlDriverTests:
@@ -36,6 +42,191 @@ class LxmlDriverTests:
         assert EXAMPLE_APP == browser.url
         browser.quit()
 
+    @skip_if_zope
+    def test_clone_keeps_page_and_cookies(self):
+        """A clone should start on the same page, with a copy of the cookies"""
+        browser = self.get_new_browser()
+        browser.visit(EXAMPLE_APP)
+        browser.cookies.add({"session": "abc"})
+
+        clone = browser.clone()
+        clone.cookies.add({"other": "def"})
+
+        assert EXAMPLE_APP == clone.url
+        assert browser.title == clone.title
+        assert "abc" == clone.cookies["session"]
+        assert "other" not in browser.cookies
+        clone.quit()
+        browser.quit()
+
+    @skip_if_zope
+    def test_clone_has_its_own_history(self):
+        """Going back in a clone should not move the original browser"""
+        browser = self.get_new_browser()
+        browser.visit(EXAMPLE_APP)
+        browser.visit(f"{EXAMPLE_APP}iframe")
+
+        clone = browser.clone()
+        clone.back()
+
+        assert EXAMPLE_APP == clone.url
+        assert f"{EXAMPLE_APP}iframe" == browser.url
+        clone.quit()
+        browser.quit()
+
+    @skip_if_zope
+    def test_clone_has_its_own_page(self):
+        """Filling a form in a clone should not change the original browser"""
+        browser = self.get_new_browser()
+        browser.visit(EXAMPLE_APP)
+        assert "default value" == browser.find_by_name("query").value
+
+        clone = browser.clone()
+        clone.fill_form({"query": "changed"})
+
+        assert "changed" == clone.find_by_name("query").value
+        assert "default value" == browser.find_by_name("query").value
+        clone.quit()
+        browser.quit()
+
+    @skip_if_zope
+    def test_replay_recorded_responses(self):
+        """Replayed pages should be served from the archive, without the app"""
+        with tempfile.TemporaryDirectory() as directory:
+            self._record_and_replay(os.path.join(directory, "responses.zip"))
+
+    def _record_and_replay(self, path):
+        driver_name = self.browser.driver_name
+
+        with ResponseArchive(path, mode="record") as archive:
+            browser = get_browser(driver_name, response_archive=archive)
+            browser.visit(EXAMPLE_APP)
+            browser.find_by_name("query").fill("recorded")
+            browser.find_by_name("send").click()
+            recorded_html = browser.html
+            browser.quit()
+
+        browser = get_browser(driver_name, response_archive=ResponseArchive(path))
+
+        def not_called(*args, **kwargs):
+            raise AssertionError("The app was called")
+
+        browser._do_method = not_called
+        browser.visit(EXAMPLE_APP)
+        browser.find_by_name("query").fill("recorded")
+        browser.find_by_name("send").click()
+
+        assert recorded_html == browser.html
+        assert 200 == browser.status_code
+
+        browser.visit(EXAMPLE_APP)
+        browser.find_by_name("query").fill("something else")
+        with pytest.raises(ResponseArchiveMismatch):
+            browser.find_by_name("send").click()
+        browser.quit()
+
+    @skip_if_zope
+    def test_replay_recorded_upload(self):
+        """Uploads should be recorded and replayed by the content of their files"""
+        file_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "mockfile.txt")
+
+        def upload(browser):
+            browser.visit(EXAMPLE_APP)
+            browser.attach_file("file", file_path)
+            browser.find_by_name("upload").click()
+            return browser.html
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.zip")
+            with ResponseArchive(path, mode="record") as archive:
+                browser = get_browser(self.browser.driver_name, response_archive=archive)
+                recorded_html = upload(browser)
+                browser.quit()
+
+            browser = get_browser(self.browser.driver_name, response_archive=ResponseArchive(path))
+
+            def not_called(*args, **kwargs):
+                raise AssertionError("The app was called")
+
+            browser._do_method = not_called
+            assert recorded_html == upload(browser)
+            with open(file_path) as f:
+                assert f.read() in recorded_html
+            browser.quit()
+
+    @skip_if_zope
+    def test_replayed_redirects_are_in_the_history(self):
+        """Replaying a redirect should give the same history as the live request"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.zip")
+            with ResponseArchive(path, mode="record") as archive:
+                browser = get_browser(self.browser.driver_name, response_archive=archive)
+                browser.visit(EXAMPLE_APP)
+                browser.visit(f"{EXAMPLE_APP}redirected")
+                recorded = (browser.url, list(browser._last_urls), browser._last_url_index)
+                browser.quit()
+
+            browser = get_browser(self.browser.driver_name, response_archive=ResponseArchive(path))
+            browser.visit(EXAMPLE_APP)
+            browser.visit(f"{EXAMPLE_APP}redirected")
+
+            assert recorded == (browser.url, browser._last_urls, browser._last_url_index)
+            browser.quit()
+
+    @skip_if_zope
+    def test_page_body_is_read_once(self):
+        """The body of a page should be read from its response only once"""
+        browser = self.get_new_browser()
+        reads = []
+        read_body = browser._response_body
+
+        def response_body(response):
+            reads.append(response)
+            return read_body(response)
+
+        browser._response_body = response_body
+        browser.visit(EXAMPLE_APP)
+        assert "Example Title" == browser.title
+        assert "Example Header" in browser.html
+        browser.visit(f"{EXAMPLE_APP}iframe")
+
+        assert 1 == len(reads)
+        browser.quit()
+
+    @skip_if_zope
+    def test_queries_from_threads_share_one_page(self):
+        """Threads querying a page at the same time should all see one parsed tree"""
+        browser = self.get_new_browser()
+        browser.visit(EXAMPLE_APP)
+
+        def query(selector):
+            return len(browser.find_by_css(selector)), browser.htmltree
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(query, ["a", "input", "h1"] * 20))
+
+        assert 1 == len({id(tree) for _count, tree in results})
+        assert [count for count, _tree in results] == [count for count, _tree in results[:3]] * 20
+        browser.quit()
+
+    @skip_if_zope
+    def test_navigation_from_threads(self):
+        """Pages loaded from several threads should each be recorded whole"""
+        browser = self.get_new_browser()
+        urls = [EXAMPLE_APP, f"{EXAMPLE_APP}iframe"] * 10
+
+        def visit(url):
+            browser.visit(url)
+            return browser.title
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(visit, urls))
+
+        assert len(urls) == len(browser._last_urls)
+        assert len(urls) - 1 == browser._last_url_index
+        assert browser.url == browser._last_urls[-1]
+        browser.quit()
+
     def test_can_clear_password_field_content(self):
         """lxml-based drivers should not be able to clear"""
         with pytest.raises(NotImplementedError):
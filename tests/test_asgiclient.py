@@ -0,0 +1,98 @@
+import asyncio
+import os
+import tempfile
+import time
+
+import pytest
+
+from .base import BaseBrowserTests
+from .base import get_browser
+from .fake_webapp import CACHED_VIEW_CALLS
+from .fake_webapp import EXAMPLE_APP
+from .lxml_drivers import LxmlDriverTests
+from splinter.driver.response_archive import ResponseArchive
+from splinter.exceptions import ResponseArchiveMismatch
+
+
+class TestAsgiClientDriver(LxmlDriverTests, BaseBrowserTests):
+    @pytest.fixture(autouse=True, scope="class")
+    def setup_browser(self, request):
+        request.cls.browser = get_browser("asgi", wait_time=0.1)
+        request.addfinalizer(request.cls.browser.quit)
+
+    @pytest.fixture(autouse=True)
+    def visit_example_app(self, request):
+        self.browser.visit(EXAMPLE_APP)
+
+    def test_http_cache(self):
+        """Fresh pages should be reused, and stale ones revalidated"""
+        browser = get_browser("asgi", http_cache=True)
+        CACHED_VIEW_CALLS.clear()
+        browser.visit(EXAMPLE_APP + "cached?cache_control=max-age%3D60")
+        browser.visit(EXAMPLE_APP + "cached?cache_control=max-age%3D60")
+        browser.visit(EXAMPLE_APP + "cached")
+        browser.visit(EXAMPLE_APP + "cached")
+
+        assert CACHED_VIEW_CALLS == [None, None, '"example"']
+        assert browser.http_cache.info()[:3] == (1, 1, 2)
+        assert browser.title == "Example Title"
+        browser.quit()
+
+    def test_cookies_extra_parameters(self):
+        """Cookie can be created with extra parameters."""
+        timestamp = int(time.time() + 120)
+        self.browser.cookies.add({"sha": "zam"}, expires=timestamp)
+        cookie = {c.name: c for c in self.browser.cookie_jar}["sha"]
+        assert timestamp == cookie.expires
+
+    def test_async_visit_and_submit(self):
+        """Browsers should be usable concurrently from one event loop"""
+        browsers = [get_browser("asgi") for _ in range(3)]
+
+        async def submit(browser, value):
+            await browser.avisit(EXAMPLE_APP)
+            form = browser.find_by_name("submit-input")._get_parent_form()
+            await browser.asubmit(form, submitter=("submit-input", value))
+            return browser.html
+
+        async def run():
+            return await asyncio.gather(
+                *(submit(browser, f"value {i}") for i, browser in enumerate(browsers)),
+            )
+
+        pages = asyncio.run(run())
+
+        for i, html in enumerate(pages):
+            assert f"submit-input: value {i}" in html
+        for browser in browsers:
+            browser.quit()
+
+    def test_async_requests_use_the_response_archive(self):
+        """avisit() and asubmit() should record and replay like visit() and submit()"""
+
+        async def submit(browser):
+            await browser.avisit(EXAMPLE_APP)
+            form = browser.find_by_name("submit-input")._get_parent_form()
+            await browser.asubmit(form, submitter=("submit-input", "recorded"))
+            return browser.html
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "responses.zip")
+            with ResponseArchive(path, mode="record") as archive:
+                browser = get_browser("asgi", response_archive=archive)
+                recorded_html = asyncio.run(submit(browser))
+                browser.quit()
+            assert 2 == len(archive)
+
+            browser = get_browser("asgi", response_archive=ResponseArchive(path))
+
+            async def not_called(*args, **kwargs):
+                raise AssertionError("The app was called")
+
+            browser._ado_method = not_called
+            assert recorded_html == asyncio.run(submit(browser))
+            assert "submit-input: recorded" in browser.html
+
+            with pytest.raises(ResponseArchiveMismatch):
+                asyncio.run(browser.avisit(EXAMPLE_APP + "iframe"))
+            browser.quit()
@@ -38,6 +38,20 @@ class TestDjangoClientDriver(LxmlDriverTests, BaseBrowserTests):
         cookie = self.browser._browser.cookies["sha"]
         assert timestamp == cookie["expires"]
 
+    def test_clone_gets_its_own_client(self):
+        """A clone should get a new test client, with a copy of the cookies"""
+        self.browser.cookies.add({"sha": "zam"})
+        clone = self.browser.clone()
+        clone.cookies.add({"other": "cookie"})
+
+        assert clone._browser is not self.browser._browser
+        assert clone._browser.defaults == self.browser._browser.defaults
+        assert clone._browser.defaults is not self.browser._browser.defaults
+        assert clone._browser.handler is not self.browser._browser.handler
+        assert clone.cookies["sha"] == "zam"
+        assert "other" not in self.browser.cookies
+        clone.quit()
+
 
 class TestDjangoClientDriverWithCustomHeaders:
     @pytest.fixture(autouse=True, scope="class")
@@ -1,15 +1,19 @@
 # Copyright 2014 splinter authors. All rights reserved.
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
+import os
 import time
 
+import lxml.html
 import pytest
 
 from .base import BaseBrowserTests
 from .base import get_browser
 from .fake_webapp import app
+from .fake_webapp import CACHED_VIEW_CALLS
 from .fake_webapp import EXAMPLE_APP
 from .lxml_drivers import LxmlDriverTests
+from splinter.exceptions import ElementDoesNotExist
 
 
 class TestFlaskClientDriver(LxmlDriverTests, BaseBrowserTests):
@@ -29,6 +33,36 @@ class TestFlaskClientDriver(LxmlDriverTests, BaseBrowserTests):
         data = self.browser.serialize(form)
         assert data["pets"] == ["cat", "dog"]
 
+    def test_serialize_does_not_change_the_form(self):
+        """serialize should leave buttons out, except the submitter"""
+        form = self.browser.find_by_name("send")._get_parent_form()
+        before = lxml.html.tostring(form)
+
+        data = self.browser.serialize(form, submitter=("send", "Send"))
+        assert data["send"] == "Send"
+        assert "upload" not in data
+        assert lxml.html.tostring(form) == before
+
+        assert "send" not in self.browser.serialize(form)
+
+    def test_uploaded_files_are_closed_after_the_request(self, monkeypatch):
+        """Files opened for an upload should be closed once it's sent"""
+        uploads = []
+        serialize = self.browser.serialize
+
+        def spy(*args, **kwargs):
+            data = serialize(*args, **kwargs)
+            uploads.extend(value for value in data.values() if hasattr(value, "read"))
+            return data
+
+        monkeypatch.setattr(self.browser, "serialize", spy)
+        file_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), "mockfile.txt")
+        self.browser.attach_file("file", file_path)
+        self.browser.find_by_name("upload").click()
+
+        assert len(uploads) == 1
+        assert uploads[0].closed
+
     def test_redirection_on_post(self):
         """
         when submitting a form that POSTs to /redirected,
@@ -38,6 +72,77 @@ class TestFlaskClientDriver(LxmlDriverTests, BaseBrowserTests):
         assert "I just been redirected to this location" in self.browser.html
         assert "redirect-location?come=get&some=true" in self.browser.url
 
+    def test_iter_by_css(self):
+        """iter_by_css should yield the same elements as find_by_css"""
+        elements = self.browser.iter_by_css("#visible")
+        assert next(elements).text == "visible"
+        assert next(elements)["name"] == "crazy-upload"
+
+    def test_iter_by_xpath_classifies_each_element(self):
+        """iter_by_xpath should wrap links, controls and other elements"""
+        elements = list(self.browser.iter_by_xpath('//*[@id="foo" or @id="visible"]'))
+        assert [element.__class__.__name__ for element in elements] == [
+            "LxmlElement",
+            "LxmlLinkElement",
+            "LxmlControlElement",
+        ]
+
+    def test_stream_by_tag(self):
+        """stream_by_tag should find the same elements as find_by_tag without parsing the page"""
+        self.browser.reload()
+        titles = list(self.browser.stream_by_tag("title"))
+        assert "html" not in self.browser._page.derived
+        assert [title.text for title in titles] == [self.browser.title]
+
+    def test_is_text_present_does_not_wait(self):
+        """Text checks should be answered once, without waiting for wait_time"""
+        start = time.time()
+        assert not self.browser.is_text_present("Text that not exist", wait_time=10)
+        assert not self.browser.is_text_not_present("Example Header", wait_time=10)
+        assert time.time() - start < 5
+
+    def test_back_and_forward_restore_pages_from_the_page_cache(self):
+        """back() and forward() shouldn't request pages that are cached"""
+        tree = self.browser.htmltree
+        self.browser.visit(EXAMPLE_APP + "iframe")
+        iframe_tree = self.browser.htmltree
+        hits = self.browser.page_cache.info().hits
+
+        self.browser.back()
+        assert self.browser.url == EXAMPLE_APP
+        assert self.browser.htmltree is tree
+
+        self.browser.forward()
+        assert self.browser.url == EXAMPLE_APP + "iframe"
+        assert self.browser.htmltree is iframe_tree
+
+        assert self.browser.page_cache.info().hits == hits + 2
+
+    def test_back_revalidate(self):
+        """back(revalidate=True) should request the page again"""
+        tree = self.browser.htmltree
+        self.browser.visit(EXAMPLE_APP + "iframe")
+
+        self.browser.back(revalidate=True)
+        assert self.browser.htmltree is not tree
+        assert self.browser.title == "Example Title"
+
+    def test_fill_form_reports_every_missing_field(self):
+        """fill_form should list every unknown name and fill nothing"""
+        with pytest.raises(ElementDoesNotExist) as e:
+            self.browser.fill_form({"query": "new query", "missing1": "a", "missing2": "b"})
+
+        assert '"missing1", "missing2"' in str(e.value)
+        assert self.browser.find_by_name("query").value == "default value"
+
+    def test_fill_form_radio_and_multiple_select(self):
+        """fill_form should pick the right radio and every selected option"""
+        self.browser.fill_form({"gender": "F", "pets": ["cat", "dog"]})
+
+        assert not self.browser.find_by_id("gender-m").checked
+        assert self.browser.find_by_id("gender-f").checked
+        assert sorted(self.browser.find_by_name("pets").value) == ["cat", "dog"]
+
     def test_cookies_extra_parameters(self):
         """Cookie can be created with extra parameters."""
         timestamp = int(time.time() + 120)
@@ -46,6 +151,18 @@ class TestFlaskClientDriver(LxmlDriverTests, BaseBrowserTests):
         assert timestamp == int(cookie.expires.timestamp())
 
 
+class TestFlaskClientDriverIncrementalParsing(TestFlaskClientDriver):
+    @pytest.fixture(autouse=True, scope="class")
+    def setup_browser(self, request):
+        request.cls.browser = get_browser("flask", app=app, wait_time=0.1, incremental_parsing=True)
+        request.addfinalizer(request.cls.browser.quit)
+
+    def test_title_does_not_parse_the_whole_page(self):
+        """Reading the title should only parse the head of the page"""
+        assert self.browser.title == "Example Title"
+        assert not self.browser._page.derived.peek("parser").complete
+
+
 class TestFlaskClientDriverWithCustomHeaders:
     @pytest.fixture(autouse=True, scope="class")
     def setup_browser(self, request):
@@ -60,3 +177,56 @@ class TestFlaskClientDriverWithCustomHeaders:
         self.browser.visit(EXAMPLE_APP + "headers")
         assert self.browser.is_text_present("X-Splinter-Customheaders-1: Hello")
         assert self.browser.is_text_present("X-Splinter-Customheaders-2: Bye")
+
+
+class TestFlaskClientDriverWithHttpCache:
+    @pytest.fixture(autouse=True)
+    def setup_browser(self, request):
+        request.cls.browser = get_browser("flask", app=app, wait_time=0.1, http_cache=True)
+        request.addfinalizer(request.cls.browser.quit)
+        CACHED_VIEW_CALLS.clear()
+
+    def test_revisit_sends_conditional_request(self):
+        """A revisit should revalidate the page and reuse it on a 304"""
+        self.browser.visit(EXAMPLE_APP + "cached")
+        tree = self.browser.htmltree
+        self.browser.find_by_name("query").fill("changed")
+
+        self.browser.visit(EXAMPLE_APP + "cached")
+
+        assert CACHED_VIEW_CALLS == [None, '"example"']
+        assert self.browser.status_code == 200
+        assert self.browser.title == "Example Title"
+        # The form is filled in a copy, the cached page stays untouched.
+        assert self.browser.htmltree is not tree
+        assert self.browser.find_by_name("query").value == "default value"
+        assert self.browser.http_cache.info()[:3] == (0, 1, 1)
+
+    def test_fresh_page_is_reused_without_a_request(self):
+        """A fresh page shouldn't be requested again"""
+        url = EXAMPLE_APP + "cached?cache_control=max-age%3D60"
+        self.browser.visit(url)
+        self.browser.visit(url)
+
+        assert CACHED_VIEW_CALLS == [None]
+        assert self.browser.http_cache.info().hits == 1
+
+    def test_vary_cookie(self):
+        """A page that varies on cookies shouldn't be reused once they change"""
+        url = EXAMPLE_APP + "cached?cache_control=max-age%3D60&vary=Cookie"
+        self.browser.visit(url)
+        self.browser.visit(url)
+        self.browser.cookies.add({"user": "other"})
+        self.browser.visit(url)
+
+        assert CACHED_VIEW_CALLS == [None, None]
+        assert self.browser.http_cache.info().hits == 1
+
+    def test_no_store(self):
+        """Responses marked no-store should never be cached"""
+        url = EXAMPLE_APP + "cached?cache_control=no-store"
+        self.browser.visit(url)
+        self.browser.visit(url)
+
+        assert CACHED_VIEW_CALLS == [None, None]
+        assert len(self.browser.http_cache) == 0
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from .base import BaseBrowserTests
+from .base import get_browser
+from .fake_webapp import CACHED_VIEW_CALLS
+from .fake_webapp import EXAMPLE_APP
+from .lxml_drivers import LxmlDriverTests
+
+
+class TestWsgiClientDriver(LxmlDriverTests, BaseBrowserTests):
+    @pytest.fixture(autouse=True, scope="class")
+    def setup_browser(self, request):
+        request.cls.browser = get_browser("wsgi", wait_time=0.1)
+        request.addfinalizer(request.cls.browser.quit)
+
+    @pytest.fixture(autouse=True)
+    def visit_example_app(self, request):
+        self.browser.visit(EXAMPLE_APP)
+
+    def test_http_cache(self):
+        """Fresh pages should be reused, and stale ones revalidated"""
+        browser = get_browser("wsgi", http_cache=True)
+        CACHED_VIEW_CALLS.clear()
+        browser.visit(EXAMPLE_APP + "cached?cache_control=max-age%3D60")
+        browser.visit(EXAMPLE_APP + "cached?cache_control=max-age%3D60")
+        browser.visit(EXAMPLE_APP + "cached")
+        browser.visit(EXAMPLE_APP + "cached")
+
+        assert CACHED_VIEW_CALLS == [None, None, '"example"']
+        assert browser.http_cache.info()[:3] == (1, 1, 2)
+        assert browser.title == "Example Title"
+        browser.quit()
+
+    def test_cookies_extra_parameters(self):
+        """Cookie can be created with extra parameters."""
+        timestamp = int(time.time() + 120)
+        self.browser.cookies.add({"sha": "zam"}, expires=timestamp)
+        cookie = {c.name: c for c in self.browser.cookie_jar}["sha"]
+        assert timestamp == cookie.expires
+
+    def test_streams_response_into_parser(self):
+        """A body returned in many chunks should be parsed without being joined"""
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/html; charset=utf-8")])
+            yield b"<html><head><title>Chunked</title></head><body>"
+            for i in range(100):
+                yield f'<p id="p{i}">paragraph {i}</p>'.encode()
+            yield b"</body></html>"
+
+        browser = get_browser("wsgi", app=app)
+        browser.visit("/")
+
+        assert "Chunked" == browser.title
+        assert "paragraph 99" == browser.find_by_id("p99").text
+        assert browser._response._content is None
+        browser.quit()
+
+    def test_closes_response_iterable(self):
+        """The response iterable should be closed once it has been read"""
+        closed = []
+
+        class Body:
+            def __iter__(self):
+                yield b"<html><body>Hi</body></html>"
+
+            def close(self):
+                closed.append(True)
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/html")])
+            return Body()
+
+        browser = get_browser("wsgi", app=app)
+        browser.visit("/")
+
+        assert [True] == closed
+        assert browser.is_text_present("Hi")
+        browser.quit()
+
+    def test_post_body_in_wsgi_input(self):
+        """Form submissions should be readable from wsgi.input"""
+        received = []
+
+        def app(environ, start_response):
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            received.append(environ["wsgi.input"].read(length))
+            start_response("200 OK", [("Content-Type", "text/html")])
+            return [b'<html><body><form method="post"><input name="q" value="a b"></form></body></html>']
+
+        browser = get_browser("wsgi", app=app)
+        browser.visit("/")
+        browser.submit(browser.find_by_name("q")._get_parent_form())
+
+        assert [b"", b"q=a+b"] == received
+        browser.quit()
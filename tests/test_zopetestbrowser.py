@@ -5,6 +5,7 @@ import pytest
 
 from .base import BaseBrowserTests
 from .base import get_browser
+from .fake_webapp import app
 from .fake_webapp import EXAMPLE_APP
 from .lxml_drivers import LxmlDriverTests
 
@@ -26,9 +27,36 @@ class TestZopeTestBrowserDriver(LxmlDriverTests, BaseBrowserTests):
                 {"query": "new query", "missing_form": "doesn't exist"},
             )
 
+    def test_htmltree_is_parsed_once_per_response(self):
+        """htmltree should only be parsed again after a navigation"""
+        tree = self.browser.htmltree
+        assert self.browser.htmltree is tree
+
+        self.browser.reload()
+        assert self.browser.htmltree is not tree
+
+    def test_find_by_name_returns_every_control_with_the_name(self):
+        """find_by_name should find every control with the name, in order"""
+        elements = self.browser.find_by_name("input1")
+        assert [element.value for element in elements] == [
+            "default value",
+            "default last value",
+        ]
+
     def test_cookies_extra_parameters(self):
         """Cookie can be created with extra parameters."""
         comment = "Ipsum lorem"
         self.browser.cookies.add({"sha": "zam"}, comment=comment)
         cookie = self.browser._browser.cookies.getinfo("sha")
         assert "Ipsum%20lorem" == cookie["comment"]
+
+
+class TestZopeTestBrowserDriverWithWsgiApp(TestZopeTestBrowserDriver):
+    @pytest.fixture(autouse=True, scope="class")
+    def setup_browser(self, request):
+        request.cls.browser = get_browser("zope.testbrowser", wait_time=0.1, wsgi_app=app)
+        request.addfinalizer(request.cls.browser.quit)
+
+    def test_requests_go_to_the_wsgi_app(self):
+        """Requests should be made to the WSGI app, not over HTTP"""
+        assert self.browser._browser.testapp.app is app
@@ -0,0 +1,30 @@
+from unittest import mock
+
+import pytest
+
+from splinter import Config
+from splinter.driver.webdriver import BaseWebDriver
+
+
+class FakeWebDriver(BaseWebDriver):
+    """BaseWebDriver around a fake Selenium WebDriver."""
+
+    def __init__(self, driver, wait_time, config):
+        self.config = config
+        super().__init__(driver=driver, wait_time=wait_time)
+
+
+@pytest.fixture
+def make_webdriver():
+    """Get a function building webdriver browsers without a real browser.
+
+    It takes the fake Selenium WebDriver, which defaults to a Mock that
+    never finds anything, the wait_time, and Config arguments.
+    """
+
+    def make(selenium=None, wait_time=0.5, **config):
+        if selenium is None:
+            selenium = mock.Mock(**{"find_elements.return_value": []})
+        return FakeWebDriver(selenium, wait_time, Config(**config))
+
+    return make
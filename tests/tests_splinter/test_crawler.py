@@ -0,0 +1,157 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from splinter import Browser
+from splinter.crawler import absolute_links
+from splinter.crawler import Crawler
+
+
+PAGES = {
+    "/": '<a href="/a">A</a> <a href="/b#top">B</a> <a href="mailto:x@example.com">Mail</a>',
+    "/a": '<a href="b">B</a> <a href="/missing">Missing</a> <a href="http://example.com/">Out</a>',
+    "/b": '<a href="/c">C</a> <a href="/old">Old</a>',
+    "/c": '<a href="/d">D</a>',
+    "/d": "The end",
+}
+
+
+def app(environ, start_response):
+    path = environ["PATH_INFO"]
+    if path == "/old":
+        start_response("301 Moved Permanently", [("Location", "/c")])
+        return [b""]
+    if path not in PAGES:
+        start_response("404 Not Found", [("Content-Type", "text/html")])
+        return [b"<html><body>Not found</body></html>"]
+    start_response("200 OK", [("Content-Type", "text/html")])
+    return [f"<html><body>{PAGES[path]}</body></html>".encode()]
+
+
+def browser_factory():
+    return Browser("wsgi", app=app)
+
+
+class QuitLogger:
+    """Browser writing a file in a directory when it's quit."""
+
+    def __init__(self, directory):
+        self.browser = browser_factory()
+        self.directory = directory
+
+    def __getattr__(self, name):
+        return getattr(self.browser, name)
+
+    def quit(self):  # NOQA: A003
+        self.browser.quit()
+        with open(os.path.join(self.directory, str(os.getpid())), "w"):
+            pass
+
+
+class NoStatusCode:
+    """Browser that doesn't report status codes, like the Selenium ones."""
+
+    def __init__(self):
+        self.browser = browser_factory()
+
+    def __getattr__(self, name):
+        return getattr(self.browser, name)
+
+    @property
+    def status_code(self):
+        raise NotImplementedError
+
+
+def test_absolute_links():
+    links = absolute_links(
+        "http://localhost/a/b",
+        ["c", "/d#x", "/d", "javascript:void(0)", "https://example.com/"],
+    )
+    assert ("http://localhost/a/c", "http://localhost/d", "https://example.com/") == links
+
+
+def test_crawl_visits_each_page_once():
+    report = Crawler(browser_factory).crawl("http://localhost/")
+
+    assert {
+        "http://localhost/",
+        "http://localhost/a",
+        "http://localhost/b",
+        "http://localhost/c",
+        "http://localhost/d",
+        "http://localhost/missing",
+        "http://localhost/old",
+    } == set(report.pages)
+    assert "http://localhost/c" == report.pages["http://localhost/old"].final_url
+    assert 200 == report.pages["http://localhost/d"].status_code
+    assert 3 == report.pages["http://localhost/d"].depth
+    assert all(page.elapsed >= 0 for page in report)
+
+
+def test_crawl_reports_broken_links():
+    report = Crawler(browser_factory).crawl("http://localhost/")
+
+    [broken] = report.broken_links()
+    assert "http://localhost/missing" == broken.url
+    assert 404 == broken.status_code
+    assert "http://localhost/a" == broken.referrer
+
+
+def test_crawl_reports_errors_as_broken():
+    def failing_app(environ, start_response):
+        raise RuntimeError("boom")
+
+    report = Crawler(lambda: Browser("wsgi", app=failing_app)).crawl("http://localhost/")
+
+    [broken] = report.broken_links()
+    assert broken.status_code is None
+    assert "RuntimeError: boom" == broken.error
+
+
+def test_crawl_without_status_codes():
+    report = Crawler(NoStatusCode).crawl("http://localhost/")
+
+    assert 7 == len(report)
+    assert all(page.status_code is None and page.error is None for page in report)
+    assert [] == report.broken_links()
+
+
+def test_crawl_max_depth():
+    report = Crawler(browser_factory, max_depth=1).crawl("http://localhost/")
+
+    assert {"http://localhost/", "http://localhost/a", "http://localhost/b"} == set(report.pages)
+
+
+def test_crawl_max_pages():
+    report = Crawler(browser_factory, max_pages=2).crawl("http://localhost/")
+
+    assert 2 == len(report)
+
+
+def test_crawl_allowed_domains():
+    report = Crawler(browser_factory, allowed_domains=["example.com"]).crawl("http://localhost/")
+
+    assert 0 == len(report)
+
+
+def test_crawl_records_external_links_without_following_them():
+    report = Crawler(browser_factory).crawl("http://localhost/")
+
+    assert "http://example.com/" in report.pages["http://localhost/a"].links
+    assert "http://example.com/" not in report.pages
+
+
+def test_crawl_with_process_pool():
+    crawler = Crawler(browser_factory, max_workers=2, executor_class=ProcessPoolExecutor)
+    report = crawler.crawl("http://localhost/")
+
+    assert 7 == len(report)
+    assert ["http://localhost/missing"] == [page.url for page in report.broken_links()]
+
+
+def test_crawl_with_process_pool_quits_browsers(tmp_path):
+    """Every worker process should quit its browser when the pool shuts down."""
+    crawler = Crawler(partial(QuitLogger, str(tmp_path)), max_workers=2, executor_class=ProcessPoolExecutor)
+    crawler.crawl("http://localhost/")
+
+    assert 1 <= len(os.listdir(tmp_path)) <= 2
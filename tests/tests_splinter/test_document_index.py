@@ -0,0 +1,90 @@
+import lxml.html
+
+from splinter.driver.document_index import DocumentIndex
+from splinter.driver.document_index import TextIndex
+from splinter.driver.xpath_utils import _concat_xpath_from_str
+
+
+HTML = """
+<html>
+  <head><title>Index</title></head>
+  <body>
+    <div id="main" class="outer box">
+      <p class="inner">one</p>
+      <input name="query" />
+      <input name="query" />
+      <!-- a comment -->
+    </div>
+    <p id="main">duplicate</p>
+  </body>
+</html>
+"""
+
+
+def test_document_index_tables():
+    """Every table should hold the matching elements in document order."""
+    tree = lxml.html.fromstring(HTML)
+    index = DocumentIndex(tree)
+
+    assert [e.tag for e in index.ids["main"]] == ["div", "p"]
+    assert len(index.names["query"]) == 2
+    assert len(index.tags["p"]) == 2
+    assert index.tags["title"][0].text == "Index"
+    assert [e.tag for e in index.classes["box"]] == ["div"]
+
+
+def test_document_index_covers():
+    """An index should only cover elements of its own document."""
+    tree = lxml.html.fromstring(HTML)
+    other = lxml.html.fromstring(HTML)
+    index = DocumentIndex(tree)
+
+    assert index.covers(index.tags["p"][0])
+    assert not index.covers(other)
+
+
+def test_document_index_has_class_within():
+    """has_class_within should match the element and its descendants."""
+    tree = lxml.html.fromstring(HTML)
+    index = DocumentIndex(tree)
+    div = index.ids["main"][0]
+    paragraph = index.classes["inner"][0]
+
+    assert index.has_class_within(div, "outer")
+    assert index.has_class_within(div, "inner")
+    assert not index.has_class_within(paragraph, "outer")
+    assert not index.has_class_within(div, "missing")
+
+
+TEXT_HTML = """
+<html>
+  <body>
+    <p>Complex<!-- comment -->Complex</p>
+    <p>Quotation " marks</p>
+    <a href="/a">Link <span>with</span>
+      nested   text</a>
+    <a href="/b">Link&#160;with space</a>
+    <a href="/c">Complex</a>
+  </body>
+</html>
+"""
+
+
+def test_text_index_matches_xpath_text_lookup():
+    """find_text should return what the find_by_text XPath returns."""
+    tree = lxml.html.fromstring(TEXT_HTML)
+    index = TextIndex(tree)
+
+    for text in ["Complex", 'Quotation " marks', "Link ", "missing"]:
+        assert index.find_text(text) == tree.xpath(_concat_xpath_from_str(text))
+
+
+def test_text_index_links():
+    """Link lookups should match the FindLinks XPath queries."""
+    tree = lxml.html.fromstring(TEXT_HTML)
+    index = TextIndex(tree)
+
+    assert index.find_links_by_text("Complex") == tree.xpath('//a[text()="Complex"]')
+    for partial_text in ["with nested text", "Link", "with space", "\xa0with"]:
+        expected = tree.xpath('//a[contains(normalize-space(.), "%s")]' % partial_text)
+        assert index.find_links_by_partial_text(partial_text) == expected
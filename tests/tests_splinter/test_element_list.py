@@ -113,3 +113,90 @@ def test_elementlist_repr():
     elementlist = ElementList(the_list)
 
     assert repr(elementlist) == repr(the_list)
+
+
+def test_lazy_elementlist_wraps_on_access():
+    """With a wrapper, members are only wrapped when accessed."""
+    wrapped = []
+
+    def wrapper(item):
+        wrapped.append(item)
+        return item * 10
+
+    elementlist = ElementList([1, 2, 3], wrapper=wrapper)
+
+    assert len(elementlist) == 3
+    assert elementlist.first == 10
+    assert elementlist.first == 10
+    assert wrapped == [1]
+
+    assert elementlist[1:] == [20, 30]
+    assert list(elementlist) == [10, 20, 30]
+    assert wrapped == [1, 2, 3]
+
+
+def test_lazy_elementlist_list_methods():
+    """List methods should see wrapped members."""
+    elementlist = ElementList([1, 2, 3], wrapper=lambda item: item * 10)
+
+    assert elementlist.index(20) == 1
+    assert repr(elementlist) == repr([10, 20, 30])
+
+
+def test_lazy_elementlist_raises_element_does_not_exist():
+    """An empty lazy list should behave like an empty list."""
+    with pytest.raises(ElementDoesNotExist):
+        ElementList([], wrapper=str).first
+
+
+def test_bulk_reads_of_an_empty_list():
+    """An empty list has nothing to read, whatever the driver."""
+    the_list = ElementList([])
+    assert the_list.texts() == []
+    assert the_list.attrs("href") == []
+    assert the_list.values() == []
+    assert the_list.visibilities() == []
+    assert the_list.rects() == []
+
+
+def test_bulk_reads_element_by_element():
+    """Without a faster way, every element is read in turn."""
+    from splinter.driver import ElementAPI
+
+    class Element(ElementAPI):
+        def __init__(self, text):
+            self._text = text
+
+        def __getitem__(self, attr):
+            return f"{attr}-{self._text}"
+
+        @property
+        def text(self):
+            return self._text
+
+    the_list = ElementList([Element("a"), Element("b")])
+    assert the_list.texts() == ["a", "b"]
+    assert the_list.attrs("id") == ["id-a", "id-b"]
+    with pytest.raises(NotImplementedError):
+        the_list.rects()
+
+
+def test_webdriver_bulk_reads_use_one_script():
+    """WebDriver elements are read with a single execute_script call."""
+    from unittest import mock
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from splinter.driver.webdriver import BaseWebDriver
+
+    raw = [mock.Mock(spec=WebElement) for _ in range(300)]
+    selenium = mock.Mock(**{"find_elements.return_value": raw})
+    selenium.execute_script.return_value = ["http://example.com/"] * 300
+    browser = BaseWebDriver(driver=selenium, wait_time=0)
+
+    hrefs = browser.find_by_css("a").attrs("href")
+
+    assert hrefs == ["http://example.com/"] * 300
+    assert selenium.execute_script.call_count == 1
+    assert selenium.execute_script.call_args.args[1:] == ("attr", "href", raw)
+    assert not any(element.get_attribute.called for element in raw)
@@ -0,0 +1,51 @@
+import codecs
+
+import pytest
+
+from splinter.driver.html_source import parse_html
+from splinter.driver.html_source import sniff_charset
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (b"<p>plain</p>", "utf-8"),
+        (codecs.BOM_UTF8 + b"<p>bom</p>", "utf-8"),
+        (b'<html><head><meta charset="ISO-8859-1"></head></html>', "iso8859-1"),
+        (
+            b'<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">',
+            "cp1252",
+        ),
+        (b'<meta charset="not-a-charset">', "utf-8"),
+    ],
+)
+def test_sniff_charset(body, expected):
+    assert sniff_charset(body) == expected
+
+
+def test_sniff_charset_only_looks_at_the_top_of_the_document():
+    """A <meta> charset buried deep in the document should be ignored."""
+    body = b"<p>" + b"x" * 2048 + b'</p><meta charset="latin-1">'
+    assert sniff_charset(body, default="ascii") == "ascii"
+
+
+def test_parse_html_uses_declared_encoding():
+    """Bytes should be decoded with the given encoding, not guessed."""
+    tree = parse_html("<p>café</p>".encode("utf-8"), "utf-8")
+    assert tree.text == "café"
+
+    tree = parse_html("<p>café</p>".encode("latin-1"), "latin-1")
+    assert tree.text == "café"
+
+
+def test_parse_html_sniffs_undeclared_encoding():
+    """Without an encoding, the document's own <meta> charset is used."""
+    body = '<html><head><meta charset="latin-1"></head><body><p>café</p></body></html>'
+    tree = parse_html(body.encode("latin-1"), None)
+    assert tree.find(".//p").text == "café"
+
+
+def test_parse_html_encoding_unknown_to_lxml():
+    """Encodings lxml can't handle should still be decoded."""
+    tree = parse_html("<p>日本</p>".encode("euc_jp"), "euc_jp")
+    assert tree.text == "日本"
@@ -0,0 +1,183 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import lxml.html
+
+from splinter.driver.http_cache import HttpCache
+
+
+def make_response(status_code=200, **headers):
+    headers = {name.replace("_", "-"): value for name, value in headers.items()}
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_http_cache_max_age():
+    """A response should be reused until max-age runs out."""
+    clock = Clock()
+    cache = HttpCache(clock=clock)
+    response = make_response(Cache_Control="public, max-age=10")
+    sent = []
+
+    def send(headers):
+        sent.append(headers)
+        return response
+
+    assert cache.request("/a", send) is response
+    clock.now += 5
+    assert cache.request("/a", send) is response
+    assert len(sent) == 1
+
+    clock.now += 10
+    cache.request("/a", send)
+    assert len(sent) == 2
+    assert cache.info()[:3] == (1, 0, 2)
+
+
+def test_http_cache_expires():
+    """Expires should be used when there's no max-age."""
+    clock = Clock()
+    cache = HttpCache(clock=clock)
+    response = make_response(Expires="Thu, 01 Jan 1970 00:20:00 GMT")
+
+    cache.request("/a", lambda headers: response)
+    assert cache.request("/a", lambda headers: make_response()) is response
+
+
+def test_http_cache_validators():
+    """Stale responses should be revalidated with their validators."""
+    cache = HttpCache()
+    response = make_response(ETag='"v1"', Last_Modified="Thu, 01 Jan 1970 00:00:00 GMT")
+    cache.request("/a", lambda headers: response)
+
+    sent = []
+
+    def not_modified(headers):
+        sent.append(headers)
+        return make_response(304)
+
+    assert cache.request("/a", not_modified) is response
+    assert sent == [{"If-None-Match": '"v1"', "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}]
+    assert cache.info().revalidations == 1
+
+
+def test_http_cache_replaced_when_modified():
+    """A new 200 response should replace the cached one."""
+    cache = HttpCache()
+    cache.request("/a", lambda headers: make_response(ETag='"v1"'))
+    new = make_response(ETag='"v2"')
+
+    assert cache.request("/a", lambda headers: new) is new
+    assert cache.entry_for(new).etag == '"v2"'
+
+
+def test_http_cache_skips_uncacheable_responses():
+    """Responses that can't be reused shouldn't be stored."""
+    cache = HttpCache()
+    cache.request("/a", lambda headers: make_response())
+    cache.request("/b", lambda headers: make_response(ETag='"x"', Cache_Control="no-store"))
+    cache.request("/c", lambda headers: make_response(404, ETag='"x"'))
+
+    assert len(cache) == 0
+
+
+def test_http_cache_evicts_least_recently_used():
+    """The cache should never hold more than maxsize responses."""
+    cache = HttpCache(maxsize=1)
+    cache.request("/a", lambda headers: make_response(ETag='"a"'))
+    cache.request("/b", lambda headers: make_response(ETag='"b"'))
+
+    assert len(cache) == 1
+
+
+def test_cache_entry_tree_is_parsed_once_and_copied():
+    """Every user of a cached page should get its own copy of the tree."""
+    cache = HttpCache()
+    response = make_response(ETag='"a"')
+    cache.request("/a", lambda headers: response)
+    entry = cache.entry_for(response)
+    parses = []
+
+    def parse():
+        parses.append(1)
+        return lxml.html.fromstring("<html><body><p>x</p></body></html>")
+
+    first = entry.tree(parse)
+    second = entry.tree(parse)
+
+    assert len(parses) == 1
+    assert first is not second
+    assert lxml.html.tostring(first) == lxml.html.tostring(second)
+
+
+def test_http_cache_vary():
+    """A response should only be reused for requests with the headers it varies on."""
+    cache = HttpCache()
+    response = make_response(Cache_Control="max-age=60", Vary="Cookie, Accept-Language")
+    alice = [("Cookie", "user=alice"), ("Accept-Language", "en")]
+    cache.request("/a", lambda headers: response, alice)
+    other = make_response()
+
+    same = [("accept-language", "en"), ("cookie", "user=alice")]
+    assert cache.request("/a", lambda headers: response, same) is response
+    assert cache.request("/a", lambda headers: other, [("Cookie", "user=bob"), ("Accept-Language", "en")]) is other
+
+
+def test_http_cache_vary_star():
+    """A response varying on everything can't be reused."""
+    cache = HttpCache()
+    cache.request("/a", lambda headers: make_response(ETag='"a"', Vary="*"))
+
+    assert len(cache) == 0
+
+
+def test_http_cache_lookup_and_update():
+    """Looking up, then updating, should be the same as request()."""
+    cache = HttpCache()
+    response = make_response(ETag='"v1"')
+
+    assert cache.lookup("/a") == (None, {})
+    assert cache.update("/a", response) is response
+    assert cache.lookup("/a") == (None, {"If-None-Match": '"v1"'})
+    assert cache.update("/a", make_response(304)) is response
+    assert cache.info()[:3] == (0, 1, 1)
+
+
+def test_http_cache_entry_for_forgets_removed_responses():
+    """Responses that were replaced or evicted shouldn't have an entry any more."""
+    cache = HttpCache(maxsize=1)
+    first = make_response(ETag='"v1"')
+    second = make_response(ETag='"v2"')
+    cache.update("/a", first)
+    cache.update("/a", second)
+
+    assert cache.entry_for(first) is None
+    assert cache.entry_for(second).etag == '"v2"'
+
+    cache.update("/b", make_response(ETag='"b"'))
+    assert cache.entry_for(second) is None
+
+
+def test_http_cache_shared_by_threads():
+    """Threads using one cache at the same time should all get their responses."""
+    cache = HttpCache(maxsize=8)
+
+    def visit(i):
+        url = f"/{i % 16}"
+        response = cache.request(url, lambda headers: make_response(ETag=f'"{i}"'))
+        cache.entry_for(response)
+        return response
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(visit, range(2000)))
+
+    assert len(responses) == 2000
+    assert len(cache) == 8
+    assert sum(cache.info()[:3]) == 2000
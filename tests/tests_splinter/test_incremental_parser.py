@@ -0,0 +1,66 @@
+import lxml.html
+
+from splinter.driver.incremental_parser import IncrementalParser
+
+
+ROWS = "".join(f'<tr id="row-{i}" name="row"><td>{i}</td></tr>' for i in range(2000))
+
+HTML = f"""<!DOCTYPE html>
+<html>
+  <head><title> Report </title></head>
+  <body>
+    <div id="header"><span id="header">nested</span></div>
+    <form name="search"><input name="query" /></form>
+    <table>{ROWS}</table>
+    <p id="footer">footer</p>
+  </body>
+</html>
+""".encode()
+
+
+def get_parser(chunk_size=1024):
+    return IncrementalParser([HTML], encoding="utf-8", chunk_size=chunk_size)
+
+
+def test_incremental_parser_stops_early():
+    """Lookups at the top of the page shouldn't parse the whole body."""
+    parser = get_parser()
+
+    assert parser.find_title().text_content() == " Report "
+    assert parser.find_by_id("row-0").tag == "tr"
+    assert parser.has_name("query")
+    assert parser.has_tag("td")
+    assert not parser.complete
+
+
+def test_incremental_parser_returns_first_element_in_document_order():
+    """A completed element with an open ancestor that matches isn't the first one."""
+    parser = get_parser(chunk_size=16)
+
+    assert parser.find_by_id("header").tag == "div"
+
+
+def test_incremental_parser_missing_elements():
+    """Looking for something that isn't there parses the whole document."""
+    parser = get_parser()
+
+    assert parser.find_by_id("missing") is None
+    assert not parser.has_tag("video")
+    assert parser.complete
+
+
+def test_incremental_parser_builds_the_same_tree():
+    """finish() should give the same tree as lxml.html.fromstring()."""
+    parser = get_parser()
+    footer = parser.find_by_id("footer")
+    root = parser.finish()
+
+    assert lxml.html.tostring(root) == lxml.html.tostring(lxml.html.fromstring(HTML))
+    assert root.get_element_by_id("footer") is footer
+    assert root.forms[0].fields["query"] is None
+
+
+def test_incremental_parser_detects_fragments():
+    """Fragments can't be parsed incrementally."""
+    assert get_parser().is_full_html
+    assert not IncrementalParser([b"<p>BAR!</p>"]).is_full_html
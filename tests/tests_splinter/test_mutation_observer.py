@@ -0,0 +1,148 @@
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from splinter.driver.webdriver import mutation_observer
+from splinter.retry import WaitPolicy
+
+
+class FakeSelenium:
+    """Selenium WebDriver returning the given search results, in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.execute_async_script = mock.Mock(return_value=True)
+
+    def find_elements(self, by, value):
+        if len(self.results) > 1:
+            return self.results.pop(0)
+        return self.results[0]
+
+
+@pytest.fixture
+def get_browser(make_webdriver):
+    def get(selenium, observe_mutations=True):
+        return make_webdriver(
+            selenium,
+            wait_policy=WaitPolicy(poll_interval=0.01),
+            observe_mutations=observe_mutations,
+        )
+
+    return get
+
+
+def script_args(selenium):
+    return selenium.execute_async_script.call_args.args[1:5]
+
+
+def test_find_by_waits_with_one_script(get_browser):
+    element = mock.Mock(spec=WebElement)
+    selenium = FakeSelenium([element])
+    browser = get_browser(selenium)
+
+    result = browser.find_by_css(".item")
+
+    assert result.first._element is element
+    assert selenium.execute_async_script.call_count == 1
+    assert script_args(selenium) == (mutation_observer.PRESENT, By.CSS_SELECTOR, ".item", None)
+
+
+def test_script_checks_again_every_poll_interval(get_browser):
+    selenium = FakeSelenium([mock.Mock(spec=WebElement)])
+    get_browser(selenium).find_by_css(".item")
+
+    assert selenium.execute_async_script.call_args.args[6] == 10
+
+
+def test_search_inside_an_element_observes_the_element():
+    selenium = FakeSelenium([])
+    root = WebElement(mock.Mock(), "id")
+
+    assert mutation_observer.wait_for_elements(
+        selenium,
+        root.find_elements,
+        {"by": By.XPATH, "value": "./li"},
+        mutation_observer.PRESENT,
+        1,
+    )
+    assert script_args(selenium) == (mutation_observer.PRESENT, By.XPATH, "./li", root)
+
+
+def test_no_observer_without_wait_time_or_config(get_browser):
+    selenium = FakeSelenium([])
+    get_browser(selenium).find_by_css(".item", wait_time=0)
+    get_browser(selenium, observe_mutations=False).find_by_css(".item", wait_time=0.05)
+
+    assert selenium.execute_async_script.call_count == 0
+
+
+def test_unsupported_locators_are_polled():
+    selenium = FakeSelenium([])
+
+    assert not mutation_observer.wait_for_elements(
+        selenium,
+        selenium.find_elements,
+        {"by": By.LINK_TEXT, "value": "Home"},
+        mutation_observer.PRESENT,
+        1,
+    )
+    assert selenium.execute_async_script.call_count == 0
+
+
+def test_script_errors_fall_back_to_polling(get_browser):
+    element = mock.Mock(spec=WebElement)
+    selenium = FakeSelenium([], [], [element])
+    selenium.execute_async_script.side_effect = JavascriptException("document unloaded")
+    browser = get_browser(selenium)
+
+    assert browser.is_element_present_by_css(".item")
+
+
+def test_is_element_not_present_waits_for_absence(get_browser):
+    selenium = FakeSelenium([mock.Mock(spec=WebElement)], [])
+    browser = get_browser(selenium)
+
+    assert browser.is_element_not_present_by_name("q")
+    assert script_args(selenium) == (mutation_observer.ABSENT, By.NAME, "q", None)
+
+
+def test_is_visible_waits_for_visibility(get_browser):
+    element = mock.Mock(spec=WebElement)
+    element.is_displayed.return_value = True
+    selenium = FakeSelenium([element])
+    browser = get_browser(selenium)
+    found = browser.find_by_tag("dialog").first
+    selenium.execute_async_script.reset_mock()
+
+    assert found.is_visible()
+    assert script_args(selenium) == (mutation_observer.VISIBLE, None, None, element)
+
+    element.is_displayed.return_value = False
+    assert found.is_not_visible()
+    assert script_args(selenium) == (mutation_observer.NOT_VISIBLE, None, None, element)
+
+
+def test_is_text_present_checks_in_the_browser(get_browser):
+    selenium = FakeSelenium([])
+    selenium.execute_script = mock.Mock(return_value=True)
+    browser = get_browser(selenium, observe_mutations=False)
+
+    assert browser.is_text_present("Done", text_content=True)
+    assert selenium.execute_script.call_args.args[1:] == ("Done", True)
+
+
+def test_is_text_present_waits_for_text(get_browser):
+    selenium = FakeSelenium([])
+    selenium.execute_script = mock.Mock(return_value=False)
+    browser = get_browser(selenium)
+
+    assert browser.is_text_not_present("Loading")
+    assert script_args(selenium) == (mutation_observer.TEXT_ABSENT, "innerText", "Loading", None)
+    assert selenium.execute_script.call_count == 1
+
+    selenium.execute_script.return_value = True
+    assert browser.is_text_present("Done", text_content=True)
+    assert script_args(selenium) == (mutation_observer.TEXT_PRESENT, "textContent", "Done", None)
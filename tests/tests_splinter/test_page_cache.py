@@ -0,0 +1,72 @@
+from splinter.driver.page_cache import PageCache
+from splinter.driver.page_state import PageState
+
+
+def test_page_cache_get():
+    """A stored page should only be returned for the same url."""
+    cache = PageCache()
+    page = PageState.load(None, "http://example.com/")
+    cache.put(0, "http://example.com/", page, 10)
+
+    assert cache.get(0, "http://example.com/") is page
+    assert cache.get(0, "http://example.com/other") is None
+    assert cache.get(1, "http://example.com/") is None
+    assert cache.info()[:2] == (1, 2)
+
+
+def test_page_cache_evicts_least_recently_used():
+    """The cache should never hold more than maxsize pages."""
+    cache = PageCache(maxsize=2)
+    cache.put(0, "a", {}, 1)
+    cache.put(1, "b", {}, 1)
+    cache.get(0, "a")
+    cache.put(2, "c", {}, 1)
+
+    assert len(cache) == 2
+    assert cache.get(1, "b") is None
+    assert cache.get(0, "a") is not None
+    assert cache.info().evictions == 1
+
+
+def test_page_cache_memory_limit():
+    """The cache should never hold more than maxbytes of pages."""
+    cache = PageCache(maxbytes=100)
+    cache.put(0, "a", {}, 60)
+    cache.put(1, "b", {}, 60)
+
+    assert cache.get(0, "a") is None
+    assert cache.info().currbytes == 60
+
+    # A page bigger than the whole cache is never stored.
+    cache.put(2, "c", {}, 101)
+    assert cache.get(2, "c") is None
+    assert cache.info().evictions == 1
+
+
+def test_page_cache_replaces_history_entry():
+    """Storing a page again for an entry should replace the old one."""
+    cache = PageCache()
+    cache.put(0, "a", {}, 10)
+    cache.put(0, "b", {}, 20)
+
+    assert len(cache) == 1
+    assert cache.info().currbytes == 20
+
+
+def test_page_cache_discard_after():
+    """discard_after() should drop the forward history."""
+    cache = PageCache()
+    for index in range(4):
+        cache.put(index, str(index), {}, 1)
+    cache.discard_after(1)
+
+    assert len(cache) == 2
+    assert cache.info().currbytes == 2
+
+
+def test_page_cache_disabled():
+    """A cache with a maxsize of 0 should never store anything."""
+    cache = PageCache(maxsize=0)
+    cache.put(0, "a", {}, 1)
+
+    assert len(cache) == 0
@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from splinter.driver.page_state import DerivedValues
+from splinter.driver.page_state import PageState
+
+
+def test_derived_value_is_built_once():
+    """Threads asking for a value at the same time should all get the same one."""
+    derived = DerivedValues()
+    barrier = threading.Barrier(4)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return object()
+
+    def get(_):
+        barrier.wait()
+        return derived.get("html", build)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        values = list(pool.map(get, range(4)))
+
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+
+
+def test_peek_does_not_build():
+    derived = DerivedValues({"text": "foo"})
+
+    assert derived.peek("text") == "foo"
+    assert derived.peek("html") is None
+    assert "html" not in derived
+
+
+def test_load_starts_with_nothing_derived():
+    """Every loaded page should get its own forms and derived values."""
+    first = PageState.load(None, "http://example.com/")
+    second = PageState.load(None, "http://example.com/")
+    first.forms["login"] = object()
+    first.derived.get("text", lambda: "foo")
+
+    assert second.forms == {}
+    assert "text" not in second.derived
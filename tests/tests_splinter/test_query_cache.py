@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.html
+
+from splinter.driver.query_cache import QueryCache
+
+
+def test_query_cache_reuses_compiled_query():
+    """Compiling the same query twice should hit the cache."""
+    cache = QueryCache()
+    first = cache.get("//a", "xpath")
+    second = cache.get("//a", "xpath")
+
+    assert first is second
+    assert cache.info() == (1, 1, 512, 1)
+
+
+def test_query_cache_keyed_by_strategy():
+    """The same query with a different strategy is a different entry."""
+    cache = QueryCache()
+    cache.get("a", "css")
+    cache.get("a", "css_html")
+
+    assert cache.info().misses == 2
+    assert len(cache) == 2
+
+
+def test_query_cache_evicts_least_recently_used():
+    """The cache should never grow beyond maxsize."""
+    cache = QueryCache(maxsize=2)
+    cache.get("//a")
+    cache.get("//b")
+    cache.get("//a")
+    cache.get("//c")
+
+    assert len(cache) == 2
+    cache.get("//a")
+    assert cache.info().hits == 2
+    cache.get("//b")
+    assert cache.info().misses == 4
+
+
+def test_query_cache_clear():
+    """clear() should empty the cache and reset the counters."""
+    cache = QueryCache()
+    cache.get("//a")
+    cache.get("//a")
+    cache.clear()
+
+    assert cache.info() == (0, 0, 512, 0)
+
+
+def test_query_cache_compiled_css_matches_cssselect():
+    """Compiled css queries should find the same elements as cssselect()."""
+    tree = lxml.html.fromstring('<div><p class="a">1</p><p>2</p></div>')
+    cache = QueryCache()
+
+    assert cache.get("p.a", "css_html")(tree) == tree.cssselect("p.a")
+    assert cache.get("p.a", "css")(tree) == tree.cssselect("p.a")
+
+
+def test_query_cache_from_threads():
+    """Threads compiling the same queries should share one compiled query each."""
+    cache = QueryCache(maxsize=8)
+    queries = [f"//p[{i % 10}]" for i in range(1000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(cache.get, queries))
+
+    assert len(cache) == 8
+    assert cache.info().hits + cache.info().misses == 1000
+    assert all(results[i].path == queries[i] for i in range(1000))
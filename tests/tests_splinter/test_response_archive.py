@@ -0,0 +1,83 @@
+import io
+import zipfile
+
+import pytest
+
+from splinter.driver.response_archive import ArchivedResponse
+from splinter.driver.response_archive import body_hash
+from splinter.driver.response_archive import ResponseArchive
+from splinter.exceptions import ResponseArchiveMismatch
+
+
+def response(body, url="http://localhost/"):
+    return ArchivedResponse(url, 200, [("Content-Type", "text/html")], body)
+
+
+def test_response_archive_round_trip(tmp_path):
+    """Saved responses should be served in the order they were recorded."""
+    path = str(tmp_path / "responses.zip")
+    with ResponseArchive(path, mode="record") as archive:
+        archive.record("get", "http://localhost/", None, response(b"first"))
+        archive.record("get", "http://localhost/", None, response(b"second"))
+        archive.record("post", "http://localhost/form", {"a": "1"}, response(b"posted"))
+
+    archive = ResponseArchive(path)
+
+    assert len(archive) == 3
+    assert archive.replay("GET", "http://localhost/", None).body == b"first"
+    assert archive.replay("GET", "http://localhost/", None).body == b"second"
+    assert archive.replay("GET", "http://localhost/", None).body == b"second"
+    assert archive.replay("POST", "http://localhost/form", {"a": "1"}).headers == [("Content-Type", "text/html")]
+
+
+def test_response_archive_keeps_redirects(tmp_path):
+    """The urls a request went through should be saved with its response."""
+    path = str(tmp_path / "responses.zip")
+    redirected = ArchivedResponse("http://localhost/b", 200, [], b"b", ("http://localhost/a", "http://localhost/b"))
+    with ResponseArchive(path, mode="record") as archive:
+        archive.record("get", "http://localhost/a", None, redirected)
+        archive.record("get", "http://localhost/c", None, response(b"c"))
+
+    archive = ResponseArchive(path)
+
+    assert archive.replay("GET", "http://localhost/a", None) == redirected
+    assert archive.replay("GET", "http://localhost/c", None).history == ()
+
+
+def test_response_archive_stores_identical_bodies_once(tmp_path):
+    """The same body recorded twice should only be written once."""
+    path = str(tmp_path / "responses.zip")
+    with ResponseArchive(path, mode="record") as archive:
+        archive.record("get", "http://localhost/a", None, response(b"same"))
+        archive.record("get", "http://localhost/b", None, response(b"same"))
+
+    with zipfile.ZipFile(path) as saved:
+        assert len([name for name in saved.namelist() if name.startswith("bodies/")]) == 1
+
+
+def test_response_archive_mismatch(tmp_path):
+    """A request that wasn't recorded should raise, or be listed when not strict."""
+    path = str(tmp_path / "responses.zip")
+    with ResponseArchive(path, mode="record") as archive:
+        archive.record("post", "http://localhost/form", {"a": "1"}, response(b"posted"))
+
+    with pytest.raises(ResponseArchiveMismatch):
+        ResponseArchive(path).replay("POST", "http://localhost/form", {"a": "2"})
+
+    archive = ResponseArchive(path, strict=False)
+    assert archive.replay("GET", "http://localhost/form", None) is None
+    assert [key[:2] for key in archive.mismatches] == [("GET", "http://localhost/form")]
+
+
+def test_body_hash():
+    """Bodies should be hashed by content, whatever the order of their fields."""
+    assert body_hash({"a": "1", "b": ["2", "3"]}) == body_hash({"b": ["2", "3"], "a": "1"})
+    assert body_hash({"a": "1"}) != body_hash({"a": "2"})
+    assert body_hash({"f": io.BytesIO(b"data")}) == body_hash({"f": io.BytesIO(b"data")})
+    assert body_hash({"f": io.BytesIO(b"data")}) != body_hash({"f": io.BytesIO(b"other")})
+    assert body_hash(None) == body_hash({})
+
+
+def test_response_archive_mode():
+    with pytest.raises(ValueError):
+        ResponseArchive("responses.zip", mode="rewind")
@@ -0,0 +1,168 @@
+import itertools
+import time
+from unittest import mock
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from splinter import Config
+from splinter import retry
+from splinter.retry import _retry
+from splinter.retry import deadline
+from splinter.retry import get_wait_policy
+from splinter.retry import remaining_time
+from splinter.retry import WaitPolicy
+
+
+def test_wait_policy_intervals():
+    """Intervals should grow by backoff until max_interval."""
+    policy = WaitPolicy(poll_interval=0.1, backoff=2, max_interval=0.5)
+
+    intervals = list(itertools.islice(policy.intervals(), 5))
+
+    assert intervals == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_wait_policy_jitter():
+    """Jitter should keep intervals within the given fraction."""
+    policy = WaitPolicy(poll_interval=1, jitter=0.25)
+
+    intervals = list(itertools.islice(policy.intervals(), 100))
+
+    assert all(0.75 <= interval <= 1.25 for interval in intervals)
+    assert len(set(intervals)) > 1
+
+
+def test_wait_policy_max_attempts():
+    """No more than max_attempts attempts should be made."""
+    policy = WaitPolicy(poll_interval=0, max_attempts=3)
+
+    assert list(policy.attempts(10)) == [1, 2, 3]
+
+
+def test_wait_policy_attempts_until_timeout():
+    """Attempts should sleep between them and stop when the time is up."""
+    policy = WaitPolicy(poll_interval=0.05)
+
+    start = time.monotonic()
+    attempts = list(policy.attempts(0.2))
+    elapsed = time.monotonic() - start
+
+    assert 3 <= len(attempts) <= 6
+    assert 0.2 <= elapsed < 0.4
+
+
+def test_retry_uses_wait_policy():
+    """_retry should stop after max_attempts, without waiting for the timeout."""
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return False
+
+    start = time.monotonic()
+    result = _retry(fn, timeout=5, wait_policy=WaitPolicy(poll_interval=0.01, max_attempts=4))
+
+    assert result is False
+    assert len(calls) == 4
+    assert time.monotonic() - start < 1
+
+
+def test_retry_returns_first_truthy_result():
+    results = iter([None, 0, "found"])
+
+    assert _retry(lambda: next(results), timeout=1, wait_policy=WaitPolicy(poll_interval=0)) == "found"
+
+
+def test_get_wait_policy(monkeypatch):
+    """The first policy set wins, then the global default."""
+    per_call = WaitPolicy(poll_interval=1)
+    from_config = WaitPolicy(poll_interval=2)
+    default = WaitPolicy(poll_interval=3)
+    monkeypatch.setattr(retry, "default_wait_policy", default)
+
+    assert get_wait_policy(per_call, from_config) is per_call
+    assert get_wait_policy(None, from_config) is from_config
+    assert get_wait_policy(None, None) is default
+
+
+def test_config_wait_policy():
+    policy = WaitPolicy(max_attempts=2)
+
+    assert Config(wait_policy=policy).wait_policy is policy
+    assert Config().wait_policy is None
+
+
+def test_webdriver_waits_use_policy(make_webdriver):
+    """Webdriver waits should follow the policy of the call, then of the Config."""
+    browser = make_webdriver(wait_time=5, wait_policy=WaitPolicy(poll_interval=0, max_attempts=2))
+    browser._is_text_present = mock.Mock(return_value=False)
+
+    assert browser.is_text_present("text") is False
+    assert browser._is_text_present.call_count == 2
+
+    browser._is_text_present.reset_mock()
+    assert browser.is_text_present("text", wait_policy=WaitPolicy(poll_interval=0, max_attempts=5)) is False
+    assert browser._is_text_present.call_count == 5
+
+
+def test_webdriver_element_waits_use_policy(make_webdriver):
+    """The is_element_present_by_* methods should take a wait policy too."""
+    browser = make_webdriver(wait_time=5)
+    browser.driver.find_elements.return_value = [mock.Mock(spec=WebElement)]
+
+    policy = WaitPolicy(poll_interval=0, max_attempts=3)
+    assert browser.is_element_not_present_by_css(".item", wait_policy=policy) is False
+    assert browser.driver.find_elements.call_count == 3
+
+
+def test_remaining_time_without_deadline():
+    assert remaining_time(3) == 3
+
+
+def test_nested_deadline_keeps_the_earliest():
+    """A nested deadline can't outlast the one around it."""
+    with deadline(0.2) as outer:
+        with deadline(10) as inner:
+            assert inner == pytest.approx(outer, abs=0.01)
+            assert remaining_time(10) <= 0.2
+        with deadline(0.1) as inner:
+            assert inner < outer
+    assert remaining_time(10) == 10
+
+
+def test_nested_retry_uses_remaining_time():
+    """A _retry inside another one should stop with the outer timeout."""
+    policy = WaitPolicy(poll_interval=0.02)
+
+    def inner():
+        return _retry(lambda: False, timeout=10, wait_policy=policy)
+
+    start = time.monotonic()
+    assert _retry(inner, timeout=0.2, wait_policy=policy) is False
+    assert time.monotonic() - start < 0.5
+
+
+def test_webdriver_find_by_honors_wait_time(make_webdriver):
+    """A wait_time of 0 should search once, not wait for the default."""
+    browser = make_webdriver(wait_time=5, wait_policy=WaitPolicy(poll_interval=0.02))
+
+    start = time.monotonic()
+    assert not browser.find_by_css(".missing", wait_time=0)
+    assert time.monotonic() - start < 0.5
+    assert browser.driver.find_elements.call_count == 1
+
+
+def test_webdriver_nested_waits_share_the_deadline(make_webdriver):
+    """The searches made by is_element_present() can't outlast its wait_time."""
+    browser = make_webdriver(wait_time=5, wait_policy=WaitPolicy(poll_interval=0.02))
+
+    start = time.monotonic()
+    assert browser.is_element_present_by_css(".missing", wait_time=0.2) is False
+    assert browser.find_by_value("missing", wait_time=0.2).is_empty()
+    assert time.monotonic() - start < 1
+
+    start = time.monotonic()
+    with deadline(0.2):
+        assert not browser.find_by_css(".missing")
+    assert time.monotonic() - start < 0.5
@@ -0,0 +1,49 @@
+import io
+
+from splinter.driver.streaming import stream_elements
+
+
+ROWS = "".join(f'<tr class="row"><td>{i}</td><td>cell <b>{i}</b></td></tr>' for i in range(1000))
+
+HTML = f"""<!DOCTYPE html>
+<html>
+  <body>
+    <table>{ROWS}</table>
+    <div id="outer"><div id="inner">inner</div> outer</div>
+  </body>
+</html>
+""".encode()
+
+
+def test_stream_elements_yields_detached_records():
+    """Every matching element should be copied with its children."""
+    rows = list(stream_elements(io.BytesIO(HTML), "tr", encoding="utf-8"))
+
+    assert len(rows) == 1000
+    assert rows[5]["class"] == "row"
+    assert [cell.text for cell in rows[5].children] == ["5", "cell 5"]
+    assert rows[5].children[1].children[0].tag == "b"
+
+
+def test_stream_elements_keeps_text_after_cleared_elements():
+    """Text following a match should survive the match being cleared."""
+    html = b"<!DOCTYPE html><html><body><p><b>1</b> and <b>2</b> end</p></body></html>"
+    bolds = list(stream_elements(io.BytesIO(html), "b"))
+    paragraphs = list(stream_elements(io.BytesIO(html), "p"))
+
+    assert [b.text for b in bolds] == ["1", "2"]
+    assert paragraphs[0].text == "1 and 2 end"
+    assert paragraphs[0][0] == "p"
+
+
+def test_stream_elements_no_match():
+    """Streaming a tag that isn't in the document should yield nothing."""
+    assert list(stream_elements(io.BytesIO(HTML), "span")) == []
+
+
+def test_stream_elements_nested_matches():
+    """A match nested in another match shouldn't be cleared too early."""
+    divs = list(stream_elements(io.BytesIO(HTML), "div", encoding="utf-8"))
+
+    assert [div["id"] for div in divs] == ["inner", "outer"]
+    assert divs[1].text == "inner outer"
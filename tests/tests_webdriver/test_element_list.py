@@ -0,0 +1,24 @@
+import pytest
+
+from tests.fake_webapp import EXAMPLE_APP
+
+
+def test_element_list_visibilities_and_rects(browser):
+    """Bulk reads should give what each element gives on its own."""
+    browser.visit(EXAMPLE_APP)
+
+    elements = browser.find_by_css("#invisible, .show-invisible-element, .just-a-button")
+
+    assert elements.visibilities() == [element.visible for element in elements]
+    assert elements.rects() == [pytest.approx(element.rect) for element in elements]
+    assert elements.texts() == [element.text for element in elements]
+
+
+def test_element_list_texts_are_normalized(browser):
+    """Bulk read texts should have their whitespace normalized like element.text."""
+    browser.visit(EXAMPLE_APP)
+
+    elements = browser.find_by_css("#nbsp_text, #text_with_html, a[href='http://localhost:5000/foo']")
+
+    assert elements.texts() == [element.text for element in elements]
+    assert elements.texts()[0] == "Non breaking spaces"
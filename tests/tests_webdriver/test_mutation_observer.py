@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from tests.fake_webapp import EXAMPLE_APP
+
+from splinter.config import Config
+
+
+@pytest.fixture(scope="session")
+def browser_config():
+    return Config(headless=True, observe_mutations=True)
+
+
+def test_wait_for_element_present(browser):
+    browser.visit(EXAMPLE_APP)
+
+    browser.find_by_css(".add-async-element").click()
+    assert browser.is_element_present_by_css(".async-element", wait_time=10)
+    assert len(browser.find_by_css(".async-element", wait_time=10)) == 1
+
+
+def test_wait_for_element_not_present(browser):
+    browser.visit(EXAMPLE_APP)
+
+    browser.find_by_css(".add-async-element").click()
+    assert browser.is_element_present_by_css(".async-element2", wait_time=10)
+
+    browser.find_by_css(".remove-async-element").click()
+    assert browser.is_element_not_present_by_css(".async-element", wait_time=10)
+    assert browser.is_element_not_present_by_css(".async-element2", wait_time=10)
+
+
+def test_wait_for_element_present_times_out(browser):
+    browser.visit(EXAMPLE_APP)
+
+    assert not browser.is_element_present_by_css(".async-element", wait_time=1)
+
+
+def test_wait_for_element_visible(browser):
+    browser.visit(EXAMPLE_APP)
+
+    browser.find_by_css(".show-invisible-element").click()
+    assert browser.find_by_css("#invisible").is_visible(wait_time=10)
+
+
+def test_wait_for_element_not_visible(browser):
+    browser.visit(EXAMPLE_APP)
+
+    assert browser.find_by_css("#invisible").is_not_visible(wait_time=10)
+    assert not browser.find_by_css("#invisible").is_visible(wait_time=1)
+
+
+def test_wait_for_removed_element_not_visible(browser):
+    """A removed element isn't visible, whether or not the DOM changes again."""
+    browser.visit(EXAMPLE_APP)
+
+    assert browser.find_by_css("#removed_after_5_seconds").is_not_visible(wait_time=10)
+
+
+def test_wait_for_visibility_without_dom_mutation(browser):
+    """A change that isn't a DOM mutation is seen without waiting the full wait_time."""
+    browser.visit(EXAMPLE_APP)
+    browser.execute_script(
+        """
+        var style = document.createElement('style');
+        document.head.appendChild(style);
+        setTimeout(function () {
+            style.sheet.insertRule('#invisible { display: block !important; }');
+        }, 500);
+        """,
+    )
+
+    start = time.time()
+    assert browser.find_by_css("#invisible").is_visible(wait_time=20)
+    assert time.time() - start < 10
+
+
+def test_wait_for_text_present(browser):
+    browser.visit(EXAMPLE_APP)
+
+    browser.find_by_css(".add-async-element").click()
+    assert browser.is_text_present("async elment", wait_time=10)
+
+
+def test_wait_for_text_not_present(browser):
+    browser.visit(EXAMPLE_APP)
+
+    browser.find_by_css(".add-async-element").click()
+    assert browser.is_text_present("async elment2", wait_time=10)
+
+    browser.find_by_css(".remove-async-element").click()
+    assert browser.is_text_not_present("async elment", wait_time=10)